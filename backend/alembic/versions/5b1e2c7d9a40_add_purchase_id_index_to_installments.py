@@ -0,0 +1,39 @@
+"""add purchase_id index to installments
+
+Revision ID: 5b1e2c7d9a40
+Revises: 94fb0bded428
+Create Date: 2026-10-17 10:12:41.503218
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5b1e2c7d9a40"
+down_revision: Union[str, Sequence[str], None] = "94fb0bded428"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema - Index installments.purchase_id.
+
+    Installments are looked up (and cascade-deleted) by purchase on every
+    purchase/installment delete and update, and listed in installment order.
+    budget_expenses already has idx_budget_expenses_purchase and
+    idx_budget_expenses_installment.
+    """
+    op.create_index(
+        "ix_installments_purchase_number",
+        "installments",
+        ["purchase_id", "installment_number"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_installments_purchase_number", table_name="installments")
@@ -0,0 +1,50 @@
+"""add list ordering indexes
+
+Revision ID: 7d2b5e9c4a13
+Revises: c4a8e2d6f190
+Create Date: 2026-10-17 15:02:38.114930
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "7d2b5e9c4a13"
+down_revision: Union[str, Sequence[str], None] = "c4a8e2d6f190"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema - Index list queries in the order they are returned.
+
+    Purchases are listed by user and by payment method most recent first
+    and statements by credit card in due date order. Installments already
+    have ix_installments_purchase_number.
+    """
+    op.create_index(
+        "ix_purchases_user_date",
+        "purchases",
+        ["user_id", sa.text("purchase_date DESC")],
+    )
+    op.create_index(
+        "ix_purchases_payment_method_date",
+        "purchases",
+        ["payment_method_id", sa.text("purchase_date DESC")],
+    )
+    op.create_index(
+        "ix_monthly_statements_credit_card_due_date",
+        "monthly_statements",
+        ["credit_card_id", "due_date"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_monthly_statements_credit_card_due_date", table_name="monthly_statements")
+    op.drop_index("ix_purchases_payment_method_date", table_name="purchases")
+    op.drop_index("ix_purchases_user_date", table_name="purchases")
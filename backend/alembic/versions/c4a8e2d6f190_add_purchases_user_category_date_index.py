@@ -0,0 +1,36 @@
+"""add purchases user category date index
+
+Revision ID: c4a8e2d6f190
+Revises: 5b1e2c7d9a40
+Create Date: 2026-10-17 14:31:47.902615
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c4a8e2d6f190"
+down_revision: Union[str, Sequence[str], None] = "5b1e2c7d9a40"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema - Index purchases by user, category and date.
+
+    Purchases of a category are listed per user, most recent first.
+    """
+    op.create_index(
+        "ix_purchases_user_category_date",
+        "purchases",
+        ["user_id", "category_id", sa.text("purchase_date DESC")],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_purchases_user_category_date", table_name="purchases")
@@ -0,0 +1,38 @@
+"""add monthly statement row version
+
+Revision ID: e3f1a7c9b254
+Revises: 7d2b5e9c4a13
+Create Date: 2026-10-17 16:41:09.527318
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e3f1a7c9b254"
+down_revision: Union[str, Sequence[str], None] = "7d2b5e9c4a13"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema - Version statement rows for optimistic locking.
+
+    Statement date updates only write a row whose row_version still matches
+    the one that was read, so concurrent edits are detected instead of lost.
+    Existing rows start at version 1.
+    """
+    with op.batch_alter_table("monthly_statements") as batch_op:
+        batch_op.add_column(
+            sa.Column("row_version", sa.Integer(), nullable=False, server_default="1")
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("monthly_statements") as batch_op:
+        batch_op.drop_column("row_version")
@@ -36,7 +36,7 @@ class CreateStatementInputDTO:
     due_date: date
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PurchaseInStatementDTO:
     """DTO for purchase information in statement detail."""
 
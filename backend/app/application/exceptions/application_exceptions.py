@@ -76,3 +76,8 @@ class BudgetNotFoundError(ApplicationError):
 class BudgetExpenseNotFoundError(ApplicationError):
     def __init__(self, *args):
         super().__init__(*args)
+
+
+class ConcurrentUpdateError(ApplicationError):
+    def __init__(self, *args):
+        super().__init__(*args)
@@ -1,6 +1,14 @@
+from typing import Iterable, List
+
+from pydantic import TypeAdapter
+
 from app.domain.entities.bank_account import BankAccount
 from app.application.dtos.bank_account_dto import BankAccountResponseDTO
 
+# The list validator is built once, so a batch is validated straight from the
+# entities' attributes without a Python call per item
+_response_dto_list = TypeAdapter(List[BankAccountResponseDTO])
+
 
 class BankAccountDTOMapper:
     """Maps between BankAccount entity and DTOs"""
@@ -18,4 +26,9 @@ class BankAccountDTOMapper:
             account_type=bank_account.account_type,
             last_four_digits=bank_account.last_four_digits,
             currency=bank_account.currency,
-        )
\ No newline at end of file
+        )
+
+    @staticmethod
+    def to_response_dto_many(bank_accounts: Iterable[BankAccount]) -> List[BankAccountResponseDTO]:
+        """Convert domain entities to response DTOs"""
+        return _response_dto_list.validate_python(bank_accounts, from_attributes=True)
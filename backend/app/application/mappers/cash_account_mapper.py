@@ -1,6 +1,12 @@
+from typing import Iterable, List
+
+from pydantic import TypeAdapter
+
 from app.domain.entities.cash_account import CashAccount
 from app.application.dtos.cash_account_dto import CashAccountResponseDTO
 
+_response_dto_list = TypeAdapter(List[CashAccountResponseDTO])
+
 
 class CashAccountDTOMapper:
     """Maps between CashAccount entity and DTOs"""
@@ -14,4 +20,9 @@ class CashAccountDTOMapper:
             user_id=cash_account.user_id,
             name=cash_account.name,
             currency=cash_account.currency,
-        )
\ No newline at end of file
+        )
+
+    @staticmethod
+    def to_response_dto_many(cash_accounts: Iterable[CashAccount]) -> List[CashAccountResponseDTO]:
+        """Convert domain entities to response DTOs"""
+        return _response_dto_list.validate_python(cash_accounts, from_attributes=True)
@@ -1,3 +1,5 @@
+from typing import Iterable, List, Tuple
+
 from app.domain.entities.monthly_budget import MonthlyBudget
 from app.application.dtos.monthly_budget_dto import MonthlyBudgetResponseDTO
 
@@ -17,4 +19,14 @@ class MonthlyBudgetDTOMapper:
             participant_count=participant_count,
             created_at=budget.created_at,
             updated_at=budget.updated_at,
-        )
\ No newline at end of file
+        )
+
+    @staticmethod
+    def to_response_dto_many(
+        budgets_with_counts: Iterable[Tuple[MonthlyBudget, int]]
+    ) -> List[MonthlyBudgetResponseDTO]:
+        """Convert (budget, participant count) pairs to response DTOs"""
+        return [
+            MonthlyBudgetDTOMapper.to_response_dto(budget, participant_count)
+            for budget, participant_count in budgets_with_counts
+        ]
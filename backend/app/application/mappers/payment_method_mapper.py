@@ -1,6 +1,12 @@
+from typing import Iterable, List
+
+from pydantic import TypeAdapter
+
 from app.domain.entities.payment_method import PaymentMethod
 from app.application.dtos.payment_method_dto import PaymentMethodResponseDTO
 
+_response_dto_list = TypeAdapter(List[PaymentMethodResponseDTO])
+
 
 class PaymentMethodDTOMapper:
     """Maps between PaymentMethod entity and DTOs"""
@@ -16,4 +22,9 @@ class PaymentMethodDTOMapper:
             is_active=payment_method.is_active,
             created_at=payment_method.created_at,
             updated_at=payment_method.updated_at,
-        )
\ No newline at end of file
+        )
+
+    @staticmethod
+    def to_response_dto_many(payment_methods: Iterable[PaymentMethod]) -> List[PaymentMethodResponseDTO]:
+        """Convert domain entities to response DTOs"""
+        return _response_dto_list.validate_python(payment_methods, from_attributes=True)
@@ -40,7 +40,7 @@ class PurchaseDTOMapper:
             installments_count=purchase.installments_count,
             original_amount=original_amount,
             original_currency=original_currency,
-            exchange_rate_id=None,  # Will be populated from model if needed
+            exchange_rate_id=purchase.exchange_rate_id,
         )
 
 
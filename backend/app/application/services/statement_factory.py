@@ -1,6 +1,7 @@
 """Helper for automatic statement creation."""
 
 from datetime import timedelta
+from operator import attrgetter
 
 from app.domain.entities.credit_card import CreditCard
 from app.domain.entities.monthly_statement import MonthlyStatement
@@ -49,7 +50,7 @@ class StatementFactory:
         # Calculate start_date based on previous statement or estimate
 
         # Sort statements by closing date to find the most recent one before this
-        sorted_statements = sorted(existing_statements, key=lambda s: s.closing_date)
+        sorted_statements = sorted(existing_statements, key=attrgetter("closing_date"))
 
         # Find previous statement (last one that closed before this one)
         previous_statement = None
@@ -0,0 +1,48 @@
+"""Small in-process cache for read-mostly lookups."""
+
+import threading
+import time
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """Thread-safe cache whose entries expire after a per-entry time to live.
+
+    Request handlers run in a thread pool, so every access goes through a lock.
+    Only found values are meant to be stored: ``get`` returns None on a miss.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        self._max_entries = max_entries
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for key, or None if it is missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._entries[key]
+                return None
+            return entry[1]
+
+    def set(self, key: Hashable, value: Any, ttl_seconds: float) -> None:
+        """Store value under key for ttl_seconds, evicting the oldest entry when full"""
+        with self._lock:
+            if key not in self._entries and len(self._entries) >= self._max_entries:
+                self._entries.pop(next(iter(self._entries)))
+            self._entries[key] = (time.monotonic() + ttl_seconds, value)
+
+    def clear(self) -> None:
+        """Drop every cached entry (call after the cached data changes)"""
+        with self._lock:
+            self._entries.clear()
+
+
+# Latest exchange rate lookups, shared by the use cases that read and change rates
+latest_exchange_rate_cache = TTLCache(max_entries=4096)
+
+# The full category list, shared by the use cases that list and create categories
+categories_cache = TTLCache(max_entries=1)
@@ -14,6 +14,9 @@ from app.application.exceptions.application_exceptions import (
     BudgetNotFoundError,
 )
 
+# Stateless domain service, shared by every use case instance
+_RESPONSIBILITY_CALCULATOR = ResponsibilityCalculator()
+
 
 class AddExpenseToBudgetCommand(BaseModel):
     """Command to add an expense to a budget"""
@@ -38,7 +41,7 @@ class AddExpenseToBudgetUseCase:
     def __init__(self, uow: IUnitOfWork):
         self._uow = uow
         self._snapshot_service = BudgetExpenseSnapshotService()
-        self._responsibility_calculator = ResponsibilityCalculator()
+        self._responsibility_calculator = _RESPONSIBILITY_CALCULATOR
 
     def execute(self, command: AddExpenseToBudgetCommand) -> AddExpenseToBudgetResult:
         """
@@ -133,12 +136,11 @@ class AddExpenseToBudgetUseCase:
                         )
 
             # 5. Validate split type
-            try:
-                split_type = SplitType(command.split_type)
-            except ValueError:
+            split_type = SplitType.from_value(command.split_type)
+            if split_type is None:
                 raise BusinessRuleViolationError(
                     f"Invalid split_type: {command.split_type}. "
-                    f"Must be one of: {', '.join([st.value for st in SplitType])}"
+                    f"Must be one of: {SplitType.values_display()}"
                 )
 
             # 6. Validate full_single has responsible_user_id
@@ -147,20 +149,16 @@ class AddExpenseToBudgetUseCase:
                     "responsible_user_id is required for split_type 'full_single'"
                 )
 
-            # 7. Get all participants for responsibility calculation
-            participants = self._uow.budget_participants.find_by_budget_id(command.budget_id)
-            participant_user_ids = [p.user_id for p in participants]
-            
-            # Get User entities for participants
-            participant_users = []
-            for user_id in participant_user_ids:
-                user = self._uow.users.find_by_id(user_id)
-                if user:
-                    participant_users.append(user)
+            # 7. Get all participants and their users for responsibility calculation
+            participant_users = [
+                user
+                for _, user in self._uow.budget_participants.find_by_budget_id_with_users(command.budget_id)
+            ]
+            participant_user_id_set = frozenset(user.id for user in participant_users)
 
             # 8. Validate full_single responsible user is a participant
             if split_type == SplitType.FULL_SINGLE:
-                if command.responsible_user_id not in participant_user_ids:
+                if command.responsible_user_id not in participant_user_id_set:
                     raise BusinessRuleViolationError(
                         f"User {command.responsible_user_id} is not a participant of budget {command.budget_id}"
                     )
@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 
+from app.application.services.ttl_cache import TTLCache, categories_cache
 from app.domain.entities.category import Category
 from app.domain.repositories.iunit_of_work import IUnitOfWork
 
@@ -20,8 +21,9 @@ class CreateCategoryUseCase:
     Categories are simple entities used to classify purchases.
     """
 
-    def __init__(self, unit_of_work: IUnitOfWork):
+    def __init__(self, unit_of_work: IUnitOfWork, cache: TTLCache = categories_cache):
         self.unit_of_work = unit_of_work
+        self.cache = cache
 
     def execute(self, command: CreateCategoryCommand) -> Category:
         """
@@ -40,5 +42,6 @@ class CreateCategoryUseCase:
 
             saved_category = uow.categories.save(category)
             uow.commit()
+            self.cache.clear()
 
             return saved_category
@@ -3,6 +3,7 @@ from datetime import date, datetime
 from decimal import Decimal
 from typing import Optional
 
+from app.application.services.ttl_cache import TTLCache, latest_exchange_rate_cache
 from app.domain.entities.exchange_rate import ExchangeRate
 from app.domain.repositories.iunit_of_work import IUnitOfWork
 from app.domain.value_objects.exchange_rate_type import ExchangeRateType
@@ -31,8 +32,9 @@ class CreateExchangeRateResult:
 
 
 class CreateExchangeRateUseCase:
-    def __init__(self, unit_of_work: IUnitOfWork):
+    def __init__(self, unit_of_work: IUnitOfWork, rate_cache: TTLCache = latest_exchange_rate_cache):
         self.unit_of_work = unit_of_work
+        self.rate_cache = rate_cache
 
     def execute(self, command: CreateExchangeRateCommand) -> CreateExchangeRateResult:
         """
@@ -91,5 +93,6 @@ class CreateExchangeRateUseCase:
 
             # Commit transaction
             uow.commit()
+            self.rate_cache.clear()
 
             return CreateExchangeRateResult(exchange_rate_id=saved_rate.id)
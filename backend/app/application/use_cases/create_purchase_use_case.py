@@ -20,10 +20,14 @@ from app.domain.repositories.iunit_of_work import IUnitOfWork
 from app.application.services.statement_factory import StatementFactory
 from app.domain.services.payment_method_validator import PaymentMethodValidator
 from app.domain.value_objects.payment_method_type import PaymentMethodType
-from app.infrastructure.persistence.mappers.purchase_mapper import PurchaseMapper
+from app.infrastructure.persistence.models.installment_model import InstallmentModel
 
+# Rate used when auto-converting to the card currency and no exchange rate is found
+FALLBACK_EXCHANGE_RATE = Decimal("1500.00")
+DEFAULT_AUTO_CONVERT_RATE_TYPE = ExchangeRateType.MEP
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class CreatePurchaseCommand:
     """Command to create a new purchase"""
 
@@ -83,15 +87,23 @@ class CreatePurchaseUseCase:
                 raise PaymentMethodOwnershipError(
                     f"Payment method {command.payment_method_id} does not belong to user {command.user_id}"
                 )
-            if not PaymentMethodValidator.validate_installments(
+            if command.installments_count != 1 and not PaymentMethodValidator.validate_installments(
                 paymethod, command.installments_count
             ):
                 raise PaymentMethodInstallmentError(
                     "Only credit card payment methods can have multiple installments"
                 )
+            # Validate category exists before locking the credit card, so the
+            # lock is held only for the writes that need it
+            category = uow.categories.find_by_id(command.category_id)
+            if not category:
+                raise ValueError(f"Category with ID {command.category_id} not found")
+
             if paymethod.type == PaymentMethodType.CREDIT_CARD:
+                # Lock the card row so concurrent purchases on the same card
+                # serialize around statement get-or-create
                 credit_card = uow.credit_cards.find_by_payment_method_id(
-                    command.payment_method_id
+                    command.payment_method_id, lock=True
                 )
                 if not credit_card:
                     raise CreditCardNotFoundError(
@@ -109,11 +121,6 @@ class CreatePurchaseUseCase:
                         f"User {command.user_id} does not have access to bank account with payment method ID {command.payment_method_id}"
                     )
 
-            # Validate category exists
-            category = uow.categories.find_by_id(command.category_id)
-            if not category:
-                raise ValueError(f"Category with ID {command.category_id} not found")
-
             # Determine card currency for auto-conversion
             purchase_currency = Currency(command.currency)
             card_currency = None
@@ -124,6 +131,7 @@ class CreatePurchaseUseCase:
 
             # Build DualMoney for the purchase
             exchange_rate_entity = None
+            rate_finder = ExchangeRateFinder(uow.exchange_rates)
             
             # Auto-convert if purchase currency differs from card currency
             should_auto_convert = (
@@ -134,12 +142,11 @@ class CreatePurchaseUseCase:
             
             if should_auto_convert:
                 # Purchase in foreign currency, auto-convert to card currency
-                preferred_rate_type = ExchangeRateType.MEP  # Default to MEP
+                preferred_rate_type = DEFAULT_AUTO_CONVERT_RATE_TYPE
                 if command.rate_type:
                     preferred_rate_type = ExchangeRateType(command.rate_type)
                 
                 # Try to find existing exchange rate
-                rate_finder = ExchangeRateFinder(uow.exchange_rates)
                 exchange_rate_entity = rate_finder.find_exchange_rate(
                     date=command.purchase_date,
                     from_currency=purchase_currency,
@@ -148,8 +155,8 @@ class CreatePurchaseUseCase:
                     user_id=command.user_id,
                 )
                 
-                # Use found rate or fallback to 1500
-                rate_value = exchange_rate_entity.rate if exchange_rate_entity else Decimal("1500.00")
+                # Use found rate or fallback
+                rate_value = exchange_rate_entity.rate if exchange_rate_entity else FALLBACK_EXCHANGE_RATE
                 
                 # Calculate converted amount (from purchase currency to card currency)
                 converted_amount = command.total_amount * rate_value
@@ -165,7 +172,6 @@ class CreatePurchaseUseCase:
             elif command.original_amount is not None and command.original_currency is not None:
                 # Dual-currency purchase
                 original_curr = Currency(command.original_currency)
-                total_curr = Currency(command.currency)
                 
                 # Try to use provided exchange_rate_id first
                 if command.exchange_rate_id:
@@ -179,7 +185,6 @@ class CreatePurchaseUseCase:
                         preferred_rate_type = ExchangeRateType(command.rate_type)
                     
                     # Try to find existing exchange rate
-                    rate_finder = ExchangeRateFinder(uow.exchange_rates)
                     exchange_rate_entity = rate_finder.find_exchange_rate(
                         date=command.purchase_date,
                         from_currency=Currency.USD,  # Assuming always USD -> ARS
@@ -189,14 +194,14 @@ class CreatePurchaseUseCase:
                     )
                     
                     # If no exchange rate found and currencies are different, create inferred rate
-                    if not exchange_rate_entity and original_curr != total_curr:
+                    if not exchange_rate_entity and original_curr != purchase_currency:
                         calculator = InferredExchangeRateCalculator()
                         exchange_rate_entity = calculator.create_inferred_rate_entity(
                             purchase_date=command.purchase_date,
                             original_amount=command.original_amount,
                             original_currency=original_curr,
                             converted_amount=command.total_amount,
-                            converted_currency=total_curr,
+                            converted_currency=purchase_currency,
                             user_id=command.user_id,
                         )
                         # Save the inferred exchange rate
@@ -204,7 +209,7 @@ class CreatePurchaseUseCase:
                 
                 total_amount = DualMoney(
                     primary_amount=command.total_amount,
-                    primary_currency=total_curr,
+                    primary_currency=purchase_currency,
                     secondary_amount=command.original_amount,
                     secondary_currency=original_curr,
                     exchange_rate=exchange_rate_entity.rate if exchange_rate_entity else None,
@@ -213,7 +218,7 @@ class CreatePurchaseUseCase:
                 # Single-currency purchase
                 total_amount = DualMoney(
                     primary_amount=command.total_amount,
-                    primary_currency=Currency(command.currency),
+                    primary_currency=purchase_currency,
                 )
 
             # Create purchase entity
@@ -226,22 +231,11 @@ class CreatePurchaseUseCase:
                 description=command.description,
                 total_amount=total_amount,
                 installments_count=command.installments_count,
+                exchange_rate_id=exchange_rate_entity.id if exchange_rate_entity else None,
             )
 
             # Save purchase
             saved_purchase = uow.purchases.save(purchase)
-            
-            # Update exchange_rate_id if applicable (must be done after save to have purchase.id)
-            if exchange_rate_entity:
-                from app.infrastructure.persistence.models.purchase_model import PurchaseModel
-                purchase_model = uow.session.get(PurchaseModel, saved_purchase.id)
-                if purchase_model:
-                    purchase_model.exchange_rate_id = exchange_rate_entity.id
-                    uow.session.flush()
-                    
-                    # Re-fetch purchase to get updated entity with exchange_rate_id
-                    uow.session.refresh(purchase_model)
-                    saved_purchase = PurchaseMapper.to_entity(purchase_model)
 
             if paymethod.type == PaymentMethodType.CREDIT_CARD:
                 # Generate installments
@@ -258,7 +252,6 @@ class CreatePurchaseUseCase:
                 
                 # Update exchange_rate_id for all installments if applicable
                 if exchange_rate_entity:
-                    from app.infrastructure.persistence.models.installment_model import InstallmentModel
                     # Get all saved installment IDs and update them
                     for installment in saved_installments:
                         if installment.id:  # Should have ID after save
@@ -8,7 +8,7 @@ from app.application.exceptions.application_exceptions import (
 from app.domain.repositories.iunit_of_work import IUnitOfWork
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DeleteInstallmentCommand:
     """Command to delete an installment"""
 
@@ -53,8 +53,7 @@ class DeleteInstallmentUseCase:
                 raise PurchaseNotFoundError(f"Installment {command.installment_id} does not belong to user {command.user_id}")
 
             # Check business rule: cannot delete last installment
-            all_installments = self._uow.installments.find_by_purchase_id(purchase.id)
-            if len(all_installments) <= 1:
+            if self._uow.installments.count_by_purchase_id(purchase.id) <= 1:
                 raise BusinessRuleViolationError("Cannot delete the last remaining installment of a purchase")
 
             # Delete associated budget expenses first (FK constraint)
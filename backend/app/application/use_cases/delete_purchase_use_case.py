@@ -19,8 +19,8 @@ class DeletePurchaseUseCase:
             ValueError: If purchase doesn't exist or doesn't belong to user
         """
         with self._uow:
-            purchase = self._uow.purchases.find_by_id(purchase_id)
-            if purchase is None or purchase.user_id != user_id:
+            purchase = self._uow.purchases.find_by_id_and_user(purchase_id, user_id)
+            if purchase is None:
                 raise ValueError(
                     f"Purchase with ID {purchase_id} not found for user {user_id}"
                 )
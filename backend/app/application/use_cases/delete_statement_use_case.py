@@ -7,7 +7,7 @@ from app.application.exceptions.application_exceptions import (
 from app.domain.repositories.iunit_of_work import IUnitOfWork
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DeleteStatementCommand:
     """Command to delete a monthly statement"""
 
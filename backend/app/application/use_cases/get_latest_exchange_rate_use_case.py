@@ -2,11 +2,18 @@ from dataclasses import dataclass
 from datetime import date
 from typing import Optional
 
+from app.application.services.ttl_cache import TTLCache, latest_exchange_rate_cache
 from app.domain.entities.exchange_rate import ExchangeRate
 from app.domain.repositories.iunit_of_work import IUnitOfWork
 from app.domain.value_objects.exchange_rate_type import ExchangeRateType
 from app.domain.value_objects.money import Currency
 
+# Latest-rate lookups are cached per (from, to, type, date, user) in this process.
+# Rates for today can still be loaded during the day, so they expire quickly;
+# past dates only change when a rate is backfilled
+CURRENT_RATE_CACHE_TTL_SECONDS = 60
+PAST_RATE_CACHE_TTL_SECONDS = 3600
+
 
 @dataclass(frozen=True)
 class GetLatestExchangeRateQuery:
@@ -27,8 +34,9 @@ class GetLatestExchangeRateResult:
 
 
 class GetLatestExchangeRateUseCase:
-    def __init__(self, unit_of_work: IUnitOfWork):
+    def __init__(self, unit_of_work: IUnitOfWork, rate_cache: TTLCache = latest_exchange_rate_cache):
         self.unit_of_work = unit_of_work
+        self.rate_cache = rate_cache
 
     def execute(self, query: GetLatestExchangeRateQuery) -> GetLatestExchangeRateResult:
         """
@@ -40,21 +48,36 @@ class GetLatestExchangeRateUseCase:
         Returns:
             GetLatestExchangeRateResult: The result containing the latest exchange rate
         """
-        with self.unit_of_work as uow:
-            from_currency = Currency(query.from_currency)
-            to_currency = Currency(query.to_currency)
-            rate_type = ExchangeRateType(query.rate_type)
+        from_currency = Currency(query.from_currency)
+        to_currency = Currency(query.to_currency)
+        rate_type = ExchangeRateType(query.rate_type)
+
+        # Use reference_date or today
+        today = date.today()
+        ref_date = query.reference_date or today
+        user_id = query.user_id if rate_type == ExchangeRateType.CUSTOM else None
 
-            # Use reference_date or today
-            ref_date = query.reference_date or date.today()
+        # Inferred rates are created per purchase, so they are never cached
+        cacheable = rate_type != ExchangeRateType.INFERRED
+        key = (from_currency, to_currency, rate_type, ref_date, user_id)
+        if cacheable:
+            cached = self.rate_cache.get(key)
+            if cached is not None:
+                return GetLatestExchangeRateResult(exchange_rate=cached)
 
+        with self.unit_of_work as uow:
             # Find closest rate on or before reference date
             exchange_rate = uow.exchange_rates.find_closest_by_date_and_type(
                 date=ref_date,
                 from_currency=from_currency,
                 to_currency=to_currency,
                 rate_type=rate_type,
-                user_id=query.user_id if rate_type == ExchangeRateType.CUSTOM else None,
+                user_id=user_id,
             )
 
-            return GetLatestExchangeRateResult(exchange_rate=exchange_rate)
+        # Misses are not cached, so a rate created meanwhile is found on the next lookup
+        if cacheable and exchange_rate is not None:
+            ttl = PAST_RATE_CACHE_TTL_SECONDS if ref_date < today else CURRENT_RATE_CACHE_TTL_SECONDS
+            self.rate_cache.set(key, exchange_rate, ttl)
+
+        return GetLatestExchangeRateResult(exchange_rate=exchange_rate)
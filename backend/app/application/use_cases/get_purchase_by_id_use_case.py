@@ -34,10 +34,5 @@ class GetPurchaseByIdUseCase:
             Purchase entity if found and belongs to user, None otherwise
         """
         with self.unit_of_work as uow:
-            purchase = uow.purchases.find_by_id(query.purchase_id)
-
-            # Verify purchase exists and belongs to user
-            if purchase and purchase.user_id == query.user_id:
-                return purchase
-
-            return None
+            # Only a purchase that belongs to the user is returned
+            return uow.purchases.find_by_id_and_user(query.purchase_id, query.user_id)
@@ -7,6 +7,7 @@ from app.domain.entities.purchase import Purchase
 from app.domain.entities.exchange_rate import ExchangeRate
 from app.domain.repositories.iunit_of_work import IUnitOfWork
 from app.domain.services.currency_converter import CurrencyConverter
+from app.domain.services.exchange_rate_finder import ExchangeRateFinder
 from app.domain.value_objects.exchange_rate_type import ExchangeRateType
 from app.domain.value_objects.money import Currency
 
@@ -55,19 +56,10 @@ class GetPurchasesInCurrencyUseCase:
             GetPurchasesInCurrencyResult: Purchases with converted amounts
         """
         with self.unit_of_work as uow:
-            # Load purchases
-            all_purchases = uow.purchases.find_by_user_id(query.user_id)
-
-            # Filter by date range if specified
-            if query.start_date or query.end_date:
-                filtered_purchases = []
-                for purchase in all_purchases:
-                    if query.start_date and purchase.purchase_date < query.start_date:
-                        continue
-                    if query.end_date and purchase.purchase_date > query.end_date:
-                        continue
-                    filtered_purchases.append(purchase)
-                all_purchases = filtered_purchases
+            # Load purchases, filtered by date range if specified
+            all_purchases = uow.purchases.find_by_user_and_date_range(
+                query.user_id, query.start_date, query.end_date
+            )
 
             target_currency = Currency(query.target_currency)
             preferred_rate_type = (
@@ -76,24 +68,25 @@ class GetPurchasesInCurrencyUseCase:
                 else None
             )
 
-            # Create currency converter
-            converter = CurrencyConverter(uow.exchange_rates)
+            # Create currency converter (caches rates, so purchases sharing a
+            # date and currency resolve their exchange rate only once)
+            converter = CurrencyConverter(ExchangeRateFinder(uow.exchange_rates))
 
             # Convert each purchase
             results = []
             for purchase in all_purchases:
-                # Try to get amount in target currency
-                try:
-                    amount_in_target = purchase.get_amount_in_currency(target_currency)
+                if purchase.has_currency(target_currency):
                     # Already in target currency, no conversion needed
                     results.append(
                         PurchaseInCurrency(
                             purchase=purchase,
-                            amount_in_target_currency=amount_in_target,
+                            amount_in_target_currency=purchase.get_amount_in_currency(
+                                target_currency
+                            ),
                             exchange_rate_used=None,
                         )
                     )
-                except:
+                else:
                     # Need conversion
                     source_currency = purchase.total_amount.primary_currency
                     converted_amount, exchange_rate = converter.convert(
@@ -101,7 +94,7 @@ class GetPurchasesInCurrencyUseCase:
                         from_currency=source_currency,
                         to_currency=target_currency,
                         reference_date=purchase.purchase_date,
-                        preferred_type=preferred_rate_type,
+                        preferred_rate_type=preferred_rate_type,
                         user_id=query.user_id,
                     )
 
@@ -4,14 +4,16 @@ from app.application.dtos.monthly_statement_dto import (
     PurchaseInStatementDTO,
     StatementDetailDTO,
 )
+from app.domain.entities.installment import Installment
 from app.domain.entities.purchase import Purchase
-from app.domain.repositories.icategory_repository import ICategoryRepository
-from app.domain.repositories.icredit_card_repository import ICreditCardRepository
-from app.domain.repositories.iinstallment_repository import IInstallmentRepository
 from app.domain.repositories.imonthly_statement_repository import (
     IMonthlyStatementRepository,
 )
 from app.domain.repositories.ipurchase_repository import IPurchaseRepository
+from app.domain.value_objects.money import Currency
+
+# Plain currency codes for the DTOs, resolved once instead of Enum.value per row
+CURRENCY_CODES = {currency: currency.value for currency in Currency}
 
 
 class GetStatementDetailUseCase:
@@ -20,25 +22,16 @@ class GetStatementDetailUseCase:
     def __init__(
         self,
         statement_repository: IMonthlyStatementRepository,
-        credit_card_repository: ICreditCardRepository,
         purchase_repository: IPurchaseRepository,
-        category_repository: ICategoryRepository,
-        installment_repository: IInstallmentRepository,
     ):
         """Initialize the use case.
 
         Args:
             statement_repository: Repository for monthly statements
-            credit_card_repository: Repository for credit cards
             purchase_repository: Repository for purchases
-            category_repository: Repository for categories
-            installment_repository: Repository for installments
         """
         self._statement_repo = statement_repository
-        self._credit_card_repo = credit_card_repository
         self._purchase_repo = purchase_repository
-        self._category_repo = category_repository
-        self._installment_repo = installment_repository
 
     def execute(self, statement_id: int, user_id: int) -> StatementDetailDTO | None:
         """Get statement detail with all installments that fall in this period.
@@ -50,50 +43,46 @@ class GetStatementDetailUseCase:
         Returns:
             Statement detail with purchases/installments, or None if not found or not authorized
         """
-        statement = self._statement_repo.find_by_id(statement_id)
-        if not statement:
+        # Get the statement and its credit card in one query
+        found = self._statement_repo.find_with_credit_card(statement_id)
+        if not found:
             return None
+        statement, credit_card = found
 
-        # Get credit card to verify ownership
-        credit_card = self._credit_card_repo.find_by_id(statement.credit_card_id)
-        if not credit_card or credit_card.user_id != user_id:
+        # Verify ownership
+        if credit_card.user_id != user_id:
             return None
 
         # Get the card's currency for proper total calculation
         card_currency = credit_card.credit_limit.currency
-
-        # Get purchases that were made with this credit card's payment method
-        all_purchases = self._purchase_repo.find_by_payment_method_id(credit_card.payment_method_id)
+        card_currency_enum = Currency[card_currency]
 
         # Get period identifier
         period = statement.get_period_identifier()
 
-        # Filter purchases with installments in this period or manually assigned to this statement
+        # Fetch, in a single query, the purchases of this card's payment method joined
+        # with their category and the installments that belong to this statement:
+        # 1. Manually assigned to this statement, OR
+        # 2. Automatically assigned (billing_period matches) AND not manually assigned elsewhere
+        rows = self._purchase_repo.find_statement_rows(
+            credit_card.payment_method_id, statement_id, period
+        )
+
+        # Calculate total in card's currency while building the DTOs (summing primary
+        # amounts which are in card currency). The primary_amount in each purchase is
+        # already in the card's currency (ARS for ARS cards); for purchases made in USD,
+        # the primary_amount is the ARS equivalent
         statement_purchases = []
-        for purchase in all_purchases:
-            installments = self._installment_repo.find_by_purchase_id(purchase.id)
-
-            for installment in installments:
-                # Include installment if:
-                # 1. It's manually assigned to this statement, OR
-                # 2. It's automatically assigned to this statement (billing_period matches) AND not manually assigned elsewhere
-                should_include = (
-                    installment.manually_assigned_statement_id == statement_id or
-                    (installment.billing_period == period and installment.manually_assigned_statement_id is None)
-                )
-                if should_include:
-                    statement_purchases.append(
-                        self._create_purchase_dto(
-                            purchase,
-                            installment,
-                            card_currency,
-                        )
-                    )
-
-        # Calculate total in card's currency (summing primary amounts which are in card currency)
-        # The primary_amount in each purchase is already in the card's currency (ARS for ARS cards)
-        # For purchases made in USD, the primary_amount is the ARS equivalent
-        total = sum([p.amount for p in statement_purchases])
+        total = 0.0
+        for purchase, installment, category_name in rows:
+            dto = self._create_purchase_dto(
+                purchase,
+                installment,
+                card_currency_enum,
+                category_name or "Unknown",
+            )
+            statement_purchases.append(dto)
+            total += dto.amount
 
         return StatementDetailDTO(
             id=statement.id,
@@ -112,8 +101,9 @@ class GetStatementDetailUseCase:
     def _create_purchase_dto(
         self,
         purchase: Purchase,
-        installment: "Installment",
-        card_currency: str,
+        installment: Installment,
+        card_currency: Currency,
+        category_name: str,
     ) -> PurchaseInStatementDTO:
         """Create a purchase DTO with category name.
 
@@ -121,58 +111,35 @@ class GetStatementDetailUseCase:
             purchase: The purchase entity
             installment: The installment entity
             card_currency: The currency of the credit card (for proper conversion)
+            category_name: Name of the purchase's category
         """
-        from app.domain.entities.installment import Installment
-        from app.domain.value_objects.money import Currency
-        
-        category = self._category_repo.find_by_id(purchase.category_id)
-        category_name = category.name if category else "Unknown"
-
-        # Get installment amount in card currency
         installment_amount = installment.amount
-        
-        # Determine primary and secondary amounts based on card currency
+
         # We ALWAYS want to show the amount in the card's currency
-        card_currency_enum = Currency[card_currency]
-        
+        amount = installment_amount.primary_amount
+        currency = installment_amount.primary_currency
+        original_amount = None
+        original_currency = None
         if installment_amount.is_dual_currency():
-            # For dual currency, we need to figure out which is in card currency
-            if installment_amount.primary_currency == card_currency_enum:
-                # Primary is already in card currency - perfect!
-                amount = float(installment_amount.primary_amount)
-                currency = installment_amount.primary_currency.value
-                original_amount = float(installment_amount.secondary_amount)
-                original_currency = installment_amount.secondary_currency.value
-            elif installment_amount.secondary_currency == card_currency_enum:
-                # Secondary is in card currency - swap them for display
-                amount = float(installment_amount.secondary_amount)
-                currency = installment_amount.secondary_currency.value
-                original_amount = float(installment_amount.primary_amount)
-                original_currency = installment_amount.primary_currency.value
-            else:
-                # Neither matches card currency (shouldn't happen in bimonetary setup)
-                # Fall back to primary
-                amount = float(installment_amount.primary_amount)
-                currency = installment_amount.primary_currency.value
-                original_amount = float(installment_amount.secondary_amount)
-                original_currency = installment_amount.secondary_currency.value
-        else:
-            # Single currency installment
-            amount = float(installment_amount.primary_amount)
-            currency = installment_amount.primary_currency.value
-            original_amount = None
-            original_currency = None
+            original_amount = installment_amount.secondary_amount
+            original_currency = installment_amount.secondary_currency
+        if original_currency == card_currency:
+            # Secondary is in card currency - swap them for display. In any other
+            # case (primary in card currency, single currency, or neither matching)
+            # the primary amount is shown
+            amount, original_amount = original_amount, amount
+            currency, original_currency = original_currency, currency
 
         return PurchaseInStatementDTO(
             id=purchase.id,
             description=purchase.description,
             purchase_date=purchase.purchase_date,
-            amount=amount,
-            currency=currency,
+            amount=float(amount),
+            currency=CURRENCY_CODES[currency],
             installments=purchase.installments_count,
             installment_number=installment.installment_number,
             category_name=category_name,
-            original_amount=original_amount,
-            original_currency=original_currency,
+            original_amount=float(original_amount) if original_amount is not None else None,
+            original_currency=CURRENCY_CODES[original_currency] if original_currency is not None else None,
             exchange_rate_id=None,
         )
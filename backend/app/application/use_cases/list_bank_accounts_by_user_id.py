@@ -26,13 +26,12 @@ class ListBankAccountsUseCase:
         Returns:
             List of BankAccount entities
         """
-        with self._uow as uow:
+        with self._uow.readonly() as uow:
             if user_id is not None:
-                if not uow.users.find_by_id(user_id):
+                bank_accounts = uow.bank_accounts.find_by_user_id_checked(user_id)
+                if bank_accounts is None:
                     raise ValueError("User does not exist.")
-
-                bank_accounts = uow.bank_accounts.find_by_user_id(user_id)
             else:
                 bank_accounts = uow.bank_accounts.find_all()
 
-            return [BankAccountDTOMapper.to_response_dto(ba) for ba in bank_accounts]
+            return BankAccountDTOMapper.to_response_dto_many(bank_accounts)
@@ -22,18 +22,9 @@ class ListBudgetsUseCase:
             List[MonthlyBudgetResponseDTO]: List of budgets with participant counts
         """
         with self._uow:
-            # 1. Find budgets where user is a participant (already sorted by created_at DESC in repository)
-            user_budgets = self._uow.monthly_budgets.find_by_user_participant(user_id)
-
-            # 2. Get participant counts for each budget
-            budgets_with_counts = []
-            for budget in user_budgets:
-                participants = self._uow.budget_participants.find_by_budget_id(budget.id)
-                participant_count = len(participants)
-                budgets_with_counts.append((budget, participant_count))
-
-        # 3. Map to response DTOs
-        return [
-            MonthlyBudgetDTOMapper.to_response_dto(budget, count)
-            for budget, count in budgets_with_counts
-        ]
\ No newline at end of file
+            # 1. Find budgets where user is a participant together with their participant
+            # counts in a single query (already sorted by created_at DESC in repository)
+            budgets_with_counts = self._uow.monthly_budgets.find_by_user_participant_with_counts(user_id)
+
+        # 2. Map to response DTOs
+        return MonthlyBudgetDTOMapper.to_response_dto_many(budgets_with_counts)
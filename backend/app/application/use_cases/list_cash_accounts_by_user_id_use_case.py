@@ -15,6 +15,6 @@ class ListCashAccountsByUserIdUseCase:
         Returns:
             List[CashAccountResponseDTO]
         """
-        with self._uow as uow:
+        with self._uow.readonly() as uow:
             cash_accounts = uow.cash_accounts.find_by_user_id(user_id)
-            return [CashAccountDTOMapper.to_response_dto(ca) for ca in cash_accounts]
+            return CashAccountDTOMapper.to_response_dto_many(cash_accounts)
@@ -1,14 +1,22 @@
+from app.application.services.ttl_cache import TTLCache, categories_cache
 from app.domain.entities.category import Category
 from app.domain.repositories.iunit_of_work import IUnitOfWork
 
+# Categories are reference data that rarely change, so the full list is cached
+# in this process and dropped whenever a category is created
+CATEGORIES_CACHE_TTL_SECONDS = 300
+
+_ALL_CATEGORIES_KEY = "all"
+
 
 class ListCategoriesUseCase:
     """
     Use case to list all categories.
     """
     
-    def __init__(self, unit_of_work: IUnitOfWork):
+    def __init__(self, unit_of_work: IUnitOfWork, cache: TTLCache = categories_cache):
         self.unit_of_work = unit_of_work
+        self.cache = cache
     
     def execute(self) -> list[Category]:
         """
@@ -17,5 +25,13 @@ class ListCategoriesUseCase:
         Returns:
             List of all Category entities
         """
-        with self.unit_of_work as uow:
-            return uow.categories.find_all()
+        cached = self.cache.get(_ALL_CATEGORIES_KEY)
+        if cached is not None:
+            # Categories are frozen, only the list itself needs copying
+            return list(cached)
+
+        with self.unit_of_work.readonly() as uow:
+            categories = uow.categories.find_all()
+
+        self.cache.set(_ALL_CATEGORIES_KEY, categories, CATEGORIES_CACHE_TTL_SECONDS)
+        return list(categories)
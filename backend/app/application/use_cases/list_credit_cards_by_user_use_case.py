@@ -4,7 +4,7 @@ from app.domain.entities.credit_card import CreditCard
 from app.domain.repositories.iunit_of_work import IUnitOfWork
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ListCreditCardsByUserQuery:
     """Query to list credit cards by user"""
 
@@ -29,5 +29,5 @@ class ListCreditCardsByUserUseCase:
         Returns:
             List of CreditCard entities for the user
         """
-        with self.unit_of_work as uow:
+        with self.unit_of_work.readonly() as uow:
             return uow.credit_cards.find_by_user_id(query.user_id)
@@ -11,5 +11,5 @@ class ListDigitalWalletsByUserUseCase:
         self._uow = uow
 
     def execute(self, user_id: int) -> List[DigitalWallet]:
-        with self._uow as uow:
+        with self._uow.readonly() as uow:
             return uow.digital_wallets.find_by_user_id(user_id)
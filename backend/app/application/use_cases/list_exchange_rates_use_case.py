@@ -8,7 +8,7 @@ from app.domain.value_objects.exchange_rate_type import ExchangeRateType
 from app.domain.value_objects.money import Currency
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ListExchangeRatesQuery:
     """Query to list exchange rates within a date range"""
 
@@ -20,7 +20,7 @@ class ListExchangeRatesQuery:
     user_id: Optional[int] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ListExchangeRatesResult:
     """Result of listing exchange rates"""
 
@@ -41,24 +41,21 @@ class ListExchangeRatesByDateRangeUseCase:
         Returns:
             ListExchangeRatesResult: The result containing list of exchange rates
         """
-        with self.unit_of_work as uow:
-            # Get all exchange rates (we'll filter by date in Python)
-            from_currency = Currency(query.from_currency) if query.from_currency else None
-            to_currency = Currency(query.to_currency) if query.to_currency else None
-            rate_type = ExchangeRateType(query.rate_type) if query.rate_type else None
+        # Enum lookups already return the shared members, so there is nothing to cache;
+        # they only need to fail before a connection is checked out
+        from_currency = Currency(query.from_currency) if query.from_currency else None
+        to_currency = Currency(query.to_currency) if query.to_currency else None
+        rate_type = ExchangeRateType(query.rate_type) if query.rate_type else None
 
-            all_rates = uow.exchange_rates.list_all(
+        with self.unit_of_work as uow:
+            # The date range is filtered by the database
+            rates = uow.exchange_rates.list_all(
                 from_currency=from_currency,
                 to_currency=to_currency,
                 rate_type=rate_type,
                 user_id=query.user_id,
+                start_date=query.start_date,
+                end_date=query.end_date,
             )
 
-            # Filter by date range
-            filtered_rates = [
-                rate
-                for rate in all_rates
-                if query.start_date <= rate.date <= query.end_date
-            ]
-
-            return ListExchangeRatesResult(exchange_rates=filtered_rates)
+            return ListExchangeRatesResult(exchange_rates=rates)
@@ -4,7 +4,7 @@ from app.domain.entities.installment import Installment
 from app.domain.repositories.iunit_of_work import IUnitOfWork
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ListInstallmentsByPurchaseQuery:
     """Query to list installments by purchase"""
 
@@ -45,8 +45,5 @@ class ListInstallmentsByPurchaseUseCase:
                     f"Purchase {query.purchase_id} does not belong to user {query.user_id}"
                 )
 
-            # Get installments
-            installments = uow.installments.find_by_purchase_id(query.purchase_id)
-
-            # Sort by installment number
-            return sorted(installments, key=lambda i: i.installment_number)
+            # Get installments, already sorted by installment number
+            return uow.installments.find_by_purchase_id(query.purchase_id)
@@ -15,6 +15,6 @@ class ListPaymentMethodsByUserIdUseCase:
         Returns:
             List[PaymentMethodResponseDTO]
         """
-        with self._uow as uow:
+        with self._uow.readonly() as uow:
             payment_methods = uow.payment_methods.find_by_user_id(user_id)
-            return [PaymentMethodDTOMapper.to_response_dto(pm) for pm in payment_methods]
\ No newline at end of file
+            return PaymentMethodDTOMapper.to_response_dto_many(payment_methods)
\ No newline at end of file
@@ -4,7 +4,7 @@ from app.domain.entities.purchase import Purchase
 from app.domain.repositories.iunit_of_work import IUnitOfWork
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ListPurchasesByCategoryQuery:
     """Query to list purchases by category"""
 
@@ -34,15 +34,8 @@ class ListPurchasesByCategoryUseCase:
             List of Purchase entities for the category, filtered by user
         """
         with self.unit_of_work as uow:
-            # Get all purchases for the user
-            all_purchases = uow.purchases.find_by_user_id(query.user_id)
-
-            # Filter by category
-            category_purchases = [
-                p for p in all_purchases if p.category_id == query.category_id
-            ]
-
-            # Sort by purchase date descending (most recent first)
-            return sorted(
-                category_purchases, key=lambda p: p.purchase_date, reverse=True
+            # Filtered by category and sorted by purchase date descending
+            # (most recent first) in the database
+            return uow.purchases.find_by_user_and_category(
+                query.user_id, query.category_id
             )
@@ -5,7 +5,7 @@ from app.domain.entities.purchase import Purchase
 from app.domain.repositories.iunit_of_work import IUnitOfWork
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ListPurchasesByDateRangeQuery:
     """Query to list purchases by date range"""
 
@@ -41,17 +41,8 @@ class ListPurchasesByDateRangeUseCase:
             raise ValueError("start_date must be before or equal to end_date")
 
         with self.unit_of_work as uow:
-            # Get all purchases for user
-            all_purchases = uow.purchases.find_by_user_id(query.user_id)
-
-            # Filter by date range
-            filtered_purchases = [
-                p
-                for p in all_purchases
-                if query.start_date <= p.purchase_date <= query.end_date
-            ]
-
-            # Sort by purchase date descending (most recent first)
-            return sorted(
-                filtered_purchases, key=lambda p: p.purchase_date, reverse=True
+            # Filtered by date range and sorted by purchase date descending
+            # (most recent first) in the database
+            return uow.purchases.find_by_user_and_date_range(
+                query.user_id, query.start_date, query.end_date
             )
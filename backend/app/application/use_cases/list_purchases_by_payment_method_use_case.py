@@ -4,7 +4,7 @@ from app.domain.entities.purchase import Purchase
 from app.domain.repositories.iunit_of_work import IUnitOfWork
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ListPurchasesByPaymentMethodQuery:
     """Query to list purchases by payment method"""
 
@@ -47,8 +47,5 @@ class ListPurchasesByPaymentMethodUseCase:
                     f"Payment method {query.payment_method_id} does not belong to user {query.user_id}"
                 )
 
-            # Get purchases
-            purchases = uow.purchases.find_by_payment_method_id(query.payment_method_id)
-
-            # Sort by purchase date descending (most recent first)
-            return sorted(purchases, key=lambda p: p.purchase_date, reverse=True)
+            # Get purchases, already sorted by purchase date descending (most recent first)
+            return uow.purchases.find_by_payment_method_id(query.payment_method_id)
@@ -4,7 +4,7 @@ from app.domain.entities.purchase import Purchase
 from app.domain.repositories.iunit_of_work import IUnitOfWork
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ListPurchasesByUserQuery:
     """Query to list all purchases for a user"""
 
@@ -31,8 +31,6 @@ class ListPurchasesByUserUseCase:
         Returns:
             List of Purchase entities for the user
         """
-        with self.unit_of_work as uow:
-            purchases = uow.purchases.find_by_user_id(query.user_id)
-
-            # Sort by purchase date descending (most recent first)
-            return sorted(purchases, key=lambda p: p.purchase_date, reverse=True)
+        with self.unit_of_work.readonly() as uow:
+            # Already sorted by purchase date descending (most recent first)
+            return uow.purchases.find_by_user_id(query.user_id)
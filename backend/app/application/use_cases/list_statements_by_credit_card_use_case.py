@@ -9,7 +9,7 @@ from app.application.exceptions.application_exceptions import (
 from app.domain.repositories.iunit_of_work import IUnitOfWork
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ListStatementByCreditCardQuery:
     user_id: int
     credit_card_id: int
@@ -21,9 +21,7 @@ class ListStatementByCreditCardUseCase:
 
     def execute(self, query: ListStatementByCreditCardQuery) -> List[MonthlyStatementResponseDTO]:
         """
-        Loads the credit card and verifies the user owns it
-
-        Calls the repository to find statements by credit card id
+        Loads the credit card together with its statements and verifies the user owns it
 
         Args:
             query: containing user_id and credit_card_id
@@ -35,7 +33,11 @@ class ListStatementByCreditCardUseCase:
             CreditCardNotFoundError, CreditCardNotFoundError
         """
         with self._uow as uow:
-            credit_card = uow.credit_cards.find_by_id(query.credit_card_id)
+            # Include future statements so dropdowns show all statements regardless of due_date.
+            # Already sorted by due_date ascending
+            credit_card, statements = uow.monthly_statements.find_by_credit_card_for_user(
+                query.credit_card_id, query.user_id, include_future=True
+            )
             if not credit_card:
                 raise CreditCardNotFoundError(
                     f"Credit card with ID {query.credit_card_id} not found"
@@ -46,14 +48,9 @@ class ListStatementByCreditCardUseCase:
                     f"Credit card {query.credit_card_id} does not belong to user {query.user_id}"
                 )
 
-            # Include future statements so dropdowns show all statements regardless of due_date
-            statements = uow.monthly_statements.find_by_credit_card_id(
-                query.credit_card_id, include_future=True
-            )
-
             # Convert to DTOs
             result = []
-            for statement in sorted(statements, key=lambda x: x.due_date):
+            for statement in statements:
                 result.append(
                     MonthlyStatementResponseDTO(
                         id=statement.id,
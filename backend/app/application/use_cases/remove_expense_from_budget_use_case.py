@@ -36,15 +36,17 @@ class RemoveExpenseFromBudgetUseCase:
         - Deleting the expense will cascade delete all responsibilities
         """
         with self._uow:
-            # 1. Get budget expense
-            expense = self._uow.budget_expenses.find_by_id(command.budget_expense_id)
-            if not expense:
+            # 1. Get budget expense, its budget and the user's participation at once
+            loaded = self._uow.budget_expenses.load_for_removal(
+                command.budget_expense_id, command.requesting_user_id
+            )
+            if not loaded:
                 raise BudgetExpenseNotFoundError(
                     f"Budget expense {command.budget_expense_id} not found"
                 )
+            expense, budget, is_participant = loaded
 
-            # 2. Get budget and validate it's active
-            budget = self._uow.monthly_budgets.find_by_id(expense.budget_id)
+            # 2. Validate budget exists and is active
             if not budget:
                 raise BusinessRuleViolationError(
                     f"Budget {expense.budget_id} not found"
@@ -57,23 +59,15 @@ class RemoveExpenseFromBudgetUseCase:
                 )
 
             # 3. Validate requesting user is a participant
-            participant = self._uow.budget_participants.find_by_budget_and_user(
-                budget.id, command.requesting_user_id
-            )
-            if not participant:
+            if not is_participant:
                 raise BusinessRuleViolationError(
                     f"User {command.requesting_user_id} is not a participant of budget {budget.id}"
                 )
 
-            # 4. Delete responsibilities (explicit, though DB cascade should handle it)
-            self._uow.budget_expense_responsibilities.delete_by_budget_expense_id(
-                command.budget_expense_id
-            )
-
-            # 5. Delete expense
-            self._uow.budget_expenses.delete(command.budget_expense_id)
+            # 4. Delete the expense and its responsibilities
+            self._uow.budget_expenses.delete_with_responsibilities(command.budget_expense_id)
 
-            # 6. Commit transaction
+            # 5. Commit transaction
             self._uow.commit()
 
             return RemoveExpenseFromBudgetResult(success=True)
@@ -1,3 +1,5 @@
+from dataclasses import dataclass
+from operator import attrgetter
 from typing import Optional, Dict
 from decimal import Decimal
 from pydantic import BaseModel, Field
@@ -11,6 +13,9 @@ from app.application.exceptions.application_exceptions import (
     BudgetExpenseNotFoundError,
 )
 
+# Stateless domain service, shared by every use case instance
+_RESPONSIBILITY_CALCULATOR = ResponsibilityCalculator()
+
 
 class UpdateExpenseResponsibilitiesCommand(BaseModel):
     """Command to update expense responsibilities (change split type/percentages)"""
@@ -21,7 +26,8 @@ class UpdateExpenseResponsibilitiesCommand(BaseModel):
     requesting_user_id: int = Field(gt=0)  # User making the request
 
 
-class UpdateExpenseResponsibilitiesResult(BaseModel):
+@dataclass(frozen=True, slots=True)
+class UpdateExpenseResponsibilitiesResult:
     """Result of updating expense responsibilities"""
     success: bool = True
 
@@ -31,7 +37,7 @@ class UpdateExpenseResponsibilitiesUseCase:
 
     def __init__(self, uow: IUnitOfWork):
         self._uow = uow
-        self._responsibility_calculator = ResponsibilityCalculator()
+        self._responsibility_calculator = _RESPONSIBILITY_CALCULATOR
 
     def execute(self, command: UpdateExpenseResponsibilitiesCommand) -> UpdateExpenseResponsibilitiesResult:
         """
@@ -46,15 +52,15 @@ class UpdateExpenseResponsibilitiesUseCase:
         - For full_single: responsible_user_id must be provided and be a participant
         """
         with self._uow:
-            # 1. Get budget expense
-            expense = self._uow.budget_expenses.find_by_id(command.budget_expense_id)
-            if not expense:
+            # 1. Get budget expense, its budget and all its participants at once
+            loaded = self._uow.budget_expenses.load_for_update(command.budget_expense_id)
+            if not loaded:
                 raise BudgetExpenseNotFoundError(
                     f"Budget expense {command.budget_expense_id} not found"
                 )
+            expense, budget, participants = loaded
 
-            # 2. Get budget and validate it's active
-            budget = self._uow.monthly_budgets.find_by_id(expense.budget_id)
+            # 2. Validate budget exists and is active
             if not budget:
                 raise BusinessRuleViolationError(
                     f"Budget {expense.budget_id} not found"
@@ -67,21 +73,19 @@ class UpdateExpenseResponsibilitiesUseCase:
                 )
 
             # 3. Validate requesting user is a participant
-            participant = self._uow.budget_participants.find_by_budget_and_user(
-                budget.id, command.requesting_user_id
-            )
-            if not participant:
+            participant_user_ids = list(map(attrgetter("user_id"), participants))
+            participant_user_id_set = frozenset(participant_user_ids)
+            if command.requesting_user_id not in participant_user_id_set:
                 raise BusinessRuleViolationError(
                     f"User {command.requesting_user_id} is not a participant of budget {budget.id}"
                 )
 
             # 4. Validate split type
-            try:
-                split_type = SplitType(command.split_type)
-            except ValueError:
+            split_type = SplitType.from_value(command.split_type)
+            if split_type is None:
                 raise BusinessRuleViolationError(
                     f"Invalid split_type: {command.split_type}. "
-                    f"Must be one of: {', '.join([st.value for st in SplitType])}"
+                    f"Must be one of: {SplitType.values_display()}"
                 )
 
             # 5. Validate full_single has responsible_user_id
@@ -90,47 +94,22 @@ class UpdateExpenseResponsibilitiesUseCase:
                     "responsible_user_id is required for split_type 'full_single'"
                 )
 
-            # 6. Get all participants
-            participants = self._uow.budget_participants.find_by_budget_id(budget.id)
-            participant_user_ids = [p.user_id for p in participants]
-            
-            # Get User entities for participants
-            participant_users = []
-            for user_id in participant_user_ids:
-                user = self._uow.users.find_by_id(user_id)
-                if user:
-                    participant_users.append(user)
+            # 6. Get User entities for participants in one query, keeping participant order
+            # and skipping users that no longer exist
+            users_by_id = {user.id: user for user in self._uow.users.find_by_ids(participant_user_ids)}
+            participant_users = [
+                user for user_id in participant_user_ids if (user := users_by_id.get(user_id)) is not None
+            ]
 
             # 7. Validate full_single responsible user is a participant
             if split_type == SplitType.FULL_SINGLE:
-                if command.responsible_user_id not in participant_user_ids:
+                if command.responsible_user_id not in participant_user_id_set:
                     raise BusinessRuleViolationError(
                         f"User {command.responsible_user_id} is not a participant of budget {budget.id}"
                     )
 
-            # 8. Delete current responsibilities
-            self._uow.budget_expense_responsibilities.delete_by_budget_expense_id(
-                command.budget_expense_id
-            )
-
-            # 9. Update expense split_type
-            updated_expense = BudgetExpense(
-                id=expense.id,
-                budget_id=expense.budget_id,
-                purchase_id=expense.purchase_id,
-                installment_id=expense.installment_id,
-                paid_by_user_id=expense.paid_by_user_id,
-                description=expense.description,
-                amount=expense.amount,
-                currency=expense.currency,
-                date=expense.date,
-                payment_method_name=expense.payment_method_name,
-                split_type=split_type,
-                created_at=expense.created_at,
-            )
-            self._uow.budget_expenses.save(updated_expense)
-
-            # 10. Calculate new responsibilities (use wage fallback for proportional split)
+            # 8. Calculate new responsibilities before any write, so the write lock is held only
+            #    for the statements below (use wage fallback for proportional split)
             responsibilities = self._responsibility_calculator.calculate_responsibilities(
                 expense_id=expense.id,
                 budget_id=expense.budget_id,
@@ -143,14 +122,15 @@ class UpdateExpenseResponsibilitiesUseCase:
                 full_single_user_id=command.responsible_user_id,
             )
 
-            # 11. Save new responsibilities
-            self._uow.budget_expense_responsibilities.save_many(responsibilities)
+            # 9. Update expense split_type
+            self._uow.budget_expenses.update_split_type(expense.id, split_type)
 
-            # 12. Commit transaction
+            # 10. Replace current responsibilities with the new ones
+            self._uow.budget_expense_responsibilities.replace_for_expense(
+                command.budget_expense_id, responsibilities
+            )
+
+            # 11. Commit transaction
             self._uow.commit()
 
             return UpdateExpenseResponsibilitiesResult(success=True)
-
-
-# Import BudgetExpense to avoid circular import issues
-from app.domain.entities.budget_expense import BudgetExpense
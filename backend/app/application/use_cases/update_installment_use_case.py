@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from typing import Optional
 from decimal import Decimal
 
@@ -9,13 +9,11 @@ from app.application.exceptions.application_exceptions import (
     MonthlyStatementNotFoundError,
 )
 from app.application.mappers.purchase_dto_mapper import InstallmentDTOMapper
-from app.domain.entities.installment import Installment
-from app.domain.entities.purchase import Purchase
 from app.domain.repositories.iunit_of_work import IUnitOfWork
 from app.domain.value_objects.money import Money
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UpdateInstallmentCommand:
     """Command to update an installment"""
 
@@ -54,24 +52,27 @@ class UpdateInstallmentUseCase:
             MonthlyStatementNotFoundError: If manual statement assignment is invalid
         """
         with self._uow:
-            # Find existing installment
-            installment = self._uow.installments.find_by_id(command.installment_id)
-            if not installment:
+            # Find existing installment with its purchase and credit card in one query
+            loaded = self._uow.installments.load_for_update(command.installment_id)
+            if not loaded:
                 raise InstallmentNotFoundError(f"Installment with ID {command.installment_id} not found")
+            installment, purchase, credit_card = loaded
 
             # Verify ownership through purchase
-            purchase = self._uow.purchases.find_by_id(installment.purchase_id)
             if not purchase or purchase.user_id != command.user_id:
                 raise PurchaseNotFoundError(f"Installment {command.installment_id} does not belong to user {command.user_id}")
 
+            # Nothing changes: skip the write and the commit
+            if (command.amount is None and
+                command.manually_assigned_statement_id == installment.manually_assigned_statement_id):
+                return InstallmentDTOMapper.to_response_dto(installment)
+
             # Validate manual statement assignment if provided
             if command.manually_assigned_statement_id is not None:
                 statement = self._uow.monthly_statements.find_by_id(command.manually_assigned_statement_id)
                 if not statement:
                     raise MonthlyStatementNotFoundError(f"Monthly statement with ID {command.manually_assigned_statement_id} not found")
                 
-                # Find the credit card for this purchase's payment method
-                credit_card = self._uow.credit_cards.find_by_payment_method_id(purchase.payment_method_id)
                 if not credit_card:
                     raise MonthlyStatementNotFoundError(f"No credit card found for payment method {purchase.payment_method_id}")
                 
@@ -79,14 +80,14 @@ class UpdateInstallmentUseCase:
                     raise MonthlyStatementNotFoundError(f"Statement {command.manually_assigned_statement_id} does not belong to the same credit card")
 
             # Update installment
-            updated_amount = command.amount if command.amount is not None else installment.amount.amount
-            updated_installment = Installment(
-                id=installment.id,
-                purchase_id=installment.purchase_id,
-                installment_number=installment.installment_number,
-                total_installments=installment.total_installments,
-                amount=Money(amount=updated_amount, currency=installment.amount.currency),
-                billing_period=installment.billing_period,
+            # Reuse the stored amount unless a new one is given
+            if command.amount is None:
+                updated_amount = installment.amount
+            else:
+                updated_amount = Money(amount=command.amount, currency=installment.amount.currency)
+            updated_installment = replace(
+                installment,
+                amount=updated_amount,
                 manually_assigned_statement_id=command.manually_assigned_statement_id,
             )
 
@@ -95,17 +96,11 @@ class UpdateInstallmentUseCase:
 
             # If amount changed, update purchase total
             if command.amount is not None:
-                all_installments = self._uow.installments.find_by_purchase_id(purchase.id)
-                new_total = sum(inst.amount.amount for inst in all_installments)
-                updated_purchase = Purchase(
-                    id=purchase.id,
-                    user_id=purchase.user_id,
-                    payment_method_id=purchase.payment_method_id,
-                    category_id=purchase.category_id,
-                    purchase_date=purchase.purchase_date,
-                    description=purchase.description,
+                # Only this installment changed, so the total moves by its difference
+                new_total = purchase.total_amount.amount - installment.amount.amount + command.amount
+                updated_purchase = replace(
+                    purchase,
                     total_amount=Money(amount=new_total, currency=purchase.total_amount.currency),
-                    installments_count=purchase.installments_count,
                 )
                 self._uow.purchases.save(updated_purchase)
 
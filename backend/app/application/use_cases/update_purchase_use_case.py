@@ -1,28 +1,30 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from typing import Optional
-from datetime import date
+from datetime import date, datetime
 from decimal import Decimal
 
-from app.application.dtos.purchase_dto import UpdatePurchaseInputDTO, PurchaseResponseDTO
+from app.application.dtos.purchase_dto import PurchaseResponseDTO
+from app.application.mappers.purchase_dto_mapper import PurchaseDTOMapper
 from app.application.exceptions.application_exceptions import (
     PurchaseNotFoundError,
     PaymentMethodNotFoundError,
     PaymentMethodOwnershipError,
     CategoryNotFoundError,
 )
-from app.application.mappers.purchase_dto_mapper import PurchaseDTOMapper
-from app.domain.entities.purchase import Purchase
-from app.domain.entities.installment import Installment
+from app.domain.entities.exchange_rate import ExchangeRate
 from app.domain.repositories.iunit_of_work import IUnitOfWork
-from app.domain.value_objects.money import Money, Currency
+from app.domain.value_objects.money import Currency
 from app.domain.value_objects.dual_money import DualMoney
 from app.domain.value_objects.exchange_rate_type import ExchangeRateType
 from app.domain.services.installment_generator import InstallmentGenerator
-from app.domain.services.exchange_rate_finder import ExchangeRateFinder
 from app.domain.value_objects.payment_method_type import PaymentMethodType
 
 
-@dataclass(frozen=True)
+# Amounts are stored with two decimals
+_CENT = Decimal("0.01")
+
+
+@dataclass(frozen=True, slots=True)
 class UpdatePurchaseCommand:
     """Command to update a purchase"""
 
@@ -68,41 +70,44 @@ class UpdatePurchaseUseCase:
             CategoryNotFoundError: If category doesn't exist
         """
         with self._uow:
-            # Find existing purchase
-            purchase = self._uow.purchases.find_by_id(command.purchase_id)
-            if not purchase:
+            # Find the user's purchase with its payment method and credit card in one query
+            loaded = self._uow.purchases.load_for_update(command.purchase_id, command.user_id)
+            if not loaded:
                 raise PurchaseNotFoundError(f"Purchase with ID {command.purchase_id} not found")
+            purchase, payment_method, credit_card = loaded
+
+            # Amounts are rebuilt and installments regenerated only if a dual-currency field changes;
+            # resending the stored total is no change
+            needs_regenerate = (
+                (command.total_amount is not None
+                 and command.total_amount != purchase.total_amount.primary_amount)
+                or command.original_amount is not None
+                or command.exchange_rate_id is not None
+            )
 
-            if purchase.user_id != command.user_id:
-                raise PurchaseNotFoundError(f"Purchase with ID {command.purchase_id} not found")
+            # Nothing to update: return the stored purchase before any lookup or write
+            if not needs_regenerate and command.category_id is None and command.description is None:
+                return PurchaseDTOMapper.to_response_dto(purchase)
 
-            # Get payment method for credit card check
-            payment_method = self._uow.payment_methods.find_by_id(purchase.payment_method_id)
             if not payment_method:
                 raise PaymentMethodNotFoundError(f"Payment method with ID {purchase.payment_method_id} not found")
-            
-            credit_card = None
-            if payment_method.type == PaymentMethodType.CREDIT_CARD:
-                credit_card = self._uow.credit_cards.find_by_payment_method_id(purchase.payment_method_id)
 
-            # Validate category if provided
+            if payment_method.type != PaymentMethodType.CREDIT_CARD:
+                credit_card = None
+
+            # Validate category if it changes; the current one was validated when stored
             category_id = command.category_id if command.category_id is not None else purchase.category_id
-            if command.category_id is not None:
+            if category_id != purchase.category_id:
                 category = self._uow.categories.find_by_id(command.category_id)
                 if not category:
                     raise CategoryNotFoundError(f"Category with ID {command.category_id} not found")
 
             # Build updated DualMoney
-            needs_regenerate = False
             total_amount = purchase.total_amount
-            exchange_rate_entity = None
+            exchange_rate_id = purchase.exchange_rate_id
             
-            # Check if dual-currency fields are being updated
-            if (command.total_amount is not None or 
-                command.original_amount is not None or 
-                command.exchange_rate_id is not None):
-                
-                needs_regenerate = True
+            if needs_regenerate:
+                exchange_rate_entity = None
                 
                 # Start with current values
                 primary_currency = purchase.total_amount.primary_currency
@@ -136,9 +141,9 @@ class UpdatePurchaseUseCase:
                     else:
                         # Calculate secondary from primary using the rate
                         if exchange_rate_entity.from_currency == primary_currency:
-                            secondary_amount = primary_amount * exchange_rate_entity.rate
+                            secondary_amount = (primary_amount * exchange_rate_entity.rate).quantize(_CENT)
                         else:
-                            secondary_amount = primary_amount / exchange_rate_entity.rate
+                            secondary_amount = (primary_amount / exchange_rate_entity.rate).quantize(_CENT)
                             
                 elif command.original_amount is not None:
                     # User provided custom amount without exchange_rate_id - create INFERRED rate
@@ -151,10 +156,6 @@ class UpdatePurchaseUseCase:
                     calculated_rate = secondary_amount / primary_amount
                     
                     # Create an INFERRED exchange rate and save it
-                    from app.domain.entities.exchange_rate import ExchangeRate
-                    from app.domain.value_objects.exchange_rate_type import ExchangeRateType
-                    from datetime import datetime
-                    
                     inferred_rate = ExchangeRate(
                         id=None,
                         created_by_user_id=command.user_id,
@@ -166,7 +167,10 @@ class UpdatePurchaseUseCase:
                         created_at=datetime.now(),
                         source="INFERRED",
                     )
-                    exchange_rate_entity = self._uow.exchange_rates.save(inferred_rate)
+                    # Only its id is needed, so insert it without reloading the row
+                    exchange_rate_entity = replace(
+                        inferred_rate, id=self._uow.exchange_rates.add(inferred_rate)
+                    )
                 
                 # Build DualMoney
                 if secondary_amount is not None and secondary_currency is not None and calculated_rate is not None:
@@ -182,76 +186,48 @@ class UpdatePurchaseUseCase:
                         primary_amount=primary_amount,
                         primary_currency=primary_currency,
                     )
+                exchange_rate_id = exchange_rate_entity.id if exchange_rate_entity else None
+
+            description = command.description if command.description is not None else purchase.description
+
+            # Nothing changes: skip the write and the commit
+            if not needs_regenerate and category_id == purchase.category_id and description == purchase.description:
+                return PurchaseDTOMapper.to_response_dto(purchase)
 
             # Create updated purchase
-            updated_purchase = Purchase(
-                id=purchase.id,
-                user_id=purchase.user_id,
-                payment_method_id=purchase.payment_method_id,
+            updated_purchase = replace(
+                purchase,
                 category_id=category_id,
-                purchase_date=purchase.purchase_date,
-                description=command.description if command.description is not None else purchase.description,
+                description=description,
                 total_amount=total_amount,
-                installments_count=purchase.installments_count,
+                exchange_rate_id=exchange_rate_id,
             )
 
-            # Save updated purchase
-            saved_purchase = self._uow.purchases.save(updated_purchase)
-            
-            # Update exchange_rate_id if applicable
-            from app.infrastructure.persistence.models.purchase_model import PurchaseModel
-            purchase_model = self._uow.session.get(PurchaseModel, saved_purchase.id)
-            if purchase_model:
-                if exchange_rate_entity:
-                    purchase_model.exchange_rate_id = exchange_rate_entity.id
-                else:
-                    purchase_model.exchange_rate_id = None
-                self._uow.session.flush()
-
-            # Regenerate installments if amounts changed and it's a credit card purchase
+            # Generate new installments if amounts changed and it's a credit card purchase; this is
+            # pure computation, so it runs before the writes below
+            new_installments = None
             if needs_regenerate and credit_card:
-                # Delete existing installments and their associated budget expenses
-                existing_installments = self._uow.installments.find_by_purchase_id(purchase.id)
-                for inst in existing_installments:
-                    # Delete associated budget expenses first (FK constraint)
-                    budget_expenses = self._uow.budget_expenses.find_by_installment_id(inst.id)
-                    for expense in budget_expenses:
-                        self._uow.budget_expenses.delete(expense.id)
-                    
-                    self._uow.installments.delete(inst.id)
-                
-                # Generate new installments
                 new_installments = InstallmentGenerator.generate_installments(
-                    purchase_id=saved_purchase.id,
-                    total_amount=saved_purchase.total_amount,
-                    installments_count=saved_purchase.installments_count,
-                    purchase_date=saved_purchase.purchase_date,
+                    purchase_id=updated_purchase.id,
+                    total_amount=updated_purchase.total_amount,
+                    installments_count=updated_purchase.installments_count,
+                    purchase_date=updated_purchase.purchase_date,
                     credit_card=credit_card,
                 )
-                
-                # Save new installments
-                self._uow.installments.save_all(new_installments)
+
+            # Save updated purchase, exchange_rate_id included; the stored copy backs the response
+            updated_purchase = self._uow.purchases.save(updated_purchase)
+
+            if new_installments is not None:
+                # Delete associated budget expenses first (FK constraint)
+                self._uow.budget_expenses.delete_by_purchase_installments(purchase.id)
+
+                # A single installment is overwritten in place; otherwise replace them all
+                if not (len(new_installments) == 1
+                        and self._uow.installments.update_by_purchase_and_number(new_installments[0])):
+                    self._uow.installments.delete_by_purchase_id(purchase.id)
+                    self._uow.installments.save_all(new_installments)
 
             self._uow.commit()
 
-            # Get the updated purchase model to include exchange_rate_id in response
-            from app.infrastructure.persistence.models.purchase_model import PurchaseModel
-            updated_model = self._uow.session.get(PurchaseModel, saved_purchase.id)
-            if not updated_model:
-                raise PurchaseNotFoundError(f"Purchase with id {saved_purchase.id} not found after update")
-            
-            # Build response DTO from model to include exchange_rate_id
-            return PurchaseResponseDTO(
-                id=updated_model.id,
-                user_id=updated_model.user_id,
-                payment_method_id=updated_model.payment_method_id,
-                category_id=updated_model.category_id,
-                purchase_date=updated_model.purchase_date,
-                description=updated_model.description,
-                total_amount=Decimal(str(updated_model.total_amount)),
-                currency=Currency(updated_model.total_currency),
-                installments_count=updated_model.installments_count,
-                original_amount=Decimal(str(updated_model.original_amount)) if updated_model.original_amount else None,
-                original_currency=updated_model.original_currency,
-                exchange_rate_id=updated_model.exchange_rate_id,
-            )
\ No newline at end of file
+            return PurchaseDTOMapper.to_response_dto(updated_purchase)
@@ -1,12 +1,13 @@
 """Use case for updating statement dates."""
 
 from datetime import timedelta
+from operator import attrgetter
 
 from app.application.dtos.monthly_statement_dto import (
     MonthlyStatementResponseDTO,
     UpdateStatementDatesInputDTO,
 )
-from app.domain.entities.installment import Installment
+from app.application.exceptions.application_exceptions import ConcurrentUpdateError
 from app.domain.entities.monthly_statement import MonthlyStatement
 from app.domain.repositories.icredit_card_repository import ICreditCardRepository
 from app.domain.repositories.iinstallment_repository import IInstallmentRepository
@@ -58,6 +59,8 @@ class UpdateStatementDatesUseCase:
 
         Raises:
             ValueError: If dates are invalid (close_date > due_date)
+            ConcurrentUpdateError: If the statement or the next one changed
+                since it was read; the request can be retried
         """
         # Find and authorize
         statement = self._statement_repository.find_by_id(statement_id)
@@ -81,10 +84,15 @@ class UpdateStatementDatesUseCase:
             start_date=input_dto.start_date or statement.start_date,
             closing_date=input_dto.closing_date,
             due_date=input_dto.due_date,
+            row_version=statement.row_version,
         )
 
-        # Save statement
-        saved_statement = self._statement_repository.save(updated_statement)
+        # Save statement only if no one else changed it since it was read
+        saved_statement = self._statement_repository.save_if_unchanged(updated_statement)
+        if saved_statement is None:
+            raise ConcurrentUpdateError(
+                f"Statement {statement.id} was modified by another request"
+            )
 
         # Recalculate billing_period for all affected installments
         # Get the new period (YYYYMM format) - month of due_date minus 1
@@ -113,25 +121,11 @@ class UpdateStatementDatesUseCase:
                 credit_card, statement, saved_statement, user_id
             )
 
-        # Re-assign previously included installments to this statement so they remain included
-        from app.domain.entities.installment import Installment
-        for inst_id in included_installment_ids:
-            existing = self._installment_repository.find_by_id(inst_id)
-            # Only assign to this statement if it's currently unassigned or already belonged to this statement.
-            if existing and (
-                existing.manually_assigned_statement_id is None
-                or existing.manually_assigned_statement_id == statement.id
-            ) and existing.manually_assigned_statement_id != saved_statement.id:
-                updated = Installment(
-                    id=existing.id,
-                    purchase_id=existing.purchase_id,
-                    installment_number=existing.installment_number,
-                    total_installments=existing.total_installments,
-                    amount=existing.amount,
-                    billing_period=existing.billing_period,
-                    manually_assigned_statement_id=saved_statement.id,
-                )
-                self._installment_repository.save(updated)
+        # Re-assign previously included installments to this statement so they remain included.
+        # Only those currently unassigned or already belonging to this statement are assigned
+        self._installment_repository.bulk_assign_statement(
+            included_installment_ids, saved_statement.id, statement.id
+        )
 
         # Update the next statement's start date if it exists
         self._update_next_statement_start_date(saved_statement, credit_card)
@@ -165,20 +159,20 @@ class UpdateStatementDatesUseCase:
 
         card_purchases = [p for p in all_purchases if p.payment_method_id == statement.credit_card_id]
 
-        for purchase in card_purchases:
-            installments = self._installment_repository.find_by_purchase_id(purchase.id)
+        # Installments of all card purchases in one query
+        installments = self._installment_repository.find_by_purchase_ids([p.id for p in card_purchases])
 
-            # Defensive: ensure installments is iterable
-            try:
-                iter(installments)
-            except TypeError:
-                continue
+        # Defensive: ensure installments is iterable
+        try:
+            iter(installments)
+        except TypeError:
+            return included
 
-            for inst in installments:
-                if inst.manually_assigned_statement_id == statement.id:
-                    included.append(inst.id)
-                elif inst.billing_period == period and inst.manually_assigned_statement_id is None:
-                    included.append(inst.id)
+        for inst in installments:
+            if inst.manually_assigned_statement_id == statement.id:
+                included.append(inst.id)
+            elif inst.billing_period == period and inst.manually_assigned_statement_id is None:
+                included.append(inst.id)
 
         return included
 
@@ -228,27 +222,12 @@ class UpdateStatementDatesUseCase:
             if p.payment_method_id == credit_card.id and old_statement.includes_purchase_date(p.purchase_date)
         ]
 
-        # For each purchase, update installments that were in the old period
-        for purchase in card_purchases:
-            installments = self._installment_repository.find_by_purchase_id(purchase.id)
-
-            for installment in installments:
-                # If this installment was in the old period, update it to new period
-                if installment.billing_period == old_period:
-                    # Calculate the correct due date for this installment in the new period
-                    # The installment keeps its relative position (installment_number)
-                    # but gets updated to the new period
-                    # Preserve any existing manual assignment. Only update the billing_period.
-                    updated_installment = Installment(
-                        id=installment.id,
-                        purchase_id=installment.purchase_id,
-                        installment_number=installment.installment_number,
-                        total_installments=installment.total_installments,
-                        amount=installment.amount,
-                        billing_period=new_period,
-                        manually_assigned_statement_id=installment.manually_assigned_statement_id,
-                    )
-                    self._installment_repository.save(updated_installment)
+        # Move those purchases' installments from the old period to the new one in a single UPDATE.
+        # The installments keep their relative position (installment_number) and any existing
+        # manual assignment; only the billing_period changes
+        self._installment_repository.bulk_update_billing_period(
+            [p.id for p in card_purchases], old_period, new_period
+        )
 
     def _update_next_statement_start_date(
         self, current_statement: MonthlyStatement, credit_card
@@ -271,7 +250,7 @@ class UpdateStatementDatesUseCase:
             all_statements = []
 
         # Sort statements by start_date to find the chronological order
-        sorted_statements = sorted(all_statements, key=lambda s: s.start_date)
+        sorted_statements = sorted(all_statements, key=attrgetter("start_date"))
 
         # Find the current statement in the sorted list and get the next one
         next_statement = None
@@ -296,8 +275,12 @@ class UpdateStatementDatesUseCase:
                 start_date=next_start_date,
                 closing_date=next_statement.closing_date,
                 due_date=next_statement.due_date,
+                row_version=next_statement.row_version,
             )
-            self._statement_repository.save(updated_next_statement)
+            if self._statement_repository.save_if_unchanged(updated_next_statement) is None:
+                raise ConcurrentUpdateError(
+                    f"Statement {next_statement.id} was modified by another request"
+                )
 
     def _protect_next_statement_installments(self, current_statement: MonthlyStatement, credit_card, user_id: int):
         """Ensure that installments that currently belong to the next statement remain assigned to it.
@@ -316,7 +299,7 @@ class UpdateStatementDatesUseCase:
         except TypeError:
             return
 
-        sorted_statements = sorted(all_statements, key=lambda s: s.start_date)
+        sorted_statements = sorted(all_statements, key=attrgetter("start_date"))
 
         # Find current statement and candidate next
         next_stmt = None
@@ -331,18 +314,5 @@ class UpdateStatementDatesUseCase:
         # Get installments that are currently included in the next statement
         next_included_ids = self._get_included_installment_ids(next_stmt, user_id)
 
-        from app.domain.entities.installment import Installment
-
-        for inst_id in next_included_ids:
-            existing = self._installment_repository.find_by_id(inst_id)
-            if existing and existing.manually_assigned_statement_id is None:
-                updated = Installment(
-                    id=existing.id,
-                    purchase_id=existing.purchase_id,
-                    installment_number=existing.installment_number,
-                    total_installments=existing.total_installments,
-                    amount=existing.amount,
-                    billing_period=existing.billing_period,
-                    manually_assigned_statement_id=next_stmt.id,
-                )
-                self._installment_repository.save(updated)
+        # Assign the unassigned ones to the next statement in a single UPDATE
+        self._installment_repository.bulk_assign_statement(next_included_ids, next_stmt.id)
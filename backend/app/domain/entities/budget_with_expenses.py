@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from decimal import Decimal
-from typing import List, Dict
+from typing import List, Dict, Tuple
 
 from app.domain.entities.monthly_budget import MonthlyBudget
 from app.domain.entities.budget_expense import BudgetExpense
@@ -56,6 +56,48 @@ class BudgetWithExpenses:
 
         return Money(total, currency)
 
+    def paid_by_user_totals(self) -> Dict[int, Money]:
+        """Calculate the amount paid by every user in a single pass over the expenses"""
+        totals: Dict[int, Decimal] = {}
+        currencies: Dict[int, str] = {}
+        for expense in self.expenses:
+            user_id = expense.paid_by_user_id
+            if user_id not in totals:
+                totals[user_id] = Decimal("0")
+                currencies[user_id] = expense.amount.currency
+            totals[user_id] += expense.amount.amount
+
+        return {user_id: Money(total, currencies[user_id]) for user_id, total in totals.items()}
+
+    def responsibility_totals(self) -> Dict[int, Money]:
+        """Calculate the amount every user is responsible for in a single pass over the responsibilities"""
+        totals: Dict[int, Decimal] = {}
+        currencies: Dict[int, str] = {}
+        for expense in self.expenses:
+            seen_users = set()
+            for resp in self.responsibilities.get(expense.id, []):
+                # Only the first responsibility of a user per expense counts
+                if resp.user_id in seen_users:
+                    continue
+                seen_users.add(resp.user_id)
+                totals[resp.user_id] = totals.get(resp.user_id, Decimal("0")) + resp.responsible_amount.amount
+                currencies[resp.user_id] = resp.responsible_amount.currency
+
+        return {user_id: Money(total, currencies[user_id]) for user_id, total in totals.items()}
+
+    def balances(self, user_ids: List[int]) -> Dict[int, Tuple[Money, Money, Money]]:
+        """Calculate (paid, responsible, paid - responsible) for each of the given users"""
+        paid_totals = self.paid_by_user_totals()
+        responsibility_totals = self.responsibility_totals()
+        zero = Money(Decimal("0"), "ARS")  # Default currency
+
+        result = {}
+        for user_id in user_ids:
+            paid = paid_totals.get(user_id, zero)
+            responsible = responsibility_totals.get(user_id, zero)
+            result[user_id] = (paid, responsible, paid - responsible)
+        return result
+
     def net_balance(self, user_id: int) -> Money:
         """Calculate net balance for a user (paid - responsible)"""
         paid = self.amount_paid_by(user_id)
@@ -86,13 +128,13 @@ class BudgetWithExpenses:
             ...
         ]
         """
-        participants = self.get_participants()
-        balances = {user_id: self.net_balance(user_id) for user_id in participants}
-
-        # Simple debt calculation: positive balance users owe to negative balance users
-        debts = []
+        balances = {
+            user_id: balance
+            for user_id, (_, _, balance) in self.balances(self.get_participants()).items()
+        }
 
-        # Get users with positive balances (creditors) and negative balances (debtors)
+        # Greedy debt netting: the largest debtor pays the largest creditor until one
+        # of them is settled, then moves on to the next one. Each pair is visited once
         creditors = [(uid, bal) for uid, bal in balances.items() if bal.amount > 0]
         debtors = [(uid, bal) for uid, bal in balances.items() if bal.amount < 0]
 
@@ -100,26 +142,27 @@ class BudgetWithExpenses:
         creditors.sort(key=lambda x: x[1].amount, reverse=True)
         debtors.sort(key=lambda x: x[1].amount)  # Most negative first
 
+        debts = []
+        creditor_index = 0
+        creditor_remaining = creditors[0][1].amount if creditors else Decimal("0")
         for debtor_id, debtor_balance in debtors:
-            debtor_amount = abs(debtor_balance.amount)
-
-            for creditor_id, creditor_balance in creditors:
-                if debtor_amount <= 0:
-                    break
-
-                creditor_amount = creditor_balance.amount
-                if creditor_amount <= 0:
-                    continue
-
-                debt_amount = min(debtor_amount, creditor_amount)
-
-                if debt_amount > 0:
-                    debts.append({
-                        "from_user_id": debtor_id,
-                        "to_user_id": creditor_id,
-                        "amount": Money(debt_amount, debtor_balance.currency)
-                    })
-
-                debtor_amount -= debt_amount
-
-        return debts
\ No newline at end of file
+            debtor_remaining = abs(debtor_balance.amount)
+
+            while debtor_remaining > 0 and creditor_index < len(creditors):
+                creditor_id = creditors[creditor_index][0]
+                debt_amount = min(debtor_remaining, creditor_remaining)
+
+                debts.append({
+                    "from_user_id": debtor_id,
+                    "to_user_id": creditor_id,
+                    "amount": Money(debt_amount, debtor_balance.currency)
+                })
+
+                debtor_remaining -= debt_amount
+                creditor_remaining -= debt_amount
+                if creditor_remaining <= 0:
+                    creditor_index += 1
+                    if creditor_index < len(creditors):
+                        creditor_remaining = creditors[creditor_index][1].amount
+
+        return debts
@@ -16,6 +16,9 @@ class MonthlyStatement:
 
     Invariants:
         start_date < closing_date <= due_date
+
+    row_version is bumped on every update of the stored row and is used to
+    detect concurrent edits (optimistic locking).
     """
 
     id: int | None
@@ -23,6 +26,7 @@ class MonthlyStatement:
     start_date: date
     closing_date: date
     due_date: date
+    row_version: int = 1
 
     def __post_init__(self):
         """Validate invariants after initialization"""
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from datetime import date
 from decimal import Decimal
-from typing import Union
+from typing import Optional, Union
 
 from app.domain.value_objects.dual_money import DualMoney
 from app.domain.value_objects.money import Money, Currency
@@ -27,6 +27,7 @@ class Purchase:
     description: str
     total_amount: Union[DualMoney, Money]  # Accept both for backward compatibility
     installments_count: int
+    exchange_rate_id: Optional[int] = None
 
     def __post_init__(self):
         """Validate invariants after initialization"""
@@ -74,6 +75,13 @@ class Purchase:
         """Allow Purchase to be used in sets/dicts"""
         return hash(self.id) if self.id is not None else id(self)
 
+    def has_currency(self, currency: Currency) -> bool:
+        """Whether the amount is available in the given currency without conversion"""
+        return currency == self.total_amount.primary_currency or (
+            self.total_amount.is_dual_currency()
+            and currency == self.total_amount.secondary_currency
+        )
+
     def get_amount_in_currency(self, currency: Currency) -> Decimal:
         return self.total_amount.in_currency(currency)
 
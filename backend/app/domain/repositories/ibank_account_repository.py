@@ -10,6 +10,11 @@ class IBankAccountRepository(ABC):
         """Retrieve all bank accounts for a specific user"""
         pass
 
+    @abstractmethod
+    def find_by_user_id_checked(self, user_id: int) -> List[BankAccount] | None:
+        """Retrieve all bank accounts for a specific user, or None if the user does not exist"""
+        pass
+
     @abstractmethod
     def find_by_id(self, account_id: int) -> BankAccount | None:
         """Retrieve bank account by ID"""
@@ -1,7 +1,10 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from app.domain.entities.budget_expense import BudgetExpense
+from app.domain.entities.budget_participant import BudgetParticipant
+from app.domain.entities.monthly_budget import MonthlyBudget
+from app.domain.value_objects.split_type import SplitType
 
 
 class IBudgetExpenseRepository(ABC):
@@ -10,6 +13,20 @@ class IBudgetExpenseRepository(ABC):
         """Retrieve budget expense by ID"""
         pass
 
+    @abstractmethod
+    def load_for_removal(
+        self, expense_id: int, user_id: int
+    ) -> Optional[Tuple[BudgetExpense, Optional[MonthlyBudget], bool]]:
+        """Retrieve an expense with its budget and whether the user participates in it, or None if not found"""
+        pass
+
+    @abstractmethod
+    def load_for_update(
+        self, expense_id: int
+    ) -> Optional[Tuple[BudgetExpense, Optional[MonthlyBudget], List[BudgetParticipant]]]:
+        """Retrieve an expense with its budget and all the budget participants, or None if not found"""
+        pass
+
     @abstractmethod
     def find_by_budget_id(self, budget_id: int) -> List[BudgetExpense]:
         """Find all expenses for a specific budget"""
@@ -38,4 +55,19 @@ class IBudgetExpenseRepository(ABC):
     @abstractmethod
     def delete(self, expense_id: int) -> None:
         """Delete budget expense by ID"""
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def update_split_type(self, expense_id: int, split_type: SplitType) -> None:
+        """Change only the split type of a budget expense"""
+        pass
+
+    @abstractmethod
+    def delete_with_responsibilities(self, expense_id: int) -> None:
+        """Delete budget expense by ID together with its responsibilities"""
+        pass
+
+    @abstractmethod
+    def delete_by_purchase_installments(self, purchase_id: int) -> None:
+        """Delete the expenses of a purchase's installments together with their responsibilities"""
+        pass
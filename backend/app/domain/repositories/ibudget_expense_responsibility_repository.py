@@ -46,4 +46,11 @@ class IBudgetExpenseResponsibilityRepository(ABC):
     @abstractmethod
     def delete_by_budget_expense_id(self, budget_expense_id: int) -> None:
         """Delete all responsibilities for a specific budget expense"""
+        pass
+
+    @abstractmethod
+    def replace_for_expense(
+        self, budget_expense_id: int, responsibilities: List[BudgetExpenseResponsibility]
+    ) -> None:
+        """Replace all responsibilities of a budget expense with the given ones"""
         pass
\ No newline at end of file
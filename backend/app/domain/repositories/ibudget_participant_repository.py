@@ -1,7 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from app.domain.entities.budget_participant import BudgetParticipant
+from app.domain.entities.user import User
 
 
 class IBudgetParticipantRepository(ABC):
@@ -15,6 +16,11 @@ class IBudgetParticipantRepository(ABC):
         """Find all participants for a specific budget"""
         pass
 
+    @abstractmethod
+    def find_by_budget_id_with_users(self, budget_id: int) -> List[Tuple[BudgetParticipant, User]]:
+        """Find the participants of a budget paired with their active users"""
+        pass
+
     @abstractmethod
     def find_by_user_id(self, user_id: int) -> List[BudgetParticipant]:
         """Find all budgets where a user is a participant"""
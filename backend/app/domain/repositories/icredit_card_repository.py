@@ -15,6 +15,17 @@ class ICreditCardRepository(ABC):
         """Retrieve all credit cards for a specific user"""
         pass
 
+    @abstractmethod
+    def find_by_payment_method_id(
+        self, payment_method_id: int, lock: bool = False
+    ) -> Optional[CreditCard]:
+        """Retrieve credit card by payment method ID.
+
+        If lock is True, the row is locked (SELECT ... FOR UPDATE) until the
+        current transaction ends.
+        """
+        pass
+
     @abstractmethod
     def save(self, card: CreditCard) -> CreditCard:
         """Insert or update credit card"""
@@ -66,6 +66,11 @@ class IExchangeRateRepository(ABC):
         """Save or update an exchange rate entity."""
         pass
 
+    @abstractmethod
+    def add(self, rate: ExchangeRate) -> int:
+        """Insert a new exchange rate and return its ID."""
+        pass
+
     @abstractmethod
     def delete(self, rate_id: int) -> None:
         """Delete an exchange rate by its ID."""
@@ -78,6 +83,8 @@ class IExchangeRateRepository(ABC):
         to_currency: Optional[Currency] = None,
         rate_type: Optional[ExchangeRateType] = None,
         user_id: Optional[int] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
     ) -> List[ExchangeRate]:
-        """List all exchange rates, optionally filtered by currency, type, or user."""
+        """List all exchange rates, optionally filtered by currency, type, user, or date range."""
         pass
\ No newline at end of file
@@ -1,7 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
+from app.domain.entities.credit_card import CreditCard
 from app.domain.entities.installment import Installment
+from app.domain.entities.purchase import Purchase
 
 
 class IInstallmentRepository(ABC):
@@ -10,9 +12,31 @@ class IInstallmentRepository(ABC):
         """Retrieve installment by ID"""
         pass
 
+    @abstractmethod
+    def load_for_update(
+        self, installment_id: int
+    ) -> Optional[Tuple[Installment, Optional[Purchase], Optional[CreditCard]]]:
+        """Retrieve an installment with its purchase and the purchase's credit card, or None if not found"""
+        pass
+
     @abstractmethod
     def find_by_purchase_id(self, purchase_id: int) -> List[Installment]:
-        """Retrieve all installments for a specific purchase"""
+        """Retrieve all installments for a specific purchase, ordered by installment number"""
+        pass
+
+    @abstractmethod
+    def find_by_ids(self, installment_ids: List[int]) -> List[Installment]:
+        """Retrieve all installments matching the given IDs"""
+        pass
+
+    @abstractmethod
+    def find_by_purchase_ids(self, purchase_ids: List[int]) -> List[Installment]:
+        """Retrieve all installments of the given purchases, ordered by purchase and installment number"""
+        pass
+
+    @abstractmethod
+    def count_by_purchase_id(self, purchase_id: int) -> int:
+        """Count installments for a specific purchase"""
         pass
 
     @abstractmethod
@@ -37,7 +61,30 @@ class IInstallmentRepository(ABC):
         """Insert or update multiple installments (bulk operation)"""
         pass
 
+    @abstractmethod
+    def update_by_purchase_and_number(self, installment: Installment) -> bool:
+        """Overwrite the stored installment with the same purchase and number. Returns False if there is none"""
+        pass
+
+    @abstractmethod
+    def bulk_update_billing_period(self, purchase_ids: List[int], old_period: str, new_period: str) -> int:
+        """Move the given purchases' installments from one billing period to another. Returns the number of updated installments"""
+        pass
+
+    @abstractmethod
+    def bulk_assign_statement(
+        self, installment_ids: List[int], statement_id: int, current_statement_id: Optional[int] = None
+    ) -> int:
+        """Assign the given installments to a statement if they are unassigned or assigned to current_statement_id.
+        Returns the number of updated installments"""
+        pass
+
     @abstractmethod
     def delete(self, installment_id: int) -> bool:
         """Delete installment by ID. Returns True if deleted, False if not found"""
         pass
+
+    @abstractmethod
+    def delete_by_purchase_id(self, purchase_id: int) -> int:
+        """Delete all installments of a purchase. Returns the number of deleted installments"""
+        pass
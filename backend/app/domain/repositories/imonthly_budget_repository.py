@@ -1,7 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from app.domain.entities.monthly_budget import MonthlyBudget
+from app.domain.entities.budget_with_expenses import BudgetWithExpenses
 
 
 class IMonthlyBudgetRepository(ABC):
@@ -20,6 +21,18 @@ class IMonthlyBudgetRepository(ABC):
         """Find all budgets where user is a participant"""
         pass
 
+    @abstractmethod
+    def find_by_user_participant_with_counts(self, user_id: int) -> List[Tuple[MonthlyBudget, int]]:
+        """Find all budgets where user is a participant, each with its participant count"""
+        pass
+
+    @abstractmethod
+    def find_with_expenses(
+        self, budget_id: int, participant_user_id: Optional[int] = None
+    ) -> Optional[BudgetWithExpenses]:
+        """Retrieve a budget with all its expenses and responsibilities, optionally only if the user is a participant"""
+        pass
+
     @abstractmethod
     def save(self, budget: MonthlyBudget) -> MonthlyBudget:
         """Insert or update monthly budget"""
@@ -3,6 +3,7 @@
 from abc import ABC, abstractmethod
 from datetime import date
 
+from app.domain.entities.credit_card import CreditCard
 from app.domain.entities.monthly_statement import MonthlyStatement
 
 
@@ -21,6 +22,37 @@ class IMonthlyStatementRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def find_with_credit_card(
+        self, statement_id: int
+    ) -> tuple[MonthlyStatement, CreditCard] | None:
+        """Find a monthly statement together with its credit card.
+
+        Args:
+            statement_id: The statement's ID
+
+        Returns:
+            The (statement, credit card) pair if found, None otherwise
+        """
+        pass
+
+    @abstractmethod
+    def find_by_credit_card_for_user(
+        self, credit_card_id: int, user_id: int, include_future: bool = False
+    ) -> tuple[CreditCard | None, list[MonthlyStatement]]:
+        """Find a credit card together with its statements if it belongs to the user.
+
+        Args:
+            credit_card_id: The credit card's ID
+            user_id: The user's ID
+            include_future: Whether to include statements with future payment dates
+
+        Returns:
+            The credit card (None if not found) and its statements ordered by
+            due_date ascending, empty if the card belongs to another user
+        """
+        pass
+
     @abstractmethod
     def find_by_credit_card_id(
         self, credit_card_id: int, include_future: bool = False
@@ -32,7 +64,7 @@ class IMonthlyStatementRepository(ABC):
             include_future: Whether to include statements with future payment dates
 
         Returns:
-            List of monthly statements ordered by due_date descending
+            List of monthly statements ordered by due_date ascending
         """
         pass
 
@@ -63,6 +95,22 @@ class IMonthlyStatementRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def save_if_unchanged(self, statement: MonthlyStatement) -> MonthlyStatement | None:
+        """Update an existing statement only if it has not changed since it was read.
+
+        The stored row is updated only while its row_version still equals the
+        statement's row_version, and the version is bumped in the same UPDATE.
+
+        Args:
+            statement: The monthly statement to save, as read plus the changes
+
+        Returns:
+            The saved monthly statement with its new row_version, or None if
+            another writer updated or deleted it first
+        """
+        pass
+
     @abstractmethod
     def get_previous_statement(
         self, credit_card_id: int, closing_date: date
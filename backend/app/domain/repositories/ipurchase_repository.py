@@ -1,6 +1,10 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import date
+from typing import List, Optional, Tuple
 
+from app.domain.entities.credit_card import CreditCard
+from app.domain.entities.installment import Installment
+from app.domain.entities.payment_method import PaymentMethod
 from app.domain.entities.purchase import Purchase
 
 
@@ -10,14 +14,53 @@ class IPurchaseRepository(ABC):
         """Retrieve purchase by ID"""
         pass
 
+    @abstractmethod
+    def find_by_id_and_user(self, purchase_id: int, user_id: int) -> Optional[Purchase]:
+        """Retrieve purchase by ID if it belongs to the user"""
+        pass
+
+    @abstractmethod
+    def load_for_update(
+        self, purchase_id: int, user_id: int
+    ) -> Optional[Tuple[Purchase, Optional[PaymentMethod], Optional[CreditCard]]]:
+        """Retrieve a user's purchase with its payment method and that method's credit card, or None if not found"""
+        pass
+
     @abstractmethod
     def find_by_user_id(self, user_id: int) -> List[Purchase]:
-        """Retrieve all purchases for a specific user"""
+        """Retrieve all purchases for a specific user, most recent first"""
+        pass
+
+    @abstractmethod
+    def find_by_user_and_category(self, user_id: int, category_id: int) -> List[Purchase]:
+        """Retrieve a user's purchases in a category, most recent first"""
+        pass
+
+    @abstractmethod
+    def find_by_user_and_date_range(
+        self,
+        user_id: int,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> List[Purchase]:
+        """Retrieve purchases for a user within an (inclusive, optionally open-ended) date range, most recent first"""
         pass
 
     @abstractmethod
     def find_by_payment_method_id(self, payment_method_id: int) -> List[Purchase]:
-        """Retrieve all purchases for a specific payment method"""
+        """Retrieve all purchases for a specific payment method, most recent first"""
+        pass
+
+    @abstractmethod
+    def find_statement_rows(
+        self, payment_method_id: int, statement_id: int, period: str
+    ) -> List[Tuple[Purchase, Installment, Optional[str]]]:
+        """
+        Retrieve (purchase, installment, category name) rows for a statement in one query.
+
+        An installment belongs to the statement if it is manually assigned to it,
+        or billed in its period and not manually assigned elsewhere.
+        """
         pass
 
     @abstractmethod
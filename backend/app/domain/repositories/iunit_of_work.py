@@ -44,6 +44,10 @@ class IUnitOfWork(ABC):
     def __exit__(self, exc_type, exc_val, exc_tb):
         pass
 
+    def readonly(self) -> "IUnitOfWork":
+        """Context manager that enters the unit of work for reads only, without a transaction"""
+        return self
+
     @abstractmethod
     def commit(self):
         pass
@@ -9,6 +9,11 @@ class IUserRepository(ABC):
         """Retrieve user by ID"""
         pass
 
+    @abstractmethod
+    def find_by_ids(self, user_ids: List[int]) -> List[User]:
+        """Retrieve all users matching the given IDs"""
+        pass
+
     @abstractmethod
     def find_all(self) -> List[User]:
         """Retrieve all users"""
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Dict, Optional, Tuple
 from datetime import date
 from decimal import Decimal
 from app.domain.entities.exchange_rate import ExchangeRate
@@ -9,13 +9,19 @@ from app.domain.value_objects.money import Currency, Money
 
 
 class CurrencyConverter:
-    """Converts amounts between different currencies using exchange rates."""
+    """
+    Converts amounts between different currencies using exchange rates.
+
+    Resolved rates are cached per (date, currencies, type, user), so converting
+    many amounts that share a date only looks the rate up once.
+    """
 
     def __init__(
         self,
         exchange_rate_finder: ExchangeRateFinder,
     ):
         self.rate_finder = exchange_rate_finder
+        self._rate_cache: Dict[Tuple, Optional[ExchangeRate]] = {}
 
     def convert(
         self,
@@ -23,17 +29,17 @@ class CurrencyConverter:
         from_currency: Currency,
         to_currency: Currency,
         reference_date: date,
-        preffered_rate_type: Optional[ExchangeRateType] = None,
+        preferred_rate_type: Optional[ExchangeRateType] = None,
         user_id: Optional[int] = None,
     ) -> tuple[Decimal, Optional[ExchangeRate]]:
         if from_currency == to_currency:
             return (amount, None)
 
-        rate = self.rate_finder.find_best_rate(
+        rate = self._find_rate(
             reference_date,
             from_currency if from_currency == Currency.USD else to_currency,
             to_currency if from_currency == Currency.USD else from_currency,
-            preffered_rate_type,
+            preferred_rate_type,
             user_id,
         )
 
@@ -45,6 +51,25 @@ class CurrencyConverter:
         converted = rate.convert(amount, from_currency)
         return (converted, rate)
 
+    def _find_rate(
+        self,
+        reference_date: date,
+        from_currency: Currency,
+        to_currency: Currency,
+        preferred_rate_type: Optional[ExchangeRateType],
+        user_id: Optional[int],
+    ) -> Optional[ExchangeRate]:
+        key = (reference_date, from_currency, to_currency, preferred_rate_type, user_id)
+        if key not in self._rate_cache:
+            self._rate_cache[key] = self.rate_finder.find_exchange_rate(
+                date=reference_date,
+                from_currency=from_currency,
+                to_currency=to_currency,
+                preferred_type=preferred_rate_type,
+                user_id=user_id,
+            )
+        return self._rate_cache[key]
+
     def convert_money(
         self,
         money: Money,
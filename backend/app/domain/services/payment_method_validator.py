@@ -6,6 +6,9 @@ class PaymentMethodValidator:
     # Validate that only credit cards can have installments >= 1
     @staticmethod
     def validate_installments(payment_method: PaymentMethod, installments_count: int) -> bool:
+        # Single installment is valid for every payment method type
+        if installments_count == 1:
+            return True
         return not (
             installments_count > 1
             and payment_method.type != PaymentMethodType.CREDIT_CARD
@@ -11,6 +11,9 @@ from app.domain.value_objects.percentage import Percentage
 from app.domain.value_objects.split_type import SplitType
 from app.domain.exceptions.domain_exceptions import InvalidCalculation
 
+_CENT = Decimal("0.01")
+_HUNDRED = Decimal("100")
+
 
 class ResponsibilityCalculator:
     """
@@ -141,27 +144,28 @@ class ResponsibilityCalculator:
         # Build income map
         income_map = {income.user_id: income for income in incomes}
 
-        # Check if we need to use wages as fallback
-        use_wages_for_missing = False
-        for participant in participants:
-            if participant.id not in income_map:
-                use_wages_for_missing = True
-                break
-        
-        # If using wages, create synthetic incomes from wages
-        if use_wages_for_missing:
+        # Participants without an income fall back to their wage; report every one lacking both
+        missing_income = [participant for participant in participants if participant.id not in income_map]
+        if missing_income:
+            without_wage = [
+                participant.id for participant in missing_income
+                if participant.wage is None or participant.wage.amount <= 0
+            ]
+            if len(without_wage) == 1:
+                raise InvalidCalculation(
+                    f"User {without_wage[0]} has no monthly income and no wage defined"
+                )
+            if without_wage:
+                raise InvalidCalculation(
+                    f"Users {', '.join(map(str, without_wage))} have no monthly income and no wage defined"
+                )
+
+            # Create synthetic incomes from wages
             synthetic_incomes = []
             for participant in participants:
                 if participant.id in income_map:
                     synthetic_incomes.append(income_map[participant.id])
                 else:
-                    # Use wage as fallback
-                    if participant.wage is None or participant.wage.amount <= 0:
-                        raise InvalidCalculation(
-                            f"User {participant.id} has no monthly income and no wage defined"
-                        )
-                    # Create a synthetic MonthlyIncome from wage
-                    from app.domain.entities.monthly_income import MonthlyIncome
                     synthetic_income = MonthlyIncome(
                         id=None,
                         user_id=participant.id,
@@ -222,10 +226,15 @@ class ResponsibilityCalculator:
                 f"Custom percentages must sum to 100%, got {total_percentage}%"
             )
 
+        # Dividing by 100 only shifts the exponent, so it is done once for all participants
+        amount_per_percent = amount.amount / _HUNDRED
         responsibilities = []
         for user in participants:
             percentage = custom_percentages[user.id]
-            responsible_amount = self._calculate_amount_from_percentage(amount, percentage)
+            responsible_amount = Money(
+                (amount_per_percent * percentage).quantize(_CENT, rounding=ROUND_HALF_UP),
+                amount.currency,
+            )
 
             responsibilities.append(BudgetExpenseResponsibility(
                 id=None,
@@ -276,7 +285,7 @@ class ResponsibilityCalculator:
 
     def _calculate_amount_from_percentage(self, total_amount: Money, percentage: Decimal) -> Money:
         """Calculate amount for a given percentage of total"""
-        amount = (total_amount.amount * percentage / Decimal("100")).quantize(
-            Decimal("0.01"), rounding=ROUND_HALF_UP
+        amount = (total_amount.amount * percentage / _HUNDRED).quantize(
+            _CENT, rounding=ROUND_HALF_UP
         )
         return Money(amount, total_amount.currency)
\ No newline at end of file
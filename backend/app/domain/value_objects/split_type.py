@@ -1,8 +1,22 @@
 from enum import StrEnum, auto
+from typing import Optional
 
 
 class SplitType(StrEnum):
     EQUAL = auto()              # 50/50 (o partes iguales si >2 personas)
     PROPORTIONAL = auto()       # Según ingresos mensuales
     CUSTOM = auto()             # Porcentajes personalizados
-    FULL_SINGLE = auto()        # 100% una persona, 0% las demás
\ No newline at end of file
+    FULL_SINGLE = auto()        # 100% una persona, 0% las demás
+
+    @classmethod
+    def from_value(cls, value: str) -> Optional["SplitType"]:
+        """Return the split type with the given value, or None if there is none"""
+        try:
+            return cls(value)
+        except ValueError:
+            return None
+
+    @classmethod
+    def values_display(cls) -> str:
+        """Return the valid values as a comma-separated list, for error messages"""
+        return ", ".join(member.value for member in cls)
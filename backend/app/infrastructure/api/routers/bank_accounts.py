@@ -4,7 +4,6 @@ from app.application.dtos.bank_account_dto import (
     CreateBankAccountInputDTO,
 )
 from app.application.exceptions.application_exceptions import UserNotFoundError
-from app.application.mappers.bank_account_mapper import BankAccountDTOMapper
 from app.application.use_cases.create_bank_account_use_case import (
     CreateBankAccountUseCase,
 )
@@ -67,8 +66,7 @@ def create_bank_account(
     """
     try:
         use_case = CreateBankAccountUseCase(uow)
-        bank_account = use_case.execute(bank_account_data)
-        return BankAccountDTOMapper.to_response_dto(bank_account)
+        return use_case.execute(bank_account_data)
     except UserNotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
     except (ValueError, BankAccountNameError, BankAccountUserError) as e:
@@ -98,7 +96,6 @@ def list_bank_accounts_by_user_id(
     """
     try:
         use_case = ListBankAccountsUseCase(uow)
-        bank_accounts = use_case.execute(user_id)
-        return [BankAccountDTOMapper.to_response_dto(ba) for ba in bank_accounts]
+        return use_case.execute(user_id)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -4,7 +4,6 @@ from app.application.dtos.cash_account_dto import (
     CreateCashAccountInputDTO,
 )
 from app.application.exceptions.application_exceptions import UserNotFoundError
-from app.application.mappers.cash_account_mapper import CashAccountDTOMapper
 from app.application.use_cases.create_cash_account_use_case import (
     CreateCashAccountUseCase,
 )
@@ -68,8 +67,7 @@ def create_cash_account(
     """
     try:
         use_case = CreateCashAccountUseCase(uow)
-        cash_account = use_case.execute(cash_account_data)
-        return CashAccountDTOMapper.to_response_dto(cash_account)
+        return use_case.execute(cash_account_data)
     except UserNotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
     except ValueError as e:
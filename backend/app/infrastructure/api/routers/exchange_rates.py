@@ -14,6 +14,7 @@ from app.application.use_cases.get_latest_exchange_rate_use_case import (
     GetLatestExchangeRateUseCase,
     GetLatestExchangeRateQuery,
 )
+from app.application.services.ttl_cache import latest_exchange_rate_cache
 from app.application.dtos.exchange_rate_dto import (
     CreateExchangeRateInputDTO,
     ExchangeRateResponseDTO,
@@ -242,6 +243,7 @@ def delete_exchange_rate(
             # Delete the rate
             uow.exchange_rates.delete(rate_id)
             uow.commit()
+            latest_exchange_rate_cache.clear()
 
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
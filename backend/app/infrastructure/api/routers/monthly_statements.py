@@ -35,6 +35,7 @@ from app.application.exceptions.application_exceptions import (
     CreditCardOwnerMismatchError,
     MonthlyStatementNotFoundError,
     BusinessRuleViolationError,
+    ConcurrentUpdateError,
 )
 from app.domain.repositories.iunit_of_work import IUnitOfWork
 from app.infrastructure.api.dependencies import get_unit_of_work
@@ -96,10 +97,7 @@ def get_statement_detail(
     with uow:
         use_case = GetStatementDetailUseCase(
             uow.monthly_statements,
-            uow.credit_cards,
             uow.purchases,
-            uow.categories,
-            uow.installments,
         )
         result = use_case.execute(statement_id, user_id)
 
@@ -154,6 +152,7 @@ def create_statement(
         200: {"description": "Statement dates updated successfully"},
         400: {"description": "Invalid dates (close_date > due_date)"},
         404: {"description": "Statement not found or not authorized"},
+        409: {"description": "Statement was modified concurrently, retry the request"},
     },
 )
 def update_statement_dates(
@@ -183,6 +182,12 @@ def update_statement_dates(
                 )
             uow.commit()
             return result
+        except ConcurrentUpdateError as e:
+            uow.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=str(e),
+            )
         except ValueError as e:
             uow.rollback()
             raise HTTPException(
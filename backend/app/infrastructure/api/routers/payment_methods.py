@@ -42,10 +42,9 @@ def list_payment_methods(
         # Return all payment methods from all users
         with uow:
             payment_methods_entities = uow.payment_methods.find_all()
-            payment_methods = [
-                PaymentMethodDTOMapper.to_response_dto(pm) 
-                for pm in payment_methods_entities
-            ]
+            payment_methods = PaymentMethodDTOMapper.to_response_dto_many(
+                payment_methods_entities
+            )
 
     return payment_methods
 
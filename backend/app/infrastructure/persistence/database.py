@@ -4,10 +4,12 @@ from sqlalchemy.orm import sessionmaker, Session
 from typing import Generator
 
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./cashdata.db")
+# Logging every statement costs a write per query; opt in when debugging
+SQL_ECHO = os.getenv("SQL_ECHO", "false").lower() == "true"
 
 engine = create_engine(
     DATABASE_URL,
-    echo=True,
+    echo=SQL_ECHO,
     connect_args={"check_same_thread": False} if DATABASE_URL.startswith("sqlite") else {}
 )
 
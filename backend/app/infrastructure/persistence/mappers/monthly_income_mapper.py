@@ -12,7 +12,7 @@ class MonthlyIncomeMapper:
         return MonthlyIncome(
             id=model.id,
             user_id= model.user_id,
-            period=Period.from_string(f"{model.period_year}{model.period_month:02d}"),
+            period=Period(model.period_year, model.period_month),
             amount=Money(Decimal(f"{model.amount_value}"), Currency(model.amount_currency)),
             source=IncomeSource(model.source)
         )
@@ -25,6 +25,7 @@ class MonthlyStatementMapper:
             start_date=model.start_date,
             closing_date=model.closing_date,
             due_date=model.due_date,
+            row_version=model.row_version,
         )
 
     @staticmethod
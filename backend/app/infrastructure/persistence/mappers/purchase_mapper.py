@@ -52,6 +52,7 @@ class PurchaseMapper:
             description=model.description,
             total_amount=total_amount,
             installments_count=model.installments_count,
+            exchange_rate_id=model.exchange_rate_id,
         )
 
     @staticmethod
@@ -65,7 +66,7 @@ class PurchaseMapper:
         if entity.total_amount.is_dual_currency():
             original_currency = entity.total_amount.secondary_currency.value
             original_amount = float(entity.total_amount.secondary_amount)
-            # Note: exchange_rate_id should be set by the use case/service layer
+            exchange_rate_id = entity.exchange_rate_id
         
         return PurchaseModel(
             id=entity.id,
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Numeric, Date, ForeignKey
+from sqlalchemy import Column, Integer, String, Numeric, Date, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from app.infrastructure.persistence.models.base import Base
 
@@ -22,6 +22,9 @@ class InstallmentModel(Base):
     original_amount = Column(Numeric(precision=12, scale=2), nullable=True)
     exchange_rate_id = Column(Integer, ForeignKey("exchange_rates.id"), nullable=True)
 
+    __table_args__ = (
+        Index("ix_installments_purchase_number", "purchase_id", "installment_number"),
+    )
 
     # Relationships
     budget_expenses = relationship("BudgetExpenseModel", back_populates="installment")
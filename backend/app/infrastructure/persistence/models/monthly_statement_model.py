@@ -1,4 +1,4 @@
-from sqlalchemy import CheckConstraint, Column, Integer, Date, ForeignKey
+from sqlalchemy import CheckConstraint, Column, Integer, Date, ForeignKey, Index
 from app.infrastructure.persistence.models.base import Base
 
 
@@ -12,14 +12,19 @@ class MonthlyStatementModel(Base):
     start_date = Column(Date, nullable=False)
     closing_date = Column(Date, nullable=False)
     due_date = Column(Date, nullable=False)
+    row_version = Column(Integer, nullable=False, server_default="1")
 
     __table_args__ = (
         CheckConstraint(
             "start_date < closing_date AND closing_date <= due_date",
             name="ck_monthly_statements_dates_order",
         ),
+        Index("ix_monthly_statements_credit_card_due_date", "credit_card_id", "due_date"),
     )
 
+    # Every ORM flush of an update checks and bumps row_version
+    __mapper_args__ = {"version_id_col": row_version}
+
     def __repr__(self):
         return (
             f"<MonthlyStatementModel(id={self.id}, "
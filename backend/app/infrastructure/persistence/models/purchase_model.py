@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Numeric, Date, ForeignKey
+from sqlalchemy import Column, Integer, String, Numeric, Date, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from app.infrastructure.persistence.models.base import Base
 
@@ -23,6 +23,12 @@ class PurchaseModel(Base):
     original_amount = Column(Numeric(precision=12, scale=2), nullable=True)
     exchange_rate_id = Column(Integer, ForeignKey("exchange_rates.id"), nullable=True)
 
+    __table_args__ = (
+        Index("ix_purchases_user_date", "user_id", purchase_date.desc()),
+        Index("ix_purchases_payment_method_date", "payment_method_id", purchase_date.desc()),
+        Index("ix_purchases_user_category_date", "user_id", "category_id", purchase_date.desc()),
+    )
+
     # Relationships
     budget_expenses = relationship("BudgetExpenseModel", back_populates="purchase")
 
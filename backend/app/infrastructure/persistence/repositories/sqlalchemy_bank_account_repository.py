@@ -3,6 +3,7 @@ from app.domain.entities.bank_account import BankAccount
 from app.domain.repositories.ibank_account_repository import IBankAccountRepository
 from app.infrastructure.persistence.mappers.bank_account_mapper import BankAccountMapper
 from app.infrastructure.persistence.models.bank_account_model import BankAccountModel
+from app.infrastructure.persistence.models.user_model import UserModel
 from sqlalchemy.orm import Session
 from sqlalchemy import select
 
@@ -20,6 +21,28 @@ class SQLAlchemyBankAccountRepository(IBankAccountRepository):
         ).all()
         return [BankAccountMapper.to_entity(a) for a in accounts]
 
+    def find_by_user_id_checked(self, user_id: int) -> List[BankAccount] | None:
+        """Retrieve all bank accounts for a specific user, or None if the user does not exist"""
+        # The user row comes back even without accounts, so one query answers both
+        # Rows are streamed and mapped one batch at a time instead of being loaded upfront
+        rows = self.session.execute(
+            select(UserModel.id, BankAccountModel)
+            .outerjoin(
+                BankAccountModel,
+                (BankAccountModel.primary_user_id == UserModel.id)
+                | (BankAccountModel.secondary_user_id == UserModel.id),
+            )
+            .where(UserModel.id == user_id, UserModel.is_deleted == False)
+            .execution_options(yield_per=1000)
+        )
+        user_found = False
+        accounts = []
+        for _, account in rows:
+            user_found = True
+            if account is not None:
+                accounts.append(BankAccountMapper.to_entity(account))
+        return accounts if user_found else None
+
     def save(self, bank_account: BankAccount) -> BankAccount:
         """Insert or update bank account"""
         if bank_account.id is not None:
@@ -1,11 +1,20 @@
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import select, delete
+from sqlalchemy import select, delete, exists, update
 
 from app.domain.entities.budget_expense import BudgetExpense
+from app.domain.entities.budget_participant import BudgetParticipant
+from app.domain.entities.monthly_budget import MonthlyBudget
 from app.domain.repositories.ibudget_expense_repository import IBudgetExpenseRepository
+from app.domain.value_objects.split_type import SplitType
 from app.infrastructure.persistence.mappers.budget_expense_mapper import BudgetExpenseMapper
+from app.infrastructure.persistence.mappers.budget_participant_mapper import BudgetParticipantMapper
+from app.infrastructure.persistence.mappers.monthly_budget_mapper import MonthlyBudgetMapper
 from app.infrastructure.persistence.models.budget_expense_model import BudgetExpenseModel
+from app.infrastructure.persistence.models.budget_expense_responsibility_model import BudgetExpenseResponsibilityModel
+from app.infrastructure.persistence.models.budget_participant_model import BudgetParticipantModel
+from app.infrastructure.persistence.models.installment_model import InstallmentModel
+from app.infrastructure.persistence.models.monthly_budget_model import MonthlyBudgetModel
 
 
 class SQLAlchemyBudgetExpenseRepository(IBudgetExpenseRepository):
@@ -19,6 +28,55 @@ class SQLAlchemyBudgetExpenseRepository(IBudgetExpenseRepository):
         ).first()
         return BudgetExpenseMapper.to_entity(expense) if expense else None
 
+    def load_for_removal(
+        self, expense_id: int, user_id: int
+    ) -> Optional[Tuple[BudgetExpense, Optional[MonthlyBudget], bool]]:
+        """Retrieve an expense with its budget and whether the user participates in it, or None if not found"""
+        is_participant = (
+            exists()
+            .where(
+                BudgetParticipantModel.budget_id == BudgetExpenseModel.budget_id,
+                BudgetParticipantModel.user_id == user_id,
+            )
+            .label("is_participant")
+        )
+        row = self.session.execute(
+            select(BudgetExpenseModel, MonthlyBudgetModel, is_participant)
+            .outerjoin(MonthlyBudgetModel, MonthlyBudgetModel.id == BudgetExpenseModel.budget_id)
+            .where(BudgetExpenseModel.id == expense_id)
+        ).first()
+        if not row:
+            return None
+
+        expense, budget, participant = row
+        return (
+            BudgetExpenseMapper.to_entity(expense),
+            MonthlyBudgetMapper.to_entity(budget) if budget else None,
+            bool(participant),
+        )
+
+    def load_for_update(
+        self, expense_id: int
+    ) -> Optional[Tuple[BudgetExpense, Optional[MonthlyBudget], List[BudgetParticipant]]]:
+        """Retrieve an expense with its budget and all the budget participants, or None if not found"""
+        # One row per participant; the expense and budget repeat on each of them
+        rows = self.session.execute(
+            select(BudgetExpenseModel, MonthlyBudgetModel, BudgetParticipantModel)
+            .outerjoin(MonthlyBudgetModel, MonthlyBudgetModel.id == BudgetExpenseModel.budget_id)
+            .outerjoin(BudgetParticipantModel, BudgetParticipantModel.budget_id == MonthlyBudgetModel.id)
+            .where(BudgetExpenseModel.id == expense_id)
+            .order_by(BudgetParticipantModel.id)
+        ).all()
+        if not rows:
+            return None
+
+        expense, budget, _ = rows[0]
+        return (
+            BudgetExpenseMapper.to_entity(expense),
+            MonthlyBudgetMapper.to_entity(budget) if budget else None,
+            [BudgetParticipantMapper.to_entity(p) for _, _, p in rows if p is not None],
+        )
+
     def find_by_budget_id(self, budget_id: int) -> List[BudgetExpense]:
         """Find all expenses for a specific budget"""
         expenses = self.session.scalars(
@@ -81,4 +139,39 @@ class SQLAlchemyBudgetExpenseRepository(IBudgetExpenseRepository):
         if existing:
             # Use ORM delete so SQLAlchemy will cascade to responsibilities (delete-orphan)
             self.session.delete(existing)
-            self.session.flush()
\ No newline at end of file
+            self.session.flush()
+
+    def update_split_type(self, expense_id: int, split_type: SplitType) -> None:
+        """Change only the split type of a budget expense"""
+        # A single UPDATE instead of save()'s full-row flush plus refresh SELECT
+        self.session.execute(
+            update(BudgetExpenseModel)
+            .where(BudgetExpenseModel.id == expense_id)
+            .values(split_type=split_type.value)
+        )
+
+    def delete_with_responsibilities(self, expense_id: int) -> None:
+        """Delete budget expense by ID together with its responsibilities"""
+        # Two bulk DELETEs instead of the ORM cascade's SELECT plus one DELETE per row
+        self.session.execute(
+            delete(BudgetExpenseResponsibilityModel).where(
+                BudgetExpenseResponsibilityModel.budget_expense_id == expense_id
+            )
+        )
+        self.session.execute(
+            delete(BudgetExpenseModel).where(BudgetExpenseModel.id == expense_id)
+        )
+
+    def delete_by_purchase_installments(self, purchase_id: int) -> None:
+        """Delete the expenses of a purchase's installments together with their responsibilities"""
+        installment_ids = select(InstallmentModel.id).where(InstallmentModel.purchase_id == purchase_id)
+        # Bulk DELETEs instead of loading and deleting each expense
+        expense_ids = select(BudgetExpenseModel.id).where(BudgetExpenseModel.installment_id.in_(installment_ids))
+        self.session.execute(
+            delete(BudgetExpenseResponsibilityModel).where(
+                BudgetExpenseResponsibilityModel.budget_expense_id.in_(expense_ids)
+            )
+        )
+        self.session.execute(
+            delete(BudgetExpenseModel).where(BudgetExpenseModel.installment_id.in_(installment_ids))
+        )
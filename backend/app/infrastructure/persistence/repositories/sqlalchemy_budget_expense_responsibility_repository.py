@@ -1,6 +1,6 @@
 from typing import Dict, List, Optional
 from sqlalchemy.orm import Session
-from sqlalchemy import select, delete
+from sqlalchemy import select, delete, insert
 
 from app.domain.entities.budget_expense_responsibility import BudgetExpenseResponsibility
 from app.domain.repositories.ibudget_expense_responsibility_repository import IBudgetExpenseResponsibilityRepository
@@ -97,4 +97,26 @@ class SQLAlchemyBudgetExpenseResponsibilityRepository(IBudgetExpenseResponsibili
         """Delete all responsibilities for a specific budget expense"""
         self.session.execute(
             delete(BudgetExpenseResponsibilityModel).where(BudgetExpenseResponsibilityModel.budget_expense_id == budget_expense_id)
+        )
+
+    def replace_for_expense(
+        self, budget_expense_id: int, responsibilities: List[BudgetExpenseResponsibility]
+    ) -> None:
+        """Replace all responsibilities of a budget expense with the given ones"""
+        self.delete_by_budget_expense_id(budget_expense_id)
+        if not responsibilities:
+            return
+        # One multi-row INSERT instead of a merge/flush/refresh per row
+        self.session.execute(
+            insert(BudgetExpenseResponsibilityModel),
+            [
+                {
+                    "budget_expense_id": budget_expense_id,
+                    "user_id": r.user_id,
+                    "percentage": r.percentage,
+                    "responsible_amount": r.responsible_amount.amount,
+                    "responsible_currency": r.responsible_amount.currency,
+                }
+                for r in responsibilities
+            ],
         )
\ No newline at end of file
@@ -1,11 +1,14 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from sqlalchemy.orm import Session
 from sqlalchemy import select, delete, and_
 
 from app.domain.entities.budget_participant import BudgetParticipant
+from app.domain.entities.user import User
 from app.domain.repositories.ibudget_participant_repository import IBudgetParticipantRepository
 from app.infrastructure.persistence.mappers.budget_participant_mapper import BudgetParticipantMapper
+from app.infrastructure.persistence.mappers.user_mapper import UserMapper
 from app.infrastructure.persistence.models.budget_participant_model import BudgetParticipantModel
+from app.infrastructure.persistence.models.user_model import UserModel
 
 
 class SQLAlchemyBudgetParticipantRepository(IBudgetParticipantRepository):
@@ -26,6 +29,22 @@ class SQLAlchemyBudgetParticipantRepository(IBudgetParticipantRepository):
         ).all()
         return [BudgetParticipantMapper.to_entity(p) for p in participants]
 
+    def find_by_budget_id_with_users(self, budget_id: int) -> List[Tuple[BudgetParticipant, User]]:
+        """Find the participants of a budget paired with their active users"""
+        rows = self.session.execute(
+            select(BudgetParticipantModel, UserModel)
+            .join(UserModel, UserModel.id == BudgetParticipantModel.user_id)
+            .where(
+                BudgetParticipantModel.budget_id == budget_id,
+                UserModel.is_deleted == False,
+            )
+            .order_by(BudgetParticipantModel.id)
+        ).all()
+        return [
+            (BudgetParticipantMapper.to_entity(participant), UserMapper.to_entity(user))
+            for participant, user in rows
+        ]
+
     def find_by_user_id(self, user_id: int) -> List[BudgetParticipant]:
         """Find all budgets where a user is a participant"""
         participants = self.session.scalars(
@@ -13,9 +13,12 @@ class SQLAlchemyCashAccountRepository(ICashAccountRepository):
         self.session = session
 
     def find_by_user_id(self, user_id: int) -> List[CashAccount]:
+        # Streamed so ORM rows and entities are never both fully loaded
         cash = self.session.scalars(
-            select(CashAccountModel).where(CashAccountModel.user_id == user_id)
-        ).all()
+            select(CashAccountModel)
+            .where(CashAccountModel.user_id == user_id)
+            .execution_options(yield_per=1000)
+        )
         return [CashAccountMapper.to_entity(c) for c in cash]
 
     def find_by_id(self, account_id: int) -> CashAccount | None:
@@ -67,7 +70,9 @@ class SQLAlchemyCashAccountRepository(ICashAccountRepository):
 
     def find_all(self) -> List[CashAccount]:
         """Retrieve all cash accounts"""
-        cash_accounts = self.session.scalars(select(CashAccountModel)).all()
+        cash_accounts = self.session.scalars(
+            select(CashAccountModel).execution_options(yield_per=1000)
+        )
         return [CashAccountMapper.to_entity(c) for c in cash_accounts]
 
     def exists_by_user_id_and_currency(self, user_id: int, currency: str) -> bool:
@@ -28,11 +28,14 @@ class SQLAlchemyCreditCardRepository(ICreditCardRepository):
         ).all()
         return [CreditCardMapper.to_entity(c) for c in cards]
 
-    def find_by_payment_method_id(self, payment_method_id: int) -> Optional[CreditCard]:
-        """Retrieve credit card by payment method ID"""
-        card = self.session.scalars(
-            select(CreditCardModel).where(CreditCardModel.payment_method_id == payment_method_id)
-        ).first()
+    def find_by_payment_method_id(
+        self, payment_method_id: int, lock: bool = False
+    ) -> Optional[CreditCard]:
+        """Retrieve credit card by payment method ID, optionally locking the row"""
+        stmt = select(CreditCardModel).where(CreditCardModel.payment_method_id == payment_method_id)
+        if lock:
+            stmt = stmt.with_for_update()
+        card = self.session.scalars(stmt).first()
         return CreditCardMapper.to_entity(card) if card else None
 
     def save(self, card: CreditCard) -> CreditCard:
@@ -1,7 +1,7 @@
 from datetime import date, timedelta
 from typing import Optional, List
 from sqlalchemy.orm import Session
-from sqlalchemy import select, and_, or_
+from sqlalchemy import insert, select, and_, or_
 
 from app.domain.entities.exchange_rate import ExchangeRate
 from app.domain.repositories.iexchange_rate_repository import IExchangeRateRepository
@@ -135,6 +135,22 @@ class SQLAlchemyExchangeRateRepository(IExchangeRateRepository):
         self.session.refresh(merged_model)
         return ExchangeRateMapper.to_entity(merged_model)
 
+    def add(self, rate: ExchangeRate) -> int:
+        """Insert a new exchange rate and return its ID."""
+        model = ExchangeRateMapper.to_model(rate)
+        values = {
+            column.key: getattr(model, column.key)
+            for column in ExchangeRateModel.__table__.columns
+            if column.key != "id"
+        }
+        if values["created_at"] is None:
+            # Let the server default fill it in
+            del values["created_at"]
+        # One INSERT ... RETURNING, with no flush or refresh of an ORM object
+        return self.session.execute(
+            insert(ExchangeRateModel).values(**values).returning(ExchangeRateModel.id)
+        ).scalar_one()
+
     def delete(self, rate_id: int) -> None:
         """Delete an exchange rate by its ID."""
         model = self.session.get(ExchangeRateModel, rate_id)
@@ -147,8 +163,10 @@ class SQLAlchemyExchangeRateRepository(IExchangeRateRepository):
         to_currency: Optional[Currency] = None,
         rate_type: Optional[ExchangeRateType] = None,
         user_id: Optional[int] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
     ) -> List[ExchangeRate]:
-        """List all exchange rates, optionally filtered by currency, type, or user."""
+        """List all exchange rates, optionally filtered by currency, type, user, or date range."""
         query = select(ExchangeRateModel)
         
         conditions = []
@@ -160,6 +178,10 @@ class SQLAlchemyExchangeRateRepository(IExchangeRateRepository):
             conditions.append(ExchangeRateModel.rate_type == rate_type.value)
         if user_id is not None:
             conditions.append(ExchangeRateModel.created_by_user_id == user_id)
+        if start_date is not None:
+            conditions.append(ExchangeRateModel.date >= start_date)
+        if end_date is not None:
+            conditions.append(ExchangeRateModel.date <= end_date)
         
         if conditions:
             query = query.where(and_(*conditions))
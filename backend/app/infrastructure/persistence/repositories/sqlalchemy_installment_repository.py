@@ -1,12 +1,17 @@
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import select
+from sqlalchemy import delete, func, insert, or_, select, update
 
+from app.domain.entities.credit_card import CreditCard
 from app.domain.entities.installment import Installment
+from app.domain.entities.purchase import Purchase
 from app.domain.repositories.iinstallment_repository import IInstallmentRepository
+from app.infrastructure.persistence.mappers.credit_card_mapper import CreditCardMapper
 from app.infrastructure.persistence.mappers.installment_mapper import (
     InstallmentMapper,
 )
+from app.infrastructure.persistence.mappers.purchase_mapper import PurchaseMapper
+from app.infrastructure.persistence.models.credit_card_model import CreditCardModel
 from app.infrastructure.persistence.models.installment_model import (
     InstallmentModel,
 )
@@ -24,15 +29,63 @@ class SQLAlchemyInstallmentRepository(IInstallmentRepository):
         ).first()
         return InstallmentMapper.to_entity(installment) if installment else None
 
+    def load_for_update(
+        self, installment_id: int
+    ) -> Optional[Tuple[Installment, Optional[Purchase], Optional[CreditCard]]]:
+        """Retrieve an installment with its purchase and the purchase's credit card, or None if not found"""
+        row = self.session.execute(
+            select(InstallmentModel, PurchaseModel, CreditCardModel)
+            .outerjoin(PurchaseModel, PurchaseModel.id == InstallmentModel.purchase_id)
+            .outerjoin(CreditCardModel, CreditCardModel.payment_method_id == PurchaseModel.payment_method_id)
+            .where(InstallmentModel.id == installment_id)
+        ).first()
+        if not row:
+            return None
+
+        installment, purchase, credit_card = row
+        return (
+            InstallmentMapper.to_entity(installment),
+            PurchaseMapper.to_entity(purchase) if purchase else None,
+            CreditCardMapper.to_entity(credit_card) if credit_card else None,
+        )
+
     def find_by_purchase_id(self, purchase_id: int) -> List[Installment]:
-        """Retrieve all installments for a specific purchase"""
+        """Retrieve all installments for a specific purchase, ordered by installment number"""
         installments = self.session.scalars(
-            select(InstallmentModel).where(
-                InstallmentModel.purchase_id == purchase_id
-            )
+            select(InstallmentModel)
+            .where(InstallmentModel.purchase_id == purchase_id)
+            .order_by(InstallmentModel.installment_number)
         ).all()
         return [InstallmentMapper.to_entity(i) for i in installments]
 
+    def find_by_ids(self, installment_ids: List[int]) -> List[Installment]:
+        """Retrieve all installments matching the given IDs in a single query"""
+        if not installment_ids:
+            return []
+        installments = self.session.scalars(
+            select(InstallmentModel).where(InstallmentModel.id.in_(installment_ids))
+        ).all()
+        return [InstallmentMapper.to_entity(i) for i in installments]
+
+    def find_by_purchase_ids(self, purchase_ids: List[int]) -> List[Installment]:
+        """Retrieve all installments of the given purchases in a single query, ordered by purchase and installment number"""
+        if not purchase_ids:
+            return []
+        installments = self.session.scalars(
+            select(InstallmentModel)
+            .where(InstallmentModel.purchase_id.in_(purchase_ids))
+            .order_by(InstallmentModel.purchase_id, InstallmentModel.installment_number)
+        ).all()
+        return [InstallmentMapper.to_entity(i) for i in installments]
+
+    def count_by_purchase_id(self, purchase_id: int) -> int:
+        """Count installments for a specific purchase"""
+        return self.session.scalar(
+            select(func.count())
+            .select_from(InstallmentModel)
+            .where(InstallmentModel.purchase_id == purchase_id)
+        )
+
     def find_by_billing_period(self, period: str) -> List[Installment]:
         """Retrieve all installments for a specific billing period (YYYYMM)"""
         installments = self.session.scalars(
@@ -81,11 +134,88 @@ class SQLAlchemyInstallmentRepository(IInstallmentRepository):
 
     def save_all(self, installments: List[Installment]) -> List[Installment]:
         """Insert or update multiple installments (bulk operation)"""
-        saved_installments = []
+        keys = {(installment.purchase_id, installment.installment_number) for installment in installments}
+        if len(keys) != len(installments) or any(installment.id is not None for installment in installments):
+            return [self.save(installment) for installment in installments]
+        if not installments:
+            return []
+
+        # One batched INSERT ... RETURNING for all new installments
+        columns = [column.key for column in InstallmentModel.__table__.columns if column.key != "id"]
+        rows = []
         for installment in installments:
-            saved = self.save(installment)
-            saved_installments.append(saved)
-        return saved_installments
+            model = InstallmentMapper.to_model(installment)
+            rows.append({column: getattr(model, column) for column in columns})
+        inserted = self.session.scalars(insert(InstallmentModel).returning(InstallmentModel), rows).all()
+
+        # Batched RETURNING rows are not guaranteed to come back in order; match them by purchase and number
+        by_key = {(model.purchase_id, model.installment_number): model for model in inserted}
+        return [
+            InstallmentMapper.to_entity(by_key[(installment.purchase_id, installment.installment_number)])
+            for installment in installments
+        ]
+
+    def update_by_purchase_and_number(self, installment: Installment) -> bool:
+        """Overwrite the stored installment with the same purchase and number. Returns False if there is none"""
+        model = InstallmentMapper.to_model(installment)
+        key_columns = {"id", "purchase_id", "installment_number"}
+        values = {
+            column.key: getattr(model, column.key)
+            for column in InstallmentModel.__table__.columns
+            if column.key not in key_columns
+        }
+        result = self.session.execute(
+            update(InstallmentModel)
+            .where(
+                InstallmentModel.purchase_id == installment.purchase_id,
+                InstallmentModel.installment_number == installment.installment_number,
+            )
+            .values(**values)
+        )
+        return result.rowcount > 0
+
+    def bulk_update_billing_period(self, purchase_ids: List[int], old_period: str, new_period: str) -> int:
+        """Move the given purchases' installments from one billing period to another. Returns the number of updated installments"""
+        if not purchase_ids:
+            return 0
+        # Only billing_period is set, so manual statement assignments are kept
+        result = self.session.execute(
+            update(InstallmentModel)
+            .where(
+                InstallmentModel.purchase_id.in_(purchase_ids),
+                InstallmentModel.billing_period == old_period,
+            )
+            .values(billing_period=new_period)
+        )
+        return result.rowcount
+
+    def bulk_assign_statement(
+        self, installment_ids: List[int], statement_id: int, current_statement_id: Optional[int] = None
+    ) -> int:
+        """Assign the given installments to a statement if they are unassigned or assigned to current_statement_id.
+        Returns the number of updated installments"""
+        if not installment_ids:
+            return 0
+        # The guard is part of the UPDATE, so no installment has to be loaded first
+        assignable = InstallmentModel.manually_assigned_statement_id.is_(None)
+        if current_statement_id is not None:
+            assignable = or_(
+                assignable, InstallmentModel.manually_assigned_statement_id == current_statement_id
+            )
+        result = self.session.execute(
+            update(InstallmentModel)
+            .where(
+                InstallmentModel.id.in_(installment_ids),
+                assignable,
+                # Installments already on the target statement need no write
+                or_(
+                    InstallmentModel.manually_assigned_statement_id.is_(None),
+                    InstallmentModel.manually_assigned_statement_id != statement_id,
+                ),
+            )
+            .values(manually_assigned_statement_id=statement_id)
+        )
+        return result.rowcount
 
     def delete(self, installment_id: int) -> bool:
         """Delete installment by ID. Returns True if deleted, False if not found"""
@@ -95,3 +225,10 @@ class SQLAlchemyInstallmentRepository(IInstallmentRepository):
             self.session.flush()
             return True
         return False
+
+    def delete_by_purchase_id(self, purchase_id: int) -> int:
+        """Delete all installments of a purchase. Returns the number of deleted installments"""
+        result = self.session.execute(
+            delete(InstallmentModel).where(InstallmentModel.purchase_id == purchase_id)
+        )
+        return result.rowcount
@@ -1,10 +1,14 @@
-from typing import Optional, List
-from sqlalchemy.orm import Session
-from sqlalchemy import select, delete
+from typing import Optional, List, Tuple
+from sqlalchemy.orm import Session, raiseload, selectinload
+from sqlalchemy import select, delete, func, exists
 
 from app.domain.entities.monthly_budget import MonthlyBudget
+from app.domain.entities.budget_with_expenses import BudgetWithExpenses
 from app.domain.repositories.imonthly_budget_repository import IMonthlyBudgetRepository
+from app.infrastructure.persistence.mappers.budget_expense_mapper import BudgetExpenseMapper
+from app.infrastructure.persistence.mappers.budget_expense_responsibility_mapper import BudgetExpenseResponsibilityMapper
 from app.infrastructure.persistence.mappers.monthly_budget_mapper import MonthlyBudgetMapper
+from app.infrastructure.persistence.models.budget_expense_model import BudgetExpenseModel
 from app.infrastructure.persistence.models.monthly_budget_model import MonthlyBudgetModel
 
 
@@ -22,7 +26,9 @@ class SQLAlchemyMonthlyBudgetRepository(IMonthlyBudgetRepository):
     def find_all(self) -> List[MonthlyBudget]:
         """Find all budgets ordered by created_at DESC"""
         budgets = self.session.scalars(
-            select(MonthlyBudgetModel).order_by(MonthlyBudgetModel.created_at.desc())
+            select(MonthlyBudgetModel)
+            .order_by(MonthlyBudgetModel.created_at.desc())
+            .options(raiseload("*"))
         ).all()
         return [MonthlyBudgetMapper.to_entity(b) for b in budgets]
 
@@ -36,9 +42,67 @@ class SQLAlchemyMonthlyBudgetRepository(IMonthlyBudgetRepository):
             .where(BudgetParticipantModel.user_id == user_id)
             .order_by(MonthlyBudgetModel.created_at.desc())
             .distinct()
+            .options(raiseload("*"))
         ).all()
         return [MonthlyBudgetMapper.to_entity(b) for b in budgets]
 
+    def find_by_user_participant_with_counts(self, user_id: int) -> List[Tuple[MonthlyBudget, int]]:
+        """Find all budgets where user is a participant, each with its participant count"""
+        from app.infrastructure.persistence.models.budget_participant_model import BudgetParticipantModel
+
+        # Membership is checked with a correlated EXISTS so the join stays free to
+        # count every participant of the budget, not only the requesting user
+        is_participant = exists().where(
+            BudgetParticipantModel.budget_id == MonthlyBudgetModel.id,
+            BudgetParticipantModel.user_id == user_id,
+        )
+        counted = BudgetParticipantModel.__table__.alias("counted_participants")
+        rows = self.session.execute(
+            select(MonthlyBudgetModel, func.count(counted.c.id))
+            .join(counted, MonthlyBudgetModel.id == counted.c.budget_id)
+            .where(is_participant)
+            .group_by(MonthlyBudgetModel.id)
+            .order_by(MonthlyBudgetModel.created_at.desc())
+            .options(raiseload("*"))
+        ).all()
+        return [(MonthlyBudgetMapper.to_entity(budget), count) for budget, count in rows]
+
+    def find_with_expenses(
+        self, budget_id: int, participant_user_id: Optional[int] = None
+    ) -> Optional[BudgetWithExpenses]:
+        """Retrieve a budget with all its expenses and responsibilities, optionally only if the user is a participant"""
+        from app.infrastructure.persistence.models.budget_participant_model import BudgetParticipantModel
+
+        # Expenses and their responsibilities are loaded with one IN query each.
+        # populate_existing makes sure collections already in the session reflect
+        # expenses added or deleted earlier in the same unit of work
+        query = (
+            select(MonthlyBudgetModel)
+            .where(MonthlyBudgetModel.id == budget_id)
+            .options(
+                selectinload(MonthlyBudgetModel.expenses)
+                .selectinload(BudgetExpenseModel.responsibilities)
+            )
+            .execution_options(populate_existing=True)
+        )
+        if participant_user_id is not None:
+            query = query.join(
+                BudgetParticipantModel, MonthlyBudgetModel.id == BudgetParticipantModel.budget_id
+            ).where(BudgetParticipantModel.user_id == participant_user_id)
+
+        budget = self.session.scalars(query).first()
+        if not budget:
+            return None
+
+        return BudgetWithExpenses(
+            budget=MonthlyBudgetMapper.to_entity(budget),
+            expenses=[BudgetExpenseMapper.to_entity(e) for e in budget.expenses],
+            responsibilities={
+                e.id: [BudgetExpenseResponsibilityMapper.to_entity(r) for r in e.responsibilities]
+                for e in budget.expenses
+            },
+        )
+
     def save(self, budget: MonthlyBudget) -> MonthlyBudget:
         """Insert or update monthly budget"""
         if budget.id is not None:
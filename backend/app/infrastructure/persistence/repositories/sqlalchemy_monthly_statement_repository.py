@@ -1,14 +1,17 @@
 """SQLAlchemy implementation of monthly statement repository."""
 
+from dataclasses import replace
 from datetime import date
 
-from sqlalchemy import and_, select
+from sqlalchemy import and_, select, update
 from sqlalchemy.orm import Session
 
+from app.domain.entities.credit_card import CreditCard
 from app.domain.entities.monthly_statement import MonthlyStatement
 from app.domain.repositories.imonthly_statement_repository import (
     IMonthlyStatementRepository,
 )
+from app.infrastructure.persistence.mappers.credit_card_mapper import CreditCardMapper
 from app.infrastructure.persistence.mappers.monthly_statement_mapper import (
     MonthlyStatementMapper,
 )
@@ -37,6 +40,58 @@ class SQLAlchemyMonthlyStatementRepository(IMonthlyStatementRepository):
         model = self._session.execute(stmt).scalar_one_or_none()
         return MonthlyStatementMapper.to_entity(model) if model else None
 
+    def find_with_credit_card(
+        self, statement_id: int
+    ) -> tuple[MonthlyStatement, CreditCard] | None:
+        """Find a monthly statement together with its credit card."""
+        stmt = (
+            select(MonthlyStatementModel, CreditCardModel)
+            .join(
+                CreditCardModel,
+                MonthlyStatementModel.credit_card_id == CreditCardModel.id,
+            )
+            .where(MonthlyStatementModel.id == statement_id)
+        )
+        row = self._session.execute(stmt).first()
+        if not row:
+            return None
+        statement_model, card_model = row
+        return (
+            MonthlyStatementMapper.to_entity(statement_model),
+            CreditCardMapper.to_entity(card_model),
+        )
+
+    def find_by_credit_card_for_user(
+        self, credit_card_id: int, user_id: int, include_future: bool = False
+    ) -> tuple[CreditCard | None, list[MonthlyStatement]]:
+        """Find a credit card together with its statements if it belongs to the user."""
+        # Statements are outer joined only when the card belongs to the user, so
+        # the card row still comes back to tell "not found" from "not owned"
+        join_condition = and_(
+            MonthlyStatementModel.credit_card_id == CreditCardModel.id,
+            CreditCardModel.user_id == user_id,
+        )
+        if not include_future:
+            join_condition = and_(
+                join_condition, MonthlyStatementModel.due_date <= date.today()
+            )
+
+        stmt = (
+            select(CreditCardModel, MonthlyStatementModel)
+            .outerjoin(MonthlyStatementModel, join_condition)
+            .where(CreditCardModel.id == credit_card_id)
+            .order_by(MonthlyStatementModel.due_date)
+        )
+        rows = self._session.execute(stmt).all()
+        if not rows:
+            return None, []
+
+        return CreditCardMapper.to_entity(rows[0][0]), [
+            MonthlyStatementMapper.to_entity(statement_model)
+            for _, statement_model in rows
+            if statement_model is not None
+        ]
+
     def find_by_credit_card_id(
         self, credit_card_id: int, include_future: bool = False
     ) -> list[MonthlyStatement]:
@@ -49,8 +104,8 @@ class SQLAlchemyMonthlyStatementRepository(IMonthlyStatementRepository):
             today = date.today()
             query = query.where(MonthlyStatementModel.due_date <= today)
 
-        # Order by due_date descending (most recent first)
-        query = query.order_by(MonthlyStatementModel.due_date.desc())
+        # Order by due_date ascending (oldest first)
+        query = query.order_by(MonthlyStatementModel.due_date)
 
         models = self._session.execute(query).scalars().all()
         return [MonthlyStatementMapper.to_entity(model) for model in models]
@@ -99,6 +154,27 @@ class SQLAlchemyMonthlyStatementRepository(IMonthlyStatementRepository):
             self._session.flush()
             return MonthlyStatementMapper.to_entity(model)
 
+    def save_if_unchanged(self, statement: MonthlyStatement) -> MonthlyStatement | None:
+        """Update a monthly statement only if its row_version still matches."""
+        # Compare-and-set in one UPDATE; no row matches once someone else bumped the version
+        result = self._session.execute(
+            update(MonthlyStatementModel)
+            .where(
+                MonthlyStatementModel.id == statement.id,
+                MonthlyStatementModel.row_version == statement.row_version,
+            )
+            .values(
+                credit_card_id=statement.credit_card_id,
+                start_date=statement.start_date,
+                closing_date=statement.closing_date,
+                due_date=statement.due_date,
+                row_version=MonthlyStatementModel.row_version + 1,
+            )
+        )
+        if result.rowcount != 1:
+            return None
+        return replace(statement, row_version=statement.row_version + 1)
+
     def get_previous_statement(
         self, credit_card_id: int, closing_date: date
     ) -> MonthlyStatement | None:
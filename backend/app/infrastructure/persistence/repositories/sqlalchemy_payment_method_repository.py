@@ -37,8 +37,8 @@ class SQLAlchemyPaymentMethodRepository(IPaymentMethodRepository):
             select(PaymentMethodModel).where(
                 PaymentMethodModel.user_id == user_id,
                 PaymentMethodModel.type == type if type is not None else True,
-            )
-        ).all()
+            ).execution_options(yield_per=1000)
+        )
         return [PaymentMethodMapper.to_entity(pm) for pm in paymethods]
 
     def save(self, payment_method: PaymentMethod) -> PaymentMethod:
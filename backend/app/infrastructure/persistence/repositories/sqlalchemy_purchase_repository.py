@@ -1,10 +1,21 @@
-from typing import Optional, List
-from sqlalchemy.orm import Session
-from sqlalchemy import select
+from datetime import date
+from typing import Dict, Optional, List, Tuple
+from sqlalchemy.orm import Session, raiseload
+from sqlalchemy import and_, or_, select
 
+from app.domain.entities.credit_card import CreditCard
+from app.domain.entities.installment import Installment
+from app.domain.entities.payment_method import PaymentMethod
 from app.domain.entities.purchase import Purchase
 from app.domain.repositories.ipurchase_repository import IPurchaseRepository
+from app.infrastructure.persistence.mappers.credit_card_mapper import CreditCardMapper
+from app.infrastructure.persistence.mappers.installment_mapper import InstallmentMapper
+from app.infrastructure.persistence.mappers.payment_method_mapper import PaymentMethodMapper
 from app.infrastructure.persistence.mappers.purchase_mapper import PurchaseMapper
+from app.infrastructure.persistence.models.category_model import CategoryModel
+from app.infrastructure.persistence.models.credit_card_model import CreditCardModel
+from app.infrastructure.persistence.models.installment_model import InstallmentModel
+from app.infrastructure.persistence.models.payment_method_model import PaymentMethodModel
 from app.infrastructure.persistence.models.purchase_model import PurchaseModel
 
 
@@ -19,20 +30,126 @@ class SQLAlchemyPurchaseRepository(IPurchaseRepository):
         ).first()
         return PurchaseMapper.to_entity(purchase) if purchase else None
 
+    def find_by_id_and_user(self, purchase_id: int, user_id: int) -> Optional[Purchase]:
+        """Retrieve purchase by ID if it belongs to the user"""
+        purchase = self.session.scalars(
+            select(PurchaseModel).where(
+                PurchaseModel.id == purchase_id,
+                PurchaseModel.user_id == user_id,
+            )
+        ).first()
+        return PurchaseMapper.to_entity(purchase) if purchase else None
+
+    def load_for_update(
+        self, purchase_id: int, user_id: int
+    ) -> Optional[Tuple[Purchase, Optional[PaymentMethod], Optional[CreditCard]]]:
+        """Retrieve a user's purchase with its payment method and that method's credit card, or None if not found"""
+        row = self.session.execute(
+            select(PurchaseModel, PaymentMethodModel, CreditCardModel)
+            .outerjoin(PaymentMethodModel, PaymentMethodModel.id == PurchaseModel.payment_method_id)
+            .outerjoin(CreditCardModel, CreditCardModel.payment_method_id == PaymentMethodModel.id)
+            .where(PurchaseModel.id == purchase_id, PurchaseModel.user_id == user_id)
+        ).first()
+        if not row:
+            return None
+
+        purchase, payment_method, credit_card = row
+        return (
+            PurchaseMapper.to_entity(purchase),
+            PaymentMethodMapper.to_entity(payment_method) if payment_method else None,
+            CreditCardMapper.to_entity(credit_card) if credit_card else None,
+        )
+
     def find_by_user_id(self, user_id: int) -> List[Purchase]:
-        """Retrieve all purchases for a specific user"""
+        """Retrieve all purchases for a specific user, most recent first"""
         purchases = self.session.scalars(
-            select(PurchaseModel).where(PurchaseModel.user_id == user_id)
+            select(PurchaseModel)
+            .where(PurchaseModel.user_id == user_id)
+            .order_by(PurchaseModel.purchase_date.desc())
+            .options(raiseload("*"))
+        ).all()
+        return [PurchaseMapper.to_entity(p) for p in purchases]
+
+    def find_by_user_and_category(self, user_id: int, category_id: int) -> List[Purchase]:
+        """Retrieve a user's purchases in a category, most recent first"""
+        purchases = self.session.scalars(
+            select(PurchaseModel)
+            .where(
+                PurchaseModel.user_id == user_id,
+                PurchaseModel.category_id == category_id,
+            )
+            .order_by(PurchaseModel.purchase_date.desc())
+            .options(raiseload("*"))
+        ).all()
+        return [PurchaseMapper.to_entity(p) for p in purchases]
+
+    def find_by_user_and_date_range(
+        self,
+        user_id: int,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> List[Purchase]:
+        """Retrieve purchases for a user within an (inclusive, optionally open-ended) date range, most recent first"""
+        stmt = (
+            select(PurchaseModel)
+            .where(PurchaseModel.user_id == user_id)
+            .options(raiseload("*"))
+        )
+        if start_date is not None:
+            stmt = stmt.where(PurchaseModel.purchase_date >= start_date)
+        if end_date is not None:
+            stmt = stmt.where(PurchaseModel.purchase_date <= end_date)
+        purchases = self.session.scalars(
+            stmt.order_by(PurchaseModel.purchase_date.desc())
         ).all()
         return [PurchaseMapper.to_entity(p) for p in purchases]
 
     def find_by_payment_method_id(self, payment_method_id: int) -> List[Purchase]:
-        """Retrieve all purchases for a specific payment method"""
+        """Retrieve all purchases for a specific payment method, most recent first"""
         purchases = self.session.scalars(
-            select(PurchaseModel).where(PurchaseModel.payment_method_id == payment_method_id)
+            select(PurchaseModel)
+            .where(PurchaseModel.payment_method_id == payment_method_id)
+            .order_by(PurchaseModel.purchase_date.desc())
+            .options(raiseload("*"))
         ).all()
         return [PurchaseMapper.to_entity(p) for p in purchases]
 
+    def find_statement_rows(
+        self, payment_method_id: int, statement_id: int, period: str
+    ) -> List[Tuple[Purchase, Installment, Optional[str]]]:
+        """
+        Retrieve (purchase, installment, category name) rows for a statement in one query.
+
+        An installment belongs to the statement if it is manually assigned to it,
+        or billed in its period and not manually assigned elsewhere.
+        """
+        rows = self.session.execute(
+            select(PurchaseModel, InstallmentModel, CategoryModel.name)
+            .join(InstallmentModel, InstallmentModel.purchase_id == PurchaseModel.id)
+            .outerjoin(CategoryModel, CategoryModel.id == PurchaseModel.category_id)
+            .where(
+                PurchaseModel.payment_method_id == payment_method_id,
+                or_(
+                    InstallmentModel.manually_assigned_statement_id == statement_id,
+                    and_(
+                        InstallmentModel.billing_period == period,
+                        InstallmentModel.manually_assigned_statement_id.is_(None),
+                    ),
+                ),
+            )
+            .order_by(PurchaseModel.id, InstallmentModel.id)
+        ).all()
+
+        # A purchase can contribute several installments; map it only once
+        purchases: Dict[int, Purchase] = {}
+        result = []
+        for purchase_model, installment_model, category_name in rows:
+            purchase = purchases.get(purchase_model.id)
+            if purchase is None:
+                purchase = purchases[purchase_model.id] = PurchaseMapper.to_entity(purchase_model)
+            result.append((purchase, InstallmentMapper.to_entity(installment_model), category_name))
+        return result
+
     def save(self, purchase: Purchase) -> Purchase:
         """Insert or update purchase"""
         if purchase.id is not None:
@@ -52,6 +169,7 @@ class SQLAlchemyPurchaseRepository(IPurchaseRepository):
                 if purchase.total_amount.is_dual_currency():
                     existing.original_currency = purchase.total_amount.secondary_currency.value
                     existing.original_amount = float(purchase.total_amount.secondary_amount)
+                    existing.exchange_rate_id = purchase.exchange_rate_id
                 else:
                     existing.original_currency = None
                     existing.original_amount = None
@@ -1,4 +1,6 @@
 # backend/cashdata/infrastructure/persistence/repositories/sqlalchemy_unit_of_work.py
+from contextlib import contextmanager
+
 from app.domain.repositories.iunit_of_work import IUnitOfWork
 from app.infrastructure.persistence.repositories.sqlalchemy_bank_account_repository import SQLAlchemyBankAccountRepository
 from app.infrastructure.persistence.repositories.sqlalchemy_payment_method_repository import SQLAlchemyPaymentMethodRepository
@@ -22,9 +24,19 @@ class SQLAlchemyUnitOfWork(IUnitOfWork):
     def __init__(self, session_factory):
         self.session_factory = session_factory
         self.session = None
+        # Nesting depth: a `with uow:` inside another one reuses the open session
+        self._depth = 0
+        self._readonly = False
 
     def __enter__(self):
+        self._depth += 1
+        if self._depth > 1:
+            return self
+
         self.session = self.session_factory()
+        if self._readonly and not self.session.in_transaction():
+            # Plain SELECTs need no BEGIN/ROLLBACK round-trips around them
+            self.session.connection(execution_options={"isolation_level": "AUTOCOMMIT"})
         self.users = SQLAlchemyUserRepository(self.session)
         self.monthly_incomes = SQLAlchemyMonthlyIncomeRepository(self.session)
         self.monthly_budgets = SQLAlchemyMonthlyBudgetRepository(self.session)
@@ -44,9 +56,24 @@ class SQLAlchemyUnitOfWork(IUnitOfWork):
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
+        self._depth -= 1
         if exc_type is not None:
             self.rollback()
-        self.session.close()
+        if self._depth == 0:
+            self.session.close()
+
+    @contextmanager
+    def readonly(self):
+        # Only the outermost block decides whether the session is transactional
+        outermost = self._depth == 0
+        if outermost:
+            self._readonly = True
+        try:
+            with self:
+                yield self
+        finally:
+            if outermost:
+                self._readonly = False
 
     def commit(self):
         self.session.commit()
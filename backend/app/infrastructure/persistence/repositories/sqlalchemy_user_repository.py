@@ -22,6 +22,18 @@ class SQLAlchemyUserRepository(IUserRepository):
         ).first()
         return UserMapper.to_entity(user) if user else None
 
+    def find_by_ids(self, user_ids: List[int]) -> List[User]:
+        """Retrieve active users matching the given IDs in a single query"""
+        if not user_ids:
+            return []
+        users = self.session.scalars(
+            select(UserModel).where(
+                UserModel.id.in_(user_ids),
+                UserModel.is_deleted == False,
+            )
+        ).all()
+        return [UserMapper.to_entity(u) for u in users]
+
     def find_all(self) -> List[User]:
         """Retrieve all active users"""
         users = self.session.scalars(
@@ -7,6 +7,7 @@ from app.domain.entities.installment import Installment
 from app.domain.entities.credit_card import CreditCard
 from app.domain.entities.category import Category
 from app.domain.value_objects.money import Money, Currency
+from app.domain.value_objects.dual_money import DualMoney
 from app.application.use_cases.get_credit_card_summary_use_case import (
     CreditCardSummary,
 )
@@ -61,6 +62,39 @@ class TestPurchaseDTOMapper:
         assert dto.currency == Currency.ARS
         assert dto.installments_count == 12
 
+    def test_to_response_dto_maps_dual_currency_fields(self):
+        """
+        GIVEN: Dual-currency purchase entity with an exchange rate
+        WHEN: Map to response DTO
+        THEN: Original amount, currency and exchange rate id are mapped
+        """
+        # Arrange
+        purchase = Purchase(
+            id=1,
+            user_id=10,
+            payment_method_id=1,
+            category_id=2,
+            purchase_date=date(2025, 1, 15),
+            description="Headphones",
+            total_amount=DualMoney(
+                primary_amount=Decimal("150000.00"),
+                primary_currency=Currency.ARS,
+                secondary_amount=Decimal("100.00"),
+                secondary_currency=Currency.USD,
+                exchange_rate=Decimal("1500.00"),
+            ),
+            installments_count=1,
+            exchange_rate_id=7,
+        )
+
+        # Act
+        dto = PurchaseDTOMapper.to_response_dto(purchase)
+
+        # Assert
+        assert dto.original_amount == Decimal("100.00")
+        assert dto.original_currency == Currency.USD
+        assert dto.exchange_rate_id == 7
+
 
 class TestInstallmentDTOMapper:
 
@@ -64,20 +64,21 @@ class TestListStatementByCreditCardUseCaseIntegration:
     def test_raises_credit_card_not_found_when_credit_card_does_not_exist(
         self, uow_mock, use_case
     ):
-        uow_mock.credit_cards.find_by_id.return_value = None
+        uow_mock.monthly_statements.find_by_credit_card_for_user.return_value = (None, [])
         query = ListStatementByCreditCardQuery(user_id=1, credit_card_id=1)
 
         with pytest.raises(CreditCardNotFoundError, match="Credit card with ID 1 not found"):
             use_case.execute(query)
 
-        uow_mock.credit_cards.find_by_id.assert_called_once_with(1)
-        uow_mock.monthly_statements.find_by_credit_card_id.assert_not_called()
+        uow_mock.monthly_statements.find_by_credit_card_for_user.assert_called_once_with(
+            1, 1, include_future=True
+        )
 
     def test_raises_credit_card_owner_mismatch_when_user_does_not_own_credit_card(
         self, uow_mock, make_credit_card, use_case
     ):
         credit_card = make_credit_card(id=1, user_id=2)
-        uow_mock.credit_cards.find_by_id.return_value = credit_card
+        uow_mock.monthly_statements.find_by_credit_card_for_user.return_value = (credit_card, [])
         query = ListStatementByCreditCardQuery(user_id=1, credit_card_id=1)
 
         with pytest.raises(
@@ -86,14 +87,14 @@ class TestListStatementByCreditCardUseCaseIntegration:
         ):
             use_case.execute(query)
 
-        uow_mock.credit_cards.find_by_id.assert_called_once_with(1)
-        uow_mock.monthly_statements.find_by_credit_card_id.assert_not_called()
+        uow_mock.monthly_statements.find_by_credit_card_for_user.assert_called_once_with(
+            1, 1, include_future=True
+        )
 
     def test_returns_sorted_statements_when_credit_card_exists_and_belongs_to_user(
         self, uow_mock, make_credit_card, make_statement, use_case
     ):
         credit_card = make_credit_card(id=1, user_id=1)
-        uow_mock.credit_cards.find_by_id.return_value = credit_card
 
         statement1 = make_statement(
             id=1,
@@ -116,15 +117,17 @@ class TestListStatementByCreditCardUseCaseIntegration:
             closing_date=date(2025, 3, 31),
             due_date=date(2025, 4, 15),
         )
-        uow_mock.monthly_statements.find_by_credit_card_id.return_value = [
-            statement3, statement1, statement2
-        ]  # Unsorted
+        uow_mock.monthly_statements.find_by_credit_card_for_user.return_value = (
+            credit_card,
+            [statement1, statement2, statement3],  # Sorted by due_date in the repository
+        )
 
         query = ListStatementByCreditCardQuery(user_id=1, credit_card_id=1)
         result = use_case.execute(query)
 
-        uow_mock.credit_cards.find_by_id.assert_called_once_with(1)
-        uow_mock.monthly_statements.find_by_credit_card_id.assert_called_once_with(1, include_future=True)
+        uow_mock.monthly_statements.find_by_credit_card_for_user.assert_called_once_with(
+            1, 1, include_future=True
+        )
         
         # Check that statements are sorted by due_date
         assert len(result) == 3
@@ -136,8 +139,7 @@ class TestListStatementByCreditCardUseCaseIntegration:
         self, uow_mock, make_credit_card, use_case
     ):
         credit_card = make_credit_card(id=1, user_id=1)
-        uow_mock.credit_cards.find_by_id.return_value = credit_card
-        uow_mock.monthly_statements.find_by_credit_card_id.return_value = []
+        uow_mock.monthly_statements.find_by_credit_card_for_user.return_value = (credit_card, [])
 
         query = ListStatementByCreditCardQuery(user_id=1, credit_card_id=1)
         result = use_case.execute(query)
@@ -146,7 +148,7 @@ class TestListStatementByCreditCardUseCaseIntegration:
 
     def test_does_not_commit_changes(self, uow_mock, make_credit_card, make_statement, use_case):
         credit_card = make_credit_card(id=1, user_id=1)
-        uow_mock.credit_cards.find_by_id.return_value = credit_card
+
         statement = make_statement(
             id=1,
             credit_card_id=1,
@@ -154,16 +156,15 @@ class TestListStatementByCreditCardUseCaseIntegration:
             closing_date=date(2025, 1, 31),
             due_date=date(2025, 2, 15),
         )
-        uow_mock.monthly_statements.find_by_credit_card_id.return_value = [statement]
+        uow_mock.monthly_statements.find_by_credit_card_for_user.return_value = (credit_card, [statement])
 
         query = ListStatementByCreditCardQuery(user_id=1, credit_card_id=1)
         use_case.execute(query)
 
         uow_mock.commit.assert_not_called()
 
-    def test_sorts_statements_by_due_date_ascending(self, uow_mock, make_credit_card, make_statement, use_case):
+    def test_keeps_statements_in_repository_order(self, uow_mock, make_credit_card, make_statement, use_case):
         credit_card = make_credit_card(id=1, user_id=1)
-        uow_mock.credit_cards.find_by_id.return_value = credit_card
 
         statement1 = make_statement(
             id=1,
@@ -186,9 +187,10 @@ class TestListStatementByCreditCardUseCaseIntegration:
             closing_date=date(2025, 3, 31),
             due_date=date(2025, 4, 10),
         )
-        uow_mock.monthly_statements.find_by_credit_card_id.return_value = [
-            statement2, statement3, statement1
-        ]  # Different order
+        uow_mock.monthly_statements.find_by_credit_card_for_user.return_value = (
+            credit_card,
+            [statement1, statement2, statement3],  # Sorted by due_date in the repository
+        )
 
         query = ListStatementByCreditCardQuery(user_id=1, credit_card_id=1)
         result = use_case.execute(query)
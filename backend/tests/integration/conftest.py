@@ -5,6 +5,7 @@ from sqlalchemy.orm import sessionmaker
 
 from app.infrastructure.api.main import app
 from app.infrastructure.api.dependencies import get_session
+from app.application.services.ttl_cache import categories_cache, latest_exchange_rate_cache
 from app.domain.entities.user import User
 from app.domain.value_objects.money import Money, Currency
 from app.infrastructure.persistence.mappers.user_mapper import UserMapper
@@ -60,6 +61,9 @@ def client(db_session):
             pass
 
     app.dependency_overrides[get_session] = override_get_session
+    # Process-level caches would otherwise leak rows from another test's database
+    latest_exchange_rate_cache.clear()
+    categories_cache.clear()
     client = TestClient(app)
     yield client
     app.dependency_overrides.clear()
@@ -399,3 +399,25 @@ class TestSQLAlchemyBankAccountRepository:
         # This might fail if other tests have left data, but let's test the method
         all_accounts = repo.find_all()
         assert isinstance(all_accounts, list)
+
+    def test_find_by_user_id_checked(self, repo, test_payment_method, test_user):
+        """Test telling a user without accounts from a missing user."""
+        assert repo.find_by_user_id_checked(test_user) == []
+        assert repo.find_by_user_id_checked(999) is None
+
+        repo.save(
+            BankAccount(
+                id=None,
+                payment_method_id=test_payment_method,
+                primary_user_id=test_user,
+                secondary_user_id=None,
+                name="Main Savings",
+                bank="Test Bank",
+                account_type="SAVINGS",
+                last_four_digits="1234",
+                currency=Currency.ARS,
+            )
+        )
+
+        accounts = repo.find_by_user_id_checked(test_user)
+        assert [a.name for a in accounts] == ["Main Savings"]
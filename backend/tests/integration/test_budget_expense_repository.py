@@ -362,4 +362,213 @@ class TestBudgetExpenseRepository:
 
         # Verify it's gone
         not_found = repo.find_by_id(saved_expense.id)
-        assert not_found is None
\ No newline at end of file
+        assert not_found is None
+
+    def test_delete_with_responsibilities(self, db_session):
+        """Test deleting an expense together with its responsibilities"""
+        from app.domain.entities.budget_expense_responsibility import BudgetExpenseResponsibility
+        from app.infrastructure.persistence.repositories.sqlalchemy_budget_expense_responsibility_repository import SQLAlchemyBudgetExpenseResponsibilityRepository
+
+        repo = SQLAlchemyBudgetExpenseRepository(db_session)
+        responsibility_repo = SQLAlchemyBudgetExpenseResponsibilityRepository(db_session)
+
+        saved_expense = repo.save(BudgetExpense(
+            id=None,
+            budget_id=1,
+            purchase_id=1,
+            installment_id=None,
+            paid_by_user_id=1,
+            split_type=SplitType.EQUAL,
+            amount=Money(Decimal("200"), "ARS"),
+            currency="ARS",
+            description="Expense to delete",
+            date=date(2026, 1, 10),
+            payment_method_name=None,
+            created_at=date(2026, 1, 10),
+        ))
+        responsibility_repo.save(BudgetExpenseResponsibility(
+            id=None,
+            budget_expense_id=saved_expense.id,
+            user_id=1,
+            percentage=Decimal("100"),
+            responsible_amount=Money(Decimal("200"), "ARS"),
+        ))
+
+        repo.delete_with_responsibilities(saved_expense.id)
+
+        assert repo.find_by_id(saved_expense.id) is None
+        assert responsibility_repo.find_by_budget_expense_id(saved_expense.id) == []
+
+    def test_delete_by_purchase_installments(self, db_session):
+        """Test deleting the expenses of a purchase's installments with their responsibilities"""
+        from app.domain.entities.budget_expense_responsibility import BudgetExpenseResponsibility
+        from app.domain.entities.installment import Installment
+        from app.domain.value_objects.money import Currency
+        from app.infrastructure.persistence.repositories.sqlalchemy_budget_expense_responsibility_repository import SQLAlchemyBudgetExpenseResponsibilityRepository
+        from app.infrastructure.persistence.repositories.sqlalchemy_installment_repository import SQLAlchemyInstallmentRepository
+
+        repo = SQLAlchemyBudgetExpenseRepository(db_session)
+        responsibility_repo = SQLAlchemyBudgetExpenseResponsibilityRepository(db_session)
+        installments = SQLAlchemyInstallmentRepository(db_session).save_all([
+            Installment(
+                id=None,
+                purchase_id=purchase_id,
+                installment_number=1,
+                total_installments=1,
+                amount=Money(Decimal("100"), Currency.ARS),
+                billing_period="202601",
+                manually_assigned_statement_id=None,
+            )
+            for purchase_id in (1, 1, 2)
+        ])
+
+        expenses = [
+            repo.save(BudgetExpense(
+                id=None,
+                budget_id=budget_id,
+                purchase_id=None,
+                installment_id=installment.id,
+                paid_by_user_id=1,
+                split_type=SplitType.EQUAL,
+                amount=Money(Decimal("100"), "ARS"),
+                currency="ARS",
+                description="Installment expense",
+                date=date(2026, 1, 10),
+                payment_method_name=None,
+                created_at=date(2026, 1, 10),
+            ))
+            for budget_id, installment in zip((2, 1, 1), installments)
+        ]
+        for expense in expenses:
+            responsibility_repo.save(BudgetExpenseResponsibility(
+                id=None,
+                budget_expense_id=expense.id,
+                user_id=1,
+                percentage=Decimal("100"),
+                responsible_amount=Money(Decimal("100"), "ARS"),
+            ))
+
+        repo.delete_by_purchase_installments(1)
+
+        assert repo.find_by_id(expenses[0].id) is None
+        assert repo.find_by_id(expenses[1].id) is None
+        assert responsibility_repo.find_by_budget_expense_id(expenses[0].id) == []
+        # The other purchase's expense is untouched
+        assert repo.find_by_id(expenses[2].id) is not None
+        assert len(responsibility_repo.find_by_budget_expense_id(expenses[2].id)) == 1
+
+    def test_update_split_type(self, db_session):
+        """Test changing only the split type of an expense"""
+        repo = SQLAlchemyBudgetExpenseRepository(db_session)
+
+        saved_expense = repo.save(BudgetExpense(
+            id=None,
+            budget_id=1,
+            purchase_id=1,
+            installment_id=None,
+            paid_by_user_id=1,
+            split_type=SplitType.EQUAL,
+            amount=Money(Decimal("200"), "ARS"),
+            currency="ARS",
+            description="Expense to re-split",
+            date=date(2026, 1, 10),
+            payment_method_name=None,
+            created_at=date(2026, 1, 10),
+        ))
+
+        repo.update_split_type(saved_expense.id, SplitType.FULL_SINGLE)
+
+        found = repo.find_by_id(saved_expense.id)
+        assert found.split_type == SplitType.FULL_SINGLE
+        assert found.description == "Expense to re-split"
+        assert found.amount.amount == Decimal("200")
+
+    def test_load_for_removal(self, db_session):
+        """Test loading an expense with its budget and the user's participation"""
+        from datetime import datetime
+        from app.domain.entities.budget_participant import BudgetParticipant
+        from app.domain.entities.monthly_budget import MonthlyBudget
+        from app.domain.value_objects.budget_status import BudgetStatus
+        from app.infrastructure.persistence.repositories.sqlalchemy_budget_participant_repository import SQLAlchemyBudgetParticipantRepository
+        from app.infrastructure.persistence.repositories.sqlalchemy_monthly_budget_repository import SQLAlchemyMonthlyBudgetRepository
+
+        budget = SQLAlchemyMonthlyBudgetRepository(db_session).save(MonthlyBudget(
+            id=None,
+            name="Budget",
+            description=None,
+            status=BudgetStatus.ACTIVE,
+            created_by_user_id=1,
+            created_at=datetime(2026, 1, 1, 12, 0, 0),
+            updated_at=None,
+        ))
+        SQLAlchemyBudgetParticipantRepository(db_session).save(
+            BudgetParticipant(id=None, budget_id=budget.id, user_id=1)
+        )
+        repo = SQLAlchemyBudgetExpenseRepository(db_session)
+        saved_expense = repo.save(BudgetExpense(
+            id=None,
+            budget_id=budget.id,
+            purchase_id=1,
+            installment_id=None,
+            paid_by_user_id=1,
+            split_type=SplitType.EQUAL,
+            amount=Money(Decimal("200"), "ARS"),
+            currency="ARS",
+            description="Expense to remove",
+            date=date(2026, 1, 10),
+            payment_method_name=None,
+            created_at=date(2026, 1, 10),
+        ))
+
+        expense, loaded_budget, is_participant = repo.load_for_removal(saved_expense.id, 1)
+        assert expense.id == saved_expense.id
+        assert loaded_budget.id == budget.id
+        assert is_participant is True
+
+        assert repo.load_for_removal(saved_expense.id, 2)[2] is False
+        assert repo.load_for_removal(999, 1) is None
+
+    def test_load_for_update(self, db_session):
+        """Test loading an expense with its budget and all its participants"""
+        from datetime import datetime
+        from app.domain.entities.budget_participant import BudgetParticipant
+        from app.domain.entities.monthly_budget import MonthlyBudget
+        from app.domain.value_objects.budget_status import BudgetStatus
+        from app.infrastructure.persistence.repositories.sqlalchemy_budget_participant_repository import SQLAlchemyBudgetParticipantRepository
+        from app.infrastructure.persistence.repositories.sqlalchemy_monthly_budget_repository import SQLAlchemyMonthlyBudgetRepository
+
+        budget = SQLAlchemyMonthlyBudgetRepository(db_session).save(MonthlyBudget(
+            id=None,
+            name="Budget",
+            description=None,
+            status=BudgetStatus.ACTIVE,
+            created_by_user_id=1,
+            created_at=datetime(2026, 1, 1, 12, 0, 0),
+            updated_at=None,
+        ))
+        SQLAlchemyBudgetParticipantRepository(db_session).save_many([
+            BudgetParticipant(id=None, budget_id=budget.id, user_id=1),
+            BudgetParticipant(id=None, budget_id=budget.id, user_id=2),
+        ])
+        repo = SQLAlchemyBudgetExpenseRepository(db_session)
+        saved_expense = repo.save(BudgetExpense(
+            id=None,
+            budget_id=budget.id,
+            purchase_id=1,
+            installment_id=None,
+            paid_by_user_id=1,
+            split_type=SplitType.EQUAL,
+            amount=Money(Decimal("200"), "ARS"),
+            currency="ARS",
+            description="Expense to update",
+            date=date(2026, 1, 10),
+            payment_method_name=None,
+            created_at=date(2026, 1, 10),
+        ))
+
+        expense, loaded_budget, participants = repo.load_for_update(saved_expense.id)
+        assert expense.id == saved_expense.id
+        assert loaded_budget.id == budget.id
+        assert [p.user_id for p in participants] == [1, 2]
+
+        assert repo.load_for_update(999) is None
@@ -400,4 +400,48 @@ class TestBudgetExpenseResponsibilityRepository:
 
         # Verify expense 2 responsibilities still exist
         expense_2_after_delete = repo.find_by_budget_expense_id(2)
-        assert len(expense_2_after_delete) == 1
\ No newline at end of file
+        assert len(expense_2_after_delete) == 1
+
+    def test_replace_for_expense(self, db_session):
+        """Test replacing the responsibilities of a budget expense in one call"""
+        repo = SQLAlchemyBudgetExpenseResponsibilityRepository(db_session)
+
+        repo.save(BudgetExpenseResponsibility(
+            id=None,
+            budget_expense_id=1,
+            user_id=1,
+            percentage=Decimal("100.00"),
+            responsible_amount=Money(Decimal("1000.00"), "ARS"),
+        ))
+        repo.save(BudgetExpenseResponsibility(
+            id=None,
+            budget_expense_id=2,
+            user_id=1,
+            percentage=Decimal("100.00"),
+            responsible_amount=Money(Decimal("200.00"), "ARS"),
+        ))
+
+        repo.replace_for_expense(1, [
+            BudgetExpenseResponsibility(
+                id=None,
+                budget_expense_id=1,
+                user_id=1,
+                percentage=Decimal("60.00"),
+                responsible_amount=Money(Decimal("600.00"), "ARS"),
+            ),
+            BudgetExpenseResponsibility(
+                id=None,
+                budget_expense_id=1,
+                user_id=2,
+                percentage=Decimal("40.00"),
+                responsible_amount=Money(Decimal("400.00"), "ARS"),
+            ),
+        ])
+
+        replaced = sorted(repo.find_by_budget_expense_id(1), key=lambda r: r.user_id)
+        assert [r.user_id for r in replaced] == [1, 2]
+        assert [r.responsible_amount.amount for r in replaced] == [Decimal("600.00"), Decimal("400.00")]
+        assert all(r.id is not None for r in replaced)
+
+        # Other expenses are untouched
+        assert len(repo.find_by_budget_expense_id(2)) == 1
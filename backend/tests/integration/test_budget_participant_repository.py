@@ -221,4 +221,30 @@ class TestBudgetParticipantRepository:
         # Verify it's the same record
         assert updated_participant.id == saved_participant.id
         assert updated_participant.budget_id == saved_participant.budget_id
-        assert updated_participant.user_id == saved_participant.user_id
\ No newline at end of file
+        assert updated_participant.user_id == saved_participant.user_id
+
+    def test_find_by_budget_id_with_users(self, db_session):
+        """Test finding a budget's participants together with their active users"""
+        from decimal import Decimal
+        from app.domain.entities.user import User
+        from app.domain.value_objects.money import Money, Currency
+        from app.infrastructure.persistence.repositories.sqlalchemy_user_repository import SQLAlchemyUserRepository
+
+        user_repo = SQLAlchemyUserRepository(db_session)
+        ana = user_repo.save(User(id=None, name="Ana", email="ana@example.com", wage=Money(Decimal("1000"), Currency.ARS)))
+        bob = user_repo.save(User(id=None, name="Bob", email="bob@example.com", wage=Money(Decimal("1000"), Currency.ARS)))
+        gone = user_repo.save(User(id=None, name="Gone", email="gone@example.com", wage=Money(Decimal("1000"), Currency.ARS)))
+        user_repo.delete(gone.id)
+
+        repo = SQLAlchemyBudgetParticipantRepository(db_session)
+        repo.save_many([
+            BudgetParticipant(id=None, budget_id=1, user_id=bob.id),
+            BudgetParticipant(id=None, budget_id=1, user_id=ana.id),
+            BudgetParticipant(id=None, budget_id=1, user_id=gone.id),
+            BudgetParticipant(id=None, budget_id=2, user_id=ana.id),
+        ])
+
+        pairs = repo.find_by_budget_id_with_users(1)
+
+        assert [(p.user_id, u.name) for p, u in pairs] == [(bob.id, "Bob"), (ana.id, "Ana")]
+        assert all(p.budget_id == 1 for p, _ in pairs)
@@ -197,6 +197,29 @@ class TestSQLAlchemyCreditCardRepositoryFindById:
         assert found is None
 
 
+class TestSQLAlchemyCreditCardRepositoryFindByPaymentMethodId:
+    def test_should_find_credit_card_with_lock(self, credit_card_repository):
+        # Arrange
+        card = CreditCard(
+            id=None,
+            payment_method_id=2,
+            user_id=1,
+            name="Visa",
+            bank="HSBC",
+            last_four_digits="1111",
+            billing_close_day=5,
+            payment_due_day=15,
+        )
+        saved = credit_card_repository.save(card)
+
+        # Act
+        found = credit_card_repository.find_by_payment_method_id(2, lock=True)
+
+        # Assert
+        assert found is not None
+        assert found.id == saved.id
+
+
 class TestSQLAlchemyCreditCardRepositoryFindByUserId:
     def test_should_return_all_cards_for_user(self, credit_card_repository):
         # Arrange
@@ -0,0 +1,51 @@
+from datetime import date, datetime
+from decimal import Decimal
+
+from app.domain.entities.exchange_rate import ExchangeRate
+from app.domain.value_objects.exchange_rate_type import ExchangeRateType
+from app.domain.value_objects.money import Currency
+from app.infrastructure.persistence.repositories.sqlalchemy_exchange_rate_repository import SQLAlchemyExchangeRateRepository
+
+
+class TestExchangeRateRepository:
+    def test_list_all_filters_by_date_range(self, db_session):
+        """Test listing exchange rates only within an inclusive date range"""
+        repo = SQLAlchemyExchangeRateRepository(db_session)
+
+        for day, rate in [(1, "1000"), (10, "1100"), (20, "1200"), (31, "1300")]:
+            repo.save(ExchangeRate(
+                id=None,
+                date=date(2026, 1, day),
+                from_currency=Currency.USD,
+                to_currency=Currency.ARS,
+                rate=Decimal(rate),
+                rate_type=ExchangeRateType.MEP,
+                created_at=datetime(2026, 1, day),
+                created_by_user_id=1,
+            ))
+
+        rates = repo.list_all(start_date=date(2026, 1, 10), end_date=date(2026, 1, 20))
+
+        assert [rate.date for rate in rates] == [date(2026, 1, 20), date(2026, 1, 10)]
+        assert len(repo.list_all()) == 4
+
+    def test_add_inserts_rate_and_returns_its_id(self, db_session):
+        """Test adding an exchange rate returns the id of the stored row"""
+        repo = SQLAlchemyExchangeRateRepository(db_session)
+
+        rate_id = repo.add(ExchangeRate(
+            id=None,
+            date=date(2026, 1, 15),
+            from_currency=Currency.ARS,
+            to_currency=Currency.USD,
+            rate=Decimal("0.0008"),
+            rate_type=ExchangeRateType.INFERRED,
+            created_at=datetime(2026, 1, 15),
+            source="INFERRED",
+            created_by_user_id=1,
+        ))
+
+        stored = repo.find_by_id(rate_id)
+        assert stored is not None
+        assert stored.rate == Decimal("0.0008")
+        assert stored.rate_type == ExchangeRateType.INFERRED
@@ -1,5 +1,5 @@
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, Session
 from decimal import Decimal
 from datetime import datetime, date
@@ -117,6 +117,36 @@ class TestSQLAlchemyInstallmentRepositorySave:
         assert len(saved_list) == 3
         assert all(i.id is not None for i in saved_list)
 
+    def test_should_save_all_new_installments_in_one_batch(self, db_session, installment_repository):
+        installments = [
+            Installment(
+                id=None,
+                purchase_id=1,
+                installment_number=i,
+                total_installments=12,
+                amount=Money(Decimal("1000.00"), Currency.ARS),
+                billing_period=f"2025{i:02d}",
+                manually_assigned_statement_id=None
+            )
+            for i in range(1, 13)
+        ]
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        engine = db_session.get_bind()
+        event.listen(engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            saved_list = installment_repository.save_all(installments)
+        finally:
+            event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+        assert [i.installment_number for i in saved_list] == list(range(1, 13))
+        assert all(i.amount.amount == Decimal("1000.00") for i in saved_list)
+        # One batched INSERT ... RETURNING
+        assert len(statements) == 1
+
     def test_should_update_installment(self, installment_repository):
         installment = Installment(
             id=None,
@@ -144,6 +174,29 @@ class TestSQLAlchemyInstallmentRepositorySave:
         assert updated.id == saved.id
         assert updated.manually_assigned_statement_id == 14
 
+
+class TestSQLAlchemyInstallmentRepositoryLoadForUpdate:
+    def test_should_load_installment_with_purchase_and_credit_card(self, installment_repository):
+        saved = installment_repository.save(Installment(
+            id=None,
+            purchase_id=1,
+            installment_number=1,
+            total_installments=6,
+            amount=Money(Decimal("2000.00"), Currency.ARS),
+            billing_period="202501",
+            manually_assigned_statement_id=None
+        ))
+
+        installment, purchase, credit_card = installment_repository.load_for_update(saved.id)
+
+        assert installment.id == saved.id
+        assert purchase.id == 1
+        assert credit_card.id == 1
+
+    def test_should_return_none_for_nonexistent_id(self, installment_repository):
+        assert installment_repository.load_for_update(999) is None
+
+
 class TestSQLAlchemyInstallmentRepositoryFindByPurchaseId:
     def test_should_return_all_installments_for_purchase(self, installment_repository):
         for i in range(1, 4):
@@ -161,6 +214,224 @@ class TestSQLAlchemyInstallmentRepositoryFindByPurchaseId:
         installments = installment_repository.find_by_purchase_id(1)
         assert len(installments) == 3
 
+    def test_should_return_installments_ordered_by_number(self, installment_repository):
+        for i in (3, 1, 2):
+            installment_repository.save(
+                Installment(
+                    id=None,
+                    purchase_id=1,
+                    installment_number=i,
+                    total_installments=3,
+                    amount=Money(Decimal("1000.00"), Currency.ARS),
+                    billing_period=f"20250{i}",
+                    manually_assigned_statement_id=None
+                )
+            )
+
+        installments = installment_repository.find_by_purchase_id(1)
+        assert [i.installment_number for i in installments] == [1, 2, 3]
+
+
+class TestSQLAlchemyInstallmentRepositoryFindByIds:
+    def test_should_return_installments_for_given_ids(self, installment_repository):
+        saved = installment_repository.save_all([
+            Installment(
+                id=None,
+                purchase_id=1,
+                installment_number=i,
+                total_installments=3,
+                amount=Money(Decimal("1000.00"), Currency.ARS),
+                billing_period=f"20250{i}",
+                manually_assigned_statement_id=None
+            )
+            for i in range(1, 4)
+        ])
+
+        found = installment_repository.find_by_ids([saved[0].id, saved[2].id, 999])
+
+        assert sorted(i.id for i in found) == [saved[0].id, saved[2].id]
+        assert installment_repository.find_by_ids([]) == []
+
+
+class TestSQLAlchemyInstallmentRepositoryFindByPurchaseIds:
+    def test_should_return_installments_of_all_given_purchases(self, db_session, installment_repository):
+        db_session.add(PurchaseModel(
+            id=2,
+            user_id=1,
+            payment_method_id=1,
+            category_id=1,
+            purchase_date=date(2025, 1, 20),
+            description="Other Purchase",
+            total_amount=2000,
+            total_currency="ARS",
+            installments_count=2,
+        ))
+        db_session.commit()
+        installment_repository.save_all([
+            Installment(
+                id=None,
+                purchase_id=purchase_id,
+                installment_number=number,
+                total_installments=2,
+                amount=Money(Decimal("1000.00"), Currency.ARS),
+                billing_period=f"20250{number}",
+                manually_assigned_statement_id=None
+            )
+            for purchase_id, number in [(2, 2), (1, 1), (2, 1), (1, 2)]
+        ])
+
+        found = installment_repository.find_by_purchase_ids([1, 2])
+
+        assert [(i.purchase_id, i.installment_number) for i in found] == [(1, 1), (1, 2), (2, 1), (2, 2)]
+        assert [i.purchase_id for i in installment_repository.find_by_purchase_ids([2])] == [2, 2]
+        assert installment_repository.find_by_purchase_ids([]) == []
+
+
+class TestSQLAlchemyInstallmentRepositoryUpdateByPurchaseAndNumber:
+    def test_should_overwrite_installment_in_place(self, installment_repository):
+        saved = installment_repository.save(Installment(
+            id=None,
+            purchase_id=1,
+            installment_number=1,
+            total_installments=1,
+            amount=Money(Decimal("1000.00"), Currency.ARS),
+            billing_period="202501",
+            manually_assigned_statement_id=None
+        ))
+
+        assert installment_repository.update_by_purchase_and_number(Installment(
+            id=None,
+            purchase_id=1,
+            installment_number=1,
+            total_installments=1,
+            amount=Money(Decimal("1500.00"), Currency.ARS),
+            billing_period="202502",
+            manually_assigned_statement_id=None
+        )) is True
+
+        [found] = installment_repository.find_by_purchase_id(1)
+        assert found.id == saved.id
+        assert found.amount.amount == Decimal("1500.00")
+        assert found.billing_period == "202502"
+
+    def test_should_return_false_when_installment_does_not_exist(self, installment_repository):
+        assert installment_repository.update_by_purchase_and_number(Installment(
+            id=None,
+            purchase_id=1,
+            installment_number=1,
+            total_installments=1,
+            amount=Money(Decimal("1500.00"), Currency.ARS),
+            billing_period="202502",
+            manually_assigned_statement_id=None
+        )) is False
+
+
+class TestSQLAlchemyInstallmentRepositoryBulkUpdateBillingPeriod:
+    def test_should_move_only_installments_in_old_period(self, installment_repository):
+        installment_repository.save_all([
+            Installment(
+                id=None,
+                purchase_id=1,
+                installment_number=i,
+                total_installments=3,
+                amount=Money(Decimal("1000.00"), Currency.ARS),
+                billing_period=f"20250{i}",
+                manually_assigned_statement_id=7 if i == 1 else None
+            )
+            for i in range(1, 4)
+        ])
+
+        assert installment_repository.bulk_update_billing_period([1], "202501", "202502") == 1
+
+        installments = installment_repository.find_by_purchase_id(1)
+        assert [i.billing_period for i in installments] == ["202502", "202502", "202503"]
+        assert installments[0].manually_assigned_statement_id == 7
+        assert installment_repository.bulk_update_billing_period([], "202502", "202503") == 0
+
+
+class TestSQLAlchemyInstallmentRepositoryBulkAssignStatement:
+    def test_should_assign_only_unassigned_or_current_statement_installments(self, installment_repository):
+        saved = installment_repository.save_all([
+            Installment(
+                id=None,
+                purchase_id=1,
+                installment_number=i,
+                total_installments=3,
+                amount=Money(Decimal("1000.00"), Currency.ARS),
+                billing_period="202501",
+                manually_assigned_statement_id=manual_id
+            )
+            for i, manual_id in [(1, None), (2, 5), (3, 6)]
+        ])
+        ids = [i.id for i in saved]
+
+        assert installment_repository.bulk_assign_statement(ids, 7, current_statement_id=5) == 2
+
+        installments = installment_repository.find_by_purchase_id(1)
+        assert [i.manually_assigned_statement_id for i in installments] == [7, 7, 6]
+
+    def test_should_assign_only_unassigned_installments_without_current_statement(self, installment_repository):
+        saved = installment_repository.save_all([
+            Installment(
+                id=None,
+                purchase_id=1,
+                installment_number=i,
+                total_installments=2,
+                amount=Money(Decimal("1000.00"), Currency.ARS),
+                billing_period="202501",
+                manually_assigned_statement_id=manual_id
+            )
+            for i, manual_id in [(1, None), (2, 5)]
+        ])
+
+        assert installment_repository.bulk_assign_statement([i.id for i in saved], 7) == 1
+        assert installment_repository.bulk_assign_statement([], 7) == 0
+
+        installments = installment_repository.find_by_purchase_id(1)
+        assert [i.manually_assigned_statement_id for i in installments] == [7, 5]
+
+
+class TestSQLAlchemyInstallmentRepositoryDeleteByPurchaseId:
+    def test_should_delete_all_installments_of_purchase(self, installment_repository):
+        installment_repository.save_all([
+            Installment(
+                id=None,
+                purchase_id=1,
+                installment_number=i,
+                total_installments=3,
+                amount=Money(Decimal("1000.00"), Currency.ARS),
+                billing_period=f"20250{i}",
+                manually_assigned_statement_id=None
+            )
+            for i in range(1, 4)
+        ])
+
+        assert installment_repository.delete_by_purchase_id(1) == 3
+        assert installment_repository.find_by_purchase_id(1) == []
+        assert installment_repository.delete_by_purchase_id(1) == 0
+
+
+class TestSQLAlchemyInstallmentRepositoryCountByPurchaseId:
+    def test_should_count_installments_for_purchase(self, installment_repository):
+        for i in range(1, 4):
+            inst = Installment(
+                id=None,
+                purchase_id=1,
+                installment_number=i,
+                total_installments=3,
+                amount=Money(Decimal("1000.00"), Currency.ARS),
+                billing_period=f"20250{i}",
+                manually_assigned_statement_id=None
+            )
+            installment_repository.save(inst)
+
+        assert installment_repository.count_by_purchase_id(1) == 3
+
+    def test_should_return_zero_when_purchase_has_no_installments(
+        self, installment_repository
+    ):
+        assert installment_repository.count_by_purchase_id(999) == 0
+
 
 class TestSQLAlchemyInstallmentRepositoryFindByBillingPeriod:
     def test_should_return_installments_for_period(self, installment_repository):
@@ -198,3 +469,4 @@ class TestSQLAlchemyInstallmentRepositoryFindByCreditCardAndPeriod:
             1, "202501"
         )
         assert len(installments) >= 1
+
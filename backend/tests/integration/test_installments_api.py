@@ -139,6 +139,26 @@ class TestUpdateInstallment:
         # After: 1500 + 1000 + 1000 = 3500
         assert purchase["total_amount"] == "3500.00"
 
+    def test_patch_installment_without_changes_returns_current_installment(
+        self, client, test_user, test_purchase
+    ):
+        """Should return the stored installment when the update changes nothing"""
+        installments_response = client.get(
+            f"/api/v1/purchases/{test_purchase['id']}/installments",
+            params={"user_id": test_user["id"]}
+        )
+        assert installments_response.status_code == 200
+        first_installment = installments_response.json()[0]
+
+        response = client.patch(
+            f"/api/v1/installments/{first_installment['id']}",
+            json={},
+            params={"user_id": test_user["id"]}
+        )
+
+        assert response.status_code == 200
+        assert response.json()["amount"] == first_installment["amount"]
+
     def test_patch_installment_invalid_id_returns_404(self, client, test_user):
         """Should return 404 for invalid installment ID"""
         update_data = {"amount": 1500.00}
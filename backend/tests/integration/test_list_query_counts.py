@@ -0,0 +1,90 @@
+from contextlib import contextmanager
+from datetime import date, datetime
+
+import pytest
+from sqlalchemy import event
+
+from app.application.use_cases.list_budgets_by_period_use_case import ListBudgetsUseCase
+from app.application.use_cases.list_purchases_by_user_use_case import (
+    ListPurchasesByUserQuery,
+    ListPurchasesByUserUseCase,
+)
+from app.infrastructure.persistence.models import (
+    BudgetParticipantModel,
+    CategoryModel,
+    MonthlyBudgetModel,
+    PaymentMethodModel,
+    PurchaseModel,
+)
+from app.infrastructure.persistence.repositories.sqlalchemy_unit_of_work import SQLAlchemyUnitOfWork
+
+
+@contextmanager
+def count_queries(engine):
+    """Count the statements sent to the database while the block runs"""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+@pytest.fixture
+def seeded_user(db_session, test_user):
+    """A user with a few purchases and budgets"""
+    user_id = test_user["id"]
+    db_session.add(CategoryModel(id=1, name="Groceries"))
+    db_session.add(PaymentMethodModel(
+        id=1, user_id=user_id, type="cash", name="Cash", is_active=True, created_at=datetime.now()
+    ))
+    db_session.flush()
+    for day in range(1, 6):
+        db_session.add(PurchaseModel(
+            user_id=user_id,
+            payment_method_id=1,
+            category_id=1,
+            purchase_date=date(2026, 1, day),
+            description=f"Purchase {day}",
+            total_amount=100,
+            total_currency="ARS",
+            installments_count=1,
+        ))
+    for month in range(1, 4):
+        budget = MonthlyBudgetModel(
+            name=f"Budget {month}",
+            status="active",
+            created_by_user_id=user_id,
+            created_at=datetime(2026, month, 1),
+        )
+        db_session.add(budget)
+        db_session.flush()
+        db_session.add(BudgetParticipantModel(budget_id=budget.id, user_id=user_id))
+    db_session.commit()
+    db_session.expunge_all()
+    return user_id
+
+
+class TestListQueryCounts:
+    def test_list_purchases_by_user_query_count(self, db_engine, db_session, seeded_user):
+        use_case = ListPurchasesByUserUseCase(SQLAlchemyUnitOfWork(lambda: db_session))
+
+        with count_queries(db_engine) as statements:
+            purchases = use_case.execute(ListPurchasesByUserQuery(user_id=seeded_user))
+
+        assert len(purchases) == 5
+        assert len(statements) <= 2
+
+    def test_list_budgets_query_count(self, db_engine, db_session, seeded_user):
+        use_case = ListBudgetsUseCase(SQLAlchemyUnitOfWork(lambda: db_session))
+
+        with count_queries(db_engine) as statements:
+            budgets = use_case.execute(seeded_user)
+
+        assert len(budgets) == 3
+        assert all(b.participant_count == 1 for b in budgets)
+        assert len(statements) <= 2
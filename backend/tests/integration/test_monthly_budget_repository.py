@@ -217,4 +217,115 @@ class TestMonthlyBudgetRepository:
 
         # Find budgets for user with no participations
         empty_budgets = repo.find_by_user_participant(999)
-        assert len(empty_budgets) == 0
\ No newline at end of file
+        assert len(empty_budgets) == 0
+
+    def test_find_by_user_participant_with_counts(self, db_session):
+        """Test finding budgets where user is a participant along with all their participants"""
+        from app.infrastructure.persistence.repositories.sqlalchemy_unit_of_work import SQLAlchemyUnitOfWork
+        from app.domain.entities.budget_participant import BudgetParticipant
+
+        with SQLAlchemyUnitOfWork(lambda: db_session) as uow:
+            older = uow.monthly_budgets.save(MonthlyBudget(
+                id=None,
+                name="Older",
+                description=None,
+                status=BudgetStatus.ACTIVE,
+                created_by_user_id=1,
+                created_at=datetime(2026, 5, 1, 12, 0, 0),
+                updated_at=None
+            ))
+            newer = uow.monthly_budgets.save(MonthlyBudget(
+                id=None,
+                name="Newer",
+                description=None,
+                status=BudgetStatus.ACTIVE,
+                created_by_user_id=2,
+                created_at=datetime(2026, 6, 1, 12, 0, 0),
+                updated_at=None
+            ))
+            other = uow.monthly_budgets.save(MonthlyBudget(
+                id=None,
+                name="Other",
+                description=None,
+                status=BudgetStatus.ACTIVE,
+                created_by_user_id=2,
+                created_at=datetime(2026, 6, 2, 12, 0, 0),
+                updated_at=None
+            ))
+
+            uow.budget_participants.save_many([
+                BudgetParticipant(id=None, budget_id=older.id, user_id=1),
+                BudgetParticipant(id=None, budget_id=newer.id, user_id=1),
+                BudgetParticipant(id=None, budget_id=newer.id, user_id=2),
+                BudgetParticipant(id=None, budget_id=newer.id, user_id=3),
+                BudgetParticipant(id=None, budget_id=other.id, user_id=2),
+            ])
+            uow.commit()
+
+        repo = SQLAlchemyMonthlyBudgetRepository(db_session)
+
+        result = repo.find_by_user_participant_with_counts(1)
+        assert [(budget.id, count) for budget, count in result] == [(newer.id, 3), (older.id, 1)]
+
+        assert repo.find_by_user_participant_with_counts(999) == []
+
+    def test_find_with_expenses(self, db_session):
+        """Test loading a budget with its expenses and responsibilities"""
+        from datetime import date
+        from decimal import Decimal
+        from app.domain.entities.budget_expense import BudgetExpense
+        from app.domain.entities.budget_expense_responsibility import BudgetExpenseResponsibility
+        from app.domain.entities.budget_participant import BudgetParticipant
+        from app.domain.value_objects.money import Money
+        from app.domain.value_objects.split_type import SplitType
+        from app.infrastructure.persistence.repositories.sqlalchemy_unit_of_work import SQLAlchemyUnitOfWork
+
+        with SQLAlchemyUnitOfWork(lambda: db_session) as uow:
+            budget = uow.monthly_budgets.save(MonthlyBudget(
+                id=None,
+                name="Budget with expenses",
+                description=None,
+                status=BudgetStatus.ACTIVE,
+                created_by_user_id=1,
+                created_at=datetime(2026, 6, 1, 12, 0, 0),
+                updated_at=None
+            ))
+            uow.budget_participants.save(BudgetParticipant(id=None, budget_id=budget.id, user_id=1))
+            expenses = [
+                uow.budget_expenses.save(BudgetExpense(
+                    id=None,
+                    budget_id=budget.id,
+                    purchase_id=purchase_id,
+                    installment_id=None,
+                    paid_by_user_id=1,
+                    split_type=SplitType.FULL_SINGLE,
+                    amount=Money(Decimal("100.00"), "ARS"),
+                    currency="ARS",
+                    description=f"Expense {purchase_id}",
+                    date=date(2026, 6, 2),
+                    payment_method_name=None,
+                    created_at=date(2026, 6, 2),
+                ))
+                for purchase_id in (1, 2)
+            ]
+            uow.budget_expense_responsibilities.save(BudgetExpenseResponsibility(
+                id=None,
+                budget_expense_id=expenses[0].id,
+                user_id=1,
+                percentage=Decimal("100"),
+                responsible_amount=Money(Decimal("100.00"), "ARS"),
+            ))
+
+            aggregate = uow.monthly_budgets.find_with_expenses(budget.id, participant_user_id=1)
+            assert aggregate.budget.id == budget.id
+            assert sorted(e.id for e in aggregate.expenses) == sorted(e.id for e in expenses)
+            assert len(aggregate.responsibilities[expenses[0].id]) == 1
+            assert aggregate.responsibilities[expenses[1].id] == []
+
+            assert uow.monthly_budgets.find_with_expenses(budget.id, participant_user_id=2) is None
+            assert uow.monthly_budgets.find_with_expenses(999) is None
+
+            # Expenses deleted in the same session are not returned from a stale collection
+            uow.budget_expenses.delete(expenses[1].id)
+            aggregate = uow.monthly_budgets.find_with_expenses(budget.id)
+            assert [e.id for e in aggregate.expenses] == [expenses[0].id]
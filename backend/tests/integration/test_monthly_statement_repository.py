@@ -0,0 +1,57 @@
+from dataclasses import replace
+from datetime import date
+
+from app.domain.entities.monthly_statement import MonthlyStatement
+from app.infrastructure.persistence.repositories.sqlalchemy_monthly_statement_repository import (
+    SQLAlchemyMonthlyStatementRepository,
+)
+
+
+def _new_statement():
+    return MonthlyStatement(
+        id=None,
+        credit_card_id=1,
+        start_date=date(2025, 9, 1),
+        closing_date=date(2025, 9, 30),
+        due_date=date(2025, 10, 10),
+    )
+
+
+class TestMonthlyStatementRepositoryRowVersion:
+    def test_save_starts_and_bumps_row_version(self, db_session):
+        """Test new statements start at version 1 and every save bumps it"""
+        repo = SQLAlchemyMonthlyStatementRepository(db_session)
+
+        saved = repo.save(_new_statement())
+        assert saved.row_version == 1
+
+        updated = repo.save(replace(saved, due_date=date(2025, 10, 12)))
+        assert updated.row_version == 2
+
+    def test_save_if_unchanged_updates_and_bumps_row_version(self, db_session):
+        """Test a statement read at the current version is updated"""
+        repo = SQLAlchemyMonthlyStatementRepository(db_session)
+        saved = repo.save(_new_statement())
+
+        result = repo.save_if_unchanged(
+            replace(saved, closing_date=date(2025, 10, 2), due_date=date(2025, 10, 15))
+        )
+
+        assert result is not None
+        assert result.row_version == 2
+        stored = repo.find_by_id(saved.id)
+        assert stored.closing_date == date(2025, 10, 2)
+        assert stored.row_version == 2
+
+    def test_save_if_unchanged_rejects_a_stale_statement(self, db_session):
+        """Test a statement changed by another writer since it was read is left as is"""
+        repo = SQLAlchemyMonthlyStatementRepository(db_session)
+        read = repo.save(_new_statement())
+        repo.save_if_unchanged(replace(read, due_date=date(2025, 10, 12)))
+
+        result = repo.save_if_unchanged(replace(read, due_date=date(2025, 10, 20)))
+
+        assert result is None
+        stored = repo.find_by_id(read.id)
+        assert stored.due_date == date(2025, 10, 12)
+        assert stored.row_version == 2
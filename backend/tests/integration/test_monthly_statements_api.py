@@ -6,6 +6,10 @@ Tests all monthly statement-related API endpoints with real database and FastAPI
 
 import pytest
 
+from app.infrastructure.persistence.repositories.sqlalchemy_monthly_statement_repository import (
+    SQLAlchemyMonthlyStatementRepository,
+)
+
 
 @pytest.fixture
 def test_credit_card(client, test_user):
@@ -100,6 +104,7 @@ class TestGetStatementsByCard:
         data = response.json()
         ids = [s["id"] for s in data]
         assert future_stmt["id"] in ids
+        assert ids[-1] == future_stmt["id"]  # Sorted by due_date ascending
 
     def test_get_statements_by_card_wrong_user_returns_404(
         self, client, test_user, test_credit_card, test_statement
@@ -152,4 +157,58 @@ class TestGetStatementsByCard:
         assert response.status_code == 200
         data = response.json()
         assert isinstance(data, list)
-        assert len(data) == 0
\ No newline at end of file
+        assert len(data) == 0
+
+
+class TestGetStatementDetail:
+    """Test GET /api/v1/statements/{statement_id}"""
+
+    def test_get_statement_detail_returns_card_data_for_owner(
+        self, client, test_user, test_credit_card, test_statement
+    ):
+        """Should return the statement with its credit card name and currency"""
+        response = client.get(
+            f"/api/v1/statements/{test_statement['id']}",
+            params={"user_id": test_user["id"]},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["credit_card_id"] == test_credit_card["id"]
+        assert data["credit_card_name"] == "Test Card"
+        assert data["currency"] == "ARS"
+
+    def test_get_statement_detail_wrong_user_returns_404(
+        self, client, test_statement
+    ):
+        """Should not expose statements of cards owned by another user"""
+        response = client.get(
+            f"/api/v1/statements/{test_statement['id']}", params={"user_id": 999}
+        )
+
+        assert response.status_code == 404
+
+
+class TestUpdateStatementDates:
+    """Test PUT /api/v1/statements/{statement_id}"""
+
+    def test_update_statement_dates_returns_409_when_modified_concurrently(
+        self, client, test_user, test_statement, monkeypatch
+    ):
+        """Should report a conflict when the statement changed since it was read"""
+        monkeypatch.setattr(
+            SQLAlchemyMonthlyStatementRepository, "save_if_unchanged", lambda self, statement: None
+        )
+
+        response = client.put(
+            f"/api/v1/statements/{test_statement['id']}",
+            json={"closing_date": "2025-01-16", "due_date": "2025-01-22"},
+            params={"user_id": test_user["id"]},
+        )
+
+        assert response.status_code == 409
+        unchanged = client.get(
+            f"/api/v1/statements/{test_statement['id']}",
+            params={"user_id": test_user["id"]},
+        )
+        assert unchanged.json()["closing_date"] == "2025-01-15"
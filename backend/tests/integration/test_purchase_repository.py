@@ -1,5 +1,5 @@
 import pytest
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.orm import sessionmaker, Session
 from decimal import Decimal
 from datetime import datetime, date
@@ -8,9 +8,11 @@ from app.domain.entities.purchase import Purchase
 
 from app.infrastructure.persistence.models.purchase_model import PurchaseModel
 from app.domain.value_objects.money import Money, Currency
+from app.domain.value_objects.dual_money import DualMoney
 from app.infrastructure.persistence.models.user_model import UserModel
 from app.infrastructure.persistence.models.category_model import CategoryModel
 from app.infrastructure.persistence.models.credit_card_model import CreditCardModel
+from app.infrastructure.persistence.models.exchange_rate_model import ExchangeRateModel
 from app.infrastructure.persistence.models.installment_model import InstallmentModel
 from app.infrastructure.persistence.models.payment_method_model import PaymentMethodModel
 from app.infrastructure.persistence.repositories.sqlalchemy_purchase_repository import (
@@ -131,6 +133,61 @@ class TestSQLAlchemyPurchaseRepositorySave:
         assert updated.id == saved.id
         assert updated.description == "Electronics Updated"
 
+    def test_should_update_exchange_rate_id_in_one_statement(self, db_session, purchase_repository):
+        db_session.add(ExchangeRateModel(
+            id=1,
+            date=date(2025, 1, 15),
+            from_currency="USD",
+            to_currency="ARS",
+            rate=Decimal("1000.0000"),
+            rate_type="OFFICIAL",
+            created_by_user_id=1,
+        ))
+        db_session.commit()
+        saved = purchase_repository.save(Purchase(
+            id=None,
+            user_id=1,
+            payment_method_id=1,
+            category_id=1,
+            purchase_date=date(2025, 1, 15),
+            description="Headphones",
+            total_amount=Money(Decimal("100000.00"), Currency.ARS),
+            installments_count=1,
+        ))
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        engine = db_session.get_bind()
+        event.listen(engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            updated = purchase_repository.save(Purchase(
+                id=saved.id,
+                user_id=1,
+                payment_method_id=1,
+                category_id=1,
+                purchase_date=date(2025, 1, 15),
+                description="Headphones",
+                total_amount=DualMoney(
+                    primary_amount=Decimal("100000.00"),
+                    primary_currency=Currency.ARS,
+                    secondary_amount=Decimal("100.00"),
+                    secondary_currency=Currency.USD,
+                    exchange_rate=Decimal("1000"),
+                ),
+                installments_count=1,
+                exchange_rate_id=1,
+            ))
+        finally:
+            event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+        assert updated.exchange_rate_id == 1
+        assert updated.total_amount.secondary_amount == Decimal("100.00")
+        updates = [s for s in statements if s.startswith("UPDATE")]
+        assert len(updates) == 1
+        assert "exchange_rate_id" in updates[0]
+
 
 class TestSQLAlchemyPurchaseRepositoryFindById:
     def test_should_find_existing_purchase(self, purchase_repository):
@@ -154,6 +211,63 @@ class TestSQLAlchemyPurchaseRepositoryFindById:
         assert purchase_repository.find_by_id(999) is None
 
 
+class TestSQLAlchemyPurchaseRepositoryFindByIdAndUser:
+    def test_should_find_purchase_only_for_its_user(self, purchase_repository):
+        saved = purchase_repository.save(Purchase(
+            id=None,
+            user_id=1,
+            payment_method_id=1,
+            category_id=1,
+            purchase_date=date(2025, 1, 15),
+            description="Test Purchase",
+            total_amount=Money(Decimal("5000.00"), Currency.ARS),
+            installments_count=1,
+        ))
+
+        found = purchase_repository.find_by_id_and_user(saved.id, 1)
+        assert found is not None
+        assert found.id == saved.id
+        assert purchase_repository.find_by_id_and_user(saved.id, 2) is None
+
+
+class TestSQLAlchemyPurchaseRepositoryLoadForUpdate:
+    def test_should_load_purchase_with_payment_method_and_credit_card(self, purchase_repository):
+        saved = purchase_repository.save(Purchase(
+            id=None,
+            user_id=1,
+            payment_method_id=1,
+            category_id=1,
+            purchase_date=date(2025, 1, 15),
+            description="Test Purchase",
+            total_amount=Money(Decimal("5000.00"), Currency.ARS),
+            installments_count=1,
+        ))
+
+        purchase, payment_method, credit_card = purchase_repository.load_for_update(saved.id, 1)
+
+        assert purchase.id == saved.id
+        assert payment_method.id == 1
+        assert credit_card.id == 1
+        assert credit_card.payment_method_id == 1
+
+    def test_should_return_none_for_nonexistent_id(self, purchase_repository):
+        assert purchase_repository.load_for_update(999, 1) is None
+
+    def test_should_return_none_for_other_user(self, purchase_repository):
+        saved = purchase_repository.save(Purchase(
+            id=None,
+            user_id=1,
+            payment_method_id=1,
+            category_id=1,
+            purchase_date=date(2025, 1, 15),
+            description="Test Purchase",
+            total_amount=Money(Decimal("5000.00"), Currency.ARS),
+            installments_count=1,
+        ))
+
+        assert purchase_repository.load_for_update(saved.id, 2) is None
+
+
 class TestSQLAlchemyPurchaseRepositoryFindByUserId:
     def test_should_return_all_purchases_for_user(self, purchase_repository):
         p1 = Purchase(
@@ -181,7 +295,65 @@ class TestSQLAlchemyPurchaseRepositoryFindByUserId:
         purchase_repository.save(p2)
 
         purchases = purchase_repository.find_by_user_id(1)
-        assert len(purchases) == 2
+        assert [p.description for p in purchases] == ["P2", "P1"]  # Most recent first
+
+
+class TestSQLAlchemyPurchaseRepositoryFindByUserAndDateRange:
+    def test_should_filter_purchases_by_date_range(self, purchase_repository):
+        for day, description in [(5, "Early"), (15, "Middle"), (25, "Late")]:
+            purchase_repository.save(
+                Purchase(
+                    id=None,
+                    user_id=1,
+                    payment_method_id=1,
+                    category_id=1,
+                    purchase_date=date(2025, 1, day),
+                    description=description,
+                    total_amount=Money(Decimal("1000.00"), Currency.ARS),
+                    installments_count=1,
+                )
+            )
+
+        in_range = purchase_repository.find_by_user_and_date_range(
+            1, date(2025, 1, 10), date(2025, 1, 25)
+        )
+        open_start = purchase_repository.find_by_user_and_date_range(
+            1, end_date=date(2025, 1, 15)
+        )
+        unbounded = purchase_repository.find_by_user_and_date_range(1)
+
+        assert sorted(p.description for p in in_range) == ["Late", "Middle"]
+        assert sorted(p.description for p in open_start) == ["Early", "Middle"]
+        assert len(unbounded) == 3
+
+
+class TestSQLAlchemyPurchaseRepositoryFindByUserAndCategory:
+    def test_should_return_category_purchases_most_recent_first(self, db_session, purchase_repository):
+        db_session.add(CategoryModel(id=2, name="Transport"))
+        db_session.commit()
+
+        for day, category_id, description in [
+            (5, 1, "Old"),
+            (10, 2, "Other category"),
+            (25, 1, "Recent"),
+        ]:
+            purchase_repository.save(
+                Purchase(
+                    id=None,
+                    user_id=1,
+                    payment_method_id=1,
+                    category_id=category_id,
+                    purchase_date=date(2025, 1, day),
+                    description=description,
+                    total_amount=Money(Decimal("1000.00"), Currency.ARS),
+                    installments_count=1,
+                )
+            )
+
+        purchases = purchase_repository.find_by_user_and_category(1, 1)
+
+        assert [p.description for p in purchases] == ["Recent", "Old"]
+        assert purchase_repository.find_by_user_and_category(2, 1) == []
 
 
 class TestSQLAlchemyPurchaseRepositoryFindByPaymentMethodId:
@@ -201,6 +373,67 @@ class TestSQLAlchemyPurchaseRepositoryFindByPaymentMethodId:
         purchases = purchase_repository.find_by_payment_method_id(1)
         assert len(purchases) >= 1
 
+    def test_should_return_payment_method_purchases_most_recent_first(self, purchase_repository):
+        for day, description in [(15, "Middle"), (5, "Old"), (25, "Recent")]:
+            purchase_repository.save(
+                Purchase(
+                    id=None,
+                    user_id=1,
+                    payment_method_id=1,
+                    category_id=1,
+                    purchase_date=date(2025, 1, day),
+                    description=description,
+                    total_amount=Money(Decimal("1000.00"), Currency.ARS),
+                    installments_count=1,
+                )
+            )
+
+        purchases = purchase_repository.find_by_payment_method_id(1)
+        assert [p.description for p in purchases] == ["Recent", "Middle", "Old"]
+
+
+class TestSQLAlchemyPurchaseRepositoryFindStatementRows:
+    def test_should_return_purchase_installment_and_category_rows(
+        self, purchase_repository, db_session
+    ):
+        saved = purchase_repository.save(
+            Purchase(
+                id=None,
+                user_id=1,
+                payment_method_id=1,
+                category_id=1,
+                purchase_date=date(2025, 1, 15),
+                description="TV",
+                total_amount=Money(Decimal("3000.00"), Currency.ARS),
+                installments_count=3,
+            )
+        )
+        db_session.add_all(
+            [
+                InstallmentModel(
+                    purchase_id=saved.id,
+                    installment_number=i,
+                    total_installments=3,
+                    amount=1000,
+                    currency="ARS",
+                    billing_period=f"20250{i}",
+                )
+                for i in range(1, 4)
+            ]
+        )
+        db_session.flush()
+
+        rows = purchase_repository.find_statement_rows(1, 99, "202502")
+
+        assert len(rows) == 1
+        purchase, installment, category_name = rows[0]
+        assert purchase.id == saved.id
+        assert installment.installment_number == 2
+        assert category_name == "Groceries"
+
+    def test_should_return_empty_list_for_other_payment_method(self, purchase_repository):
+        assert purchase_repository.find_statement_rows(2, 99, "202502") == []
+
 
 class TestSQLAlchemyPurchaseRepositoryDelete:
     def test_should_delete_existing_purchase(self, purchase_repository):
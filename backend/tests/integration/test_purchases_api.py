@@ -343,6 +343,71 @@ class TestUpdatePurchase:
         assert data["description"] == "Updated Description"
         assert data["total_amount"] == "1000.00"  # Unchanged
 
+    def test_patch_purchase_without_changes_returns_current_purchase(
+        self, client, test_user, test_credit_card, test_category
+    ):
+        """Should return the stored purchase when the update changes nothing"""
+        purchase_data = {
+            "payment_method_id": test_credit_card["payment_method_id"],
+            "category_id": test_category["id"],
+            "purchase_date": "2025-01-15",
+            "description": "Original Description",
+            "total_amount": 1000.00,
+            "currency": "ARS",
+            "installments_count": 1,
+        }
+
+        create_response = client.post(
+            "/api/v1/purchases", json=purchase_data, params={"user_id": test_user["id"]}
+        )
+        assert create_response.status_code == 201
+        purchase = create_response.json()
+
+        response = client.patch(
+            f"/api/v1/purchases/{purchase['id']}",
+            json={"description": "Original Description"},
+            params={"user_id": test_user["id"]}
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["id"] == purchase["id"]
+        assert data["description"] == "Original Description"
+        assert data["total_amount"] == "1000.00"
+
+    def test_patch_purchase_with_empty_body_returns_current_purchase(
+        self, client, test_user, test_credit_card, test_category
+    ):
+        """Should return the stored purchase when no field is given"""
+        purchase_data = {
+            "payment_method_id": test_credit_card["payment_method_id"],
+            "category_id": test_category["id"],
+            "purchase_date": "2025-01-15",
+            "description": "Original Description",
+            "total_amount": 1000.00,
+            "currency": "ARS",
+            "installments_count": 1,
+        }
+
+        create_response = client.post(
+            "/api/v1/purchases", json=purchase_data, params={"user_id": test_user["id"]}
+        )
+        assert create_response.status_code == 201
+        purchase = create_response.json()
+
+        response = client.patch(
+            f"/api/v1/purchases/{purchase['id']}",
+            json={},
+            params={"user_id": test_user["id"]}
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["id"] == purchase["id"]
+        assert data["category_id"] == test_category["id"]
+        assert data["description"] == "Original Description"
+        assert data["total_amount"] == "1000.00"
+
     def test_patch_purchase_invalid_id_returns_404(self, client, test_user):
         """Should return 404 for invalid purchase ID"""
         update_data = {"description": "Updated Description"}
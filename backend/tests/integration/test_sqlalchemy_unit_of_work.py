@@ -238,3 +238,54 @@ class TestSQLAlchemyUnitOfWork:
             assert found_user.name == "Carlos"
             assert len(all_categories) == 1
             assert all_categories[0].name == "Travel"
+
+    def test_nested_with_reuses_open_session(self, session_factory, make_user):
+        """
+        GIVEN: Un UoW ya abierto
+        WHEN: Se vuelve a entrar con `with` (p. ej. un use case dentro de un endpoint)
+        THEN: Se reutiliza la misma sesión y solo se cierra al salir del más externo
+        """
+        user = make_user(1, "Lucia", "lucia@mail.com", 70000)
+        uow = SQLAlchemyUnitOfWork(session_factory)
+
+        with uow:
+            outer_session = uow.session
+            with uow:
+                assert uow.session is outer_session
+                uow.users.save(user)
+            # The inner exit must not close the session nor drop pending changes
+            assert uow.users.find_by_id(1) is not None
+            uow.commit()
+
+        with SQLAlchemyUnitOfWork(session_factory) as uow:
+            assert uow.users.find_by_id(1) is not None
+
+    def test_readonly_reads_without_transaction(self, session_factory, make_user):
+        """
+        GIVEN: Un usuario persistido
+        WHEN: Se lee dentro de `with uow.readonly()`
+        THEN: La conexión usa AUTOCOMMIT y el siguiente `with uow` vuelve a ser transaccional
+        """
+        with SQLAlchemyUnitOfWork(session_factory) as uow:
+            uow.users.save(make_user(1, "Lucia", "lucia@mail.com", 70000))
+            uow.commit()
+
+        uow = SQLAlchemyUnitOfWork(session_factory)
+        with uow.readonly():
+            assert uow.session.connection().get_execution_options().get("isolation_level") == "AUTOCOMMIT"
+            assert uow.users.find_by_id(1) is not None
+
+        with uow:
+            assert uow.session.connection().get_execution_options().get("isolation_level") is None
+
+    def test_readonly_flag_does_not_leak_when_not_entered(self, session_factory):
+        """
+        GIVEN: Un unit of work sobre el que se llama `readonly()` sin entrar al bloque
+        WHEN: Se abre luego un `with uow` normal
+        THEN: La conexión sigue siendo transaccional
+        """
+        uow = SQLAlchemyUnitOfWork(session_factory)
+        uow.readonly()
+
+        with uow:
+            assert uow.session.connection().get_execution_options().get("isolation_level") is None
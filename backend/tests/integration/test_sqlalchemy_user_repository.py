@@ -156,6 +156,21 @@ class TestSQLAlchemyUserRepositoryFind:
         assert len(all_users) == 3
         assert all(isinstance(u, User) for u in all_users)
 
+    def test_should_find_users_by_ids(self, user_repository, make_user):
+        """
+        Given: Multiple users in DB
+        When: I call find_by_ids() with a subset of their IDs
+        Then: Should return only the matching users
+        """
+        john = user_repository.save(make_user(None, "John", "john@example.com", 5000))
+        user_repository.save(make_user(None, "Jane", "jane@example.com", 6000))
+        bob = user_repository.save(make_user(None, "Bob", "bob@example.com", 7000))
+
+        found = user_repository.find_by_ids([john.id, bob.id, 999])
+
+        assert sorted(u.name for u in found) == ["Bob", "John"]
+        assert user_repository.find_by_ids([]) == []
+
     def test_should_return_empty_list_when_no_users(self, user_repository):
         """
         Given: No users in DB
@@ -164,9 +164,9 @@ class TestListBankAccountsUseCase:
                 currency=Currency.USD,
             ),
         ]
-        mock_uow.users.find_by_id.return_value = Mock()  # Mock user exists
-        mock_uow.bank_accounts.find_by_user_id.return_value = mock_bank_accounts
+        mock_uow.bank_accounts.find_by_user_id_checked.return_value = mock_bank_accounts
         mock_uow.__enter__ = Mock(return_value=mock_uow)
+        mock_uow.readonly = Mock(return_value=mock_uow)
         mock_uow.__exit__ = Mock(return_value=None)
 
         use_case = ListBankAccountsUseCase(mock_uow)
@@ -175,8 +175,8 @@ class TestListBankAccountsUseCase:
         result = use_case.execute(user_id=1)
 
         # Assert
-        mock_uow.users.find_by_id.assert_called_once_with(1)
-        mock_uow.bank_accounts.find_by_user_id.assert_called_once_with(1)
+        mock_uow.bank_accounts.find_by_user_id_checked.assert_called_once_with(1)
+        mock_uow.users.find_by_id.assert_not_called()
         assert len(result) == 2
         assert all(isinstance(dto, BankAccountResponseDTO) for dto in result)
 
@@ -209,6 +209,7 @@ class TestListBankAccountsUseCase:
         ]
         mock_uow.bank_accounts.find_all.return_value = mock_bank_accounts
         mock_uow.__enter__ = Mock(return_value=mock_uow)
+        mock_uow.readonly = Mock(return_value=mock_uow)
         mock_uow.__exit__ = Mock(return_value=None)
 
         use_case = ListBankAccountsUseCase(mock_uow)
@@ -225,8 +226,9 @@ class TestListBankAccountsUseCase:
     def test_should_raise_error_when_user_does_not_exist(self):
         # Arrange
         mock_uow = Mock()
-        mock_uow.users.find_by_id.return_value = None  # User doesn't exist
+        mock_uow.bank_accounts.find_by_user_id_checked.return_value = None  # User doesn't exist
         mock_uow.__enter__ = Mock(return_value=mock_uow)
+        mock_uow.readonly = Mock(return_value=mock_uow)
         mock_uow.__exit__ = Mock(return_value=None)
 
         use_case = ListBankAccountsUseCase(mock_uow)
@@ -235,15 +237,14 @@ class TestListBankAccountsUseCase:
         with pytest.raises(ValueError, match="User does not exist."):
             use_case.execute(user_id=999)
 
-        mock_uow.users.find_by_id.assert_called_once_with(999)
-        mock_uow.bank_accounts.find_by_user_id.assert_not_called()
+        mock_uow.bank_accounts.find_by_user_id_checked.assert_called_once_with(999)
 
     def test_should_return_empty_list_when_no_accounts_for_user(self):
         # Arrange
         mock_uow = Mock()
-        mock_uow.users.find_by_id.return_value = Mock()  # User exists
-        mock_uow.bank_accounts.find_by_user_id.return_value = []
+        mock_uow.bank_accounts.find_by_user_id_checked.return_value = []  # User exists
         mock_uow.__enter__ = Mock(return_value=mock_uow)
+        mock_uow.readonly = Mock(return_value=mock_uow)
         mock_uow.__exit__ = Mock(return_value=None)
 
         use_case = ListBankAccountsUseCase(mock_uow)
@@ -252,8 +253,7 @@ class TestListBankAccountsUseCase:
         result = use_case.execute(user_id=1)
 
         # Assert
-        mock_uow.users.find_by_id.assert_called_once_with(1)
-        mock_uow.bank_accounts.find_by_user_id.assert_called_once_with(1)
+        mock_uow.bank_accounts.find_by_user_id_checked.assert_called_once_with(1)
         assert result == []
 
     def test_should_return_empty_list_when_no_accounts_in_system(self):
@@ -261,6 +261,7 @@ class TestListBankAccountsUseCase:
         mock_uow = Mock()
         mock_uow.bank_accounts.find_all.return_value = []
         mock_uow.__enter__ = Mock(return_value=mock_uow)
+        mock_uow.readonly = Mock(return_value=mock_uow)
         mock_uow.__exit__ = Mock(return_value=None)
 
         use_case = ListBankAccountsUseCase(mock_uow)
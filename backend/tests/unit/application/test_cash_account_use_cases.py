@@ -150,6 +150,7 @@ class TestListAllCashAccountsUseCase:
         ]
         mock_uow.cash_accounts.find_all.return_value = mock_cash_accounts
         mock_uow.__enter__ = Mock(return_value=mock_uow)
+        mock_uow.readonly = Mock(return_value=mock_uow)
         mock_uow.__exit__ = Mock(return_value=None)
 
         use_case = ListAllCashAccountsUseCase(mock_uow)
@@ -185,6 +186,7 @@ class TestListCashAccountsByUserIdUseCase:
         ]
         mock_uow.cash_accounts.find_by_user_id.return_value = mock_cash_accounts
         mock_uow.__enter__ = Mock(return_value=mock_uow)
+        mock_uow.readonly = Mock(return_value=mock_uow)
         mock_uow.__exit__ = Mock(return_value=None)
 
         use_case = ListCashAccountsByUserIdUseCase(mock_uow)
@@ -201,6 +203,7 @@ class TestListCashAccountsByUserIdUseCase:
         mock_uow = Mock()
         mock_uow.cash_accounts.find_by_user_id.return_value = []
         mock_uow.__enter__ = Mock(return_value=mock_uow)
+        mock_uow.readonly = Mock(return_value=mock_uow)
         mock_uow.__exit__ = Mock(return_value=None)
 
         use_case = ListCashAccountsByUserIdUseCase(mock_uow)
@@ -188,6 +188,9 @@ class TestCreatePurchaseUseCase:
         mock_unit_of_work.purchases.save.assert_called_once()
         mock_unit_of_work.installments.save_all.assert_called_once()
         mock_unit_of_work.commit.assert_called_once()
+        mock_unit_of_work.credit_cards.find_by_payment_method_id.assert_called_once_with(
+            1, lock=True
+        )
 
     def test_should_create_credit_card_purchase_with_multiple_installments(
         self, mock_unit_of_work, mock_payment_method_credit_card, mock_credit_card, mock_category
@@ -31,7 +31,7 @@ class TestDeletePurchaseUseCase:
             total_amount=Money(100.00, Currency.ARS),
             installments_count=1,
         )
-        mock_purchase_repo.find_by_id.return_value = purchase
+        mock_purchase_repo.find_by_id_and_user.return_value = purchase
 
         # Mock installments and expenses
         mock_installment = MagicMock()
@@ -46,7 +46,7 @@ class TestDeletePurchaseUseCase:
         use_case.execute(1, 1)
 
         # Assert
-        mock_purchase_repo.find_by_id.assert_called_once_with(1)
+        mock_purchase_repo.find_by_id_and_user.assert_called_once_with(1, 1)
         mock_budget_expense_repo.find_by_installment_id.assert_called_once_with(10)
         mock_installment_repo.delete.assert_called_once_with(10)
         mock_budget_expense_repo.find_by_purchase_id.assert_called_once_with(1)
@@ -59,7 +59,7 @@ class TestDeletePurchaseUseCase:
         mock_purchase_repo = MagicMock()
         mock_uow.purchases = mock_purchase_repo
 
-        mock_purchase_repo.find_by_id.return_value = None
+        mock_purchase_repo.find_by_id_and_user.return_value = None
 
         use_case = DeletePurchaseUseCase(mock_uow)
 
@@ -76,18 +76,8 @@ class TestDeletePurchaseUseCase:
         mock_purchase_repo = MagicMock()
         mock_uow.purchases = mock_purchase_repo
 
-        # Mock finding the purchase that belongs to user 2
-        purchase = Purchase(
-            id=1,
-            user_id=2,  # Different user
-            payment_method_id=1,
-            category_id=1,
-            purchase_date="2025-01-01",
-            description="Test purchase",
-            total_amount=Money(100.00, Currency.ARS),
-            installments_count=1,
-        )
-        mock_purchase_repo.find_by_id.return_value = purchase
+        # The purchase belongs to user 2, so the repository finds nothing for user 1
+        mock_purchase_repo.find_by_id_and_user.return_value = None
 
         use_case = DeletePurchaseUseCase(mock_uow)
 
@@ -4,6 +4,7 @@ from unittest.mock import Mock
 from app.application.use_cases.get_budget_details_use_case import GetBudgetDetailsUseCase
 from app.domain.entities.monthly_budget import MonthlyBudget
 from app.domain.entities.budget_participant import BudgetParticipant
+from app.domain.entities.budget_with_expenses import BudgetWithExpenses
 from app.domain.entities.user import User
 from app.domain.value_objects.budget_status import BudgetStatus
 from app.domain.value_objects.money import Money, Currency
@@ -47,17 +48,19 @@ class TestGetBudgetDetailsUseCase:
             BudgetParticipant(id=2, budget_id=1, user_id=2),
         ]
 
-        mock_unit_of_work.monthly_budgets.find_by_id.return_value = budget
-        mock_unit_of_work.budget_participants.find_by_budget_and_user.return_value = participants[1]  # User 2 is participant
+        mock_unit_of_work.monthly_budgets.find_with_expenses.return_value = BudgetWithExpenses(
+            budget=budget, expenses=[], responsibilities={}  # No expenses for simplicity
+        )  # User 2 is participant
         mock_unit_of_work.budget_participants.find_by_budget_id.return_value = participants
-        mock_unit_of_work.budget_expenses.find_by_budget_id.return_value = []  # No expenses for simplicity
-        mock_unit_of_work.budget_expense_responsibilities.find_by_budget_expense_id.return_value = []
-        mock_unit_of_work.users.find_by_id.side_effect = lambda user_id: User(
-            id=user_id,
-            name=f"User {user_id}",
-            email=f"user{user_id}@example.com",
-            wage=Money(50000, Currency.ARS)
-        )
+        mock_unit_of_work.users.find_by_ids.side_effect = lambda user_ids: [
+            User(
+                id=user_id,
+                name=f"User {user_id}",
+                email=f"user{user_id}@example.com",
+                wage=Money(50000, Currency.ARS)
+            )
+            for user_id in user_ids
+        ]
 
         use_case = GetBudgetDetailsUseCase(mock_unit_of_work)
 
@@ -69,8 +72,8 @@ class TestGetBudgetDetailsUseCase:
         assert result.budget.name == "Test Budget"
         assert result.budget.participant_count == 2
 
-        mock_unit_of_work.monthly_budgets.find_by_id.assert_called_once_with(1)
-        mock_unit_of_work.budget_participants.find_by_budget_and_user.assert_called_once_with(1, 2)
+        mock_unit_of_work.monthly_budgets.find_with_expenses.assert_called_once_with(1, participant_user_id=2)
+        mock_unit_of_work.monthly_budgets.find_by_id.assert_not_called()
         mock_unit_of_work.budget_participants.find_by_budget_id.assert_called_once_with(1)
 
     def test_should_fail_when_budget_not_found(self, mock_unit_of_work):
@@ -80,6 +83,7 @@ class TestGetBudgetDetailsUseCase:
         THEN: BusinessRuleViolationError is raised
         """
         # Arrange
+        mock_unit_of_work.monthly_budgets.find_with_expenses.return_value = None
         mock_unit_of_work.monthly_budgets.find_by_id.return_value = None
 
         use_case = GetBudgetDetailsUseCase(mock_unit_of_work)
@@ -105,8 +109,8 @@ class TestGetBudgetDetailsUseCase:
             updated_at=None,
         )
 
+        mock_unit_of_work.monthly_budgets.find_with_expenses.return_value = None  # User not participant
         mock_unit_of_work.monthly_budgets.find_by_id.return_value = budget
-        mock_unit_of_work.budget_participants.find_by_budget_and_user.return_value = None  # User not participant
 
         use_case = GetBudgetDetailsUseCase(mock_unit_of_work)
 
@@ -0,0 +1,86 @@
+import pytest
+from datetime import date, datetime
+from decimal import Decimal
+from unittest.mock import Mock
+
+from app.application.use_cases.get_latest_exchange_rate_use_case import (
+    GetLatestExchangeRateQuery,
+    GetLatestExchangeRateUseCase,
+)
+from app.application.services.ttl_cache import TTLCache
+from app.domain.entities.exchange_rate import ExchangeRate
+from app.domain.value_objects.exchange_rate_type import ExchangeRateType
+from app.domain.value_objects.money import Currency
+
+
+@pytest.fixture
+def rate_cache():
+    return TTLCache()
+
+
+@pytest.fixture
+def mock_unit_of_work():
+    uow = Mock()
+    uow.exchange_rates = Mock()
+    uow.exchange_rates.find_closest_by_date_and_type.return_value = ExchangeRate(
+        id=1,
+        date=date(2025, 1, 15),
+        from_currency=Currency.USD,
+        to_currency=Currency.ARS,
+        rate=Decimal("1200"),
+        rate_type=ExchangeRateType.MEP,
+        created_at=datetime(2025, 1, 15, 12, 0, 0),
+    )
+    uow.__enter__ = Mock(return_value=uow)
+    uow.__exit__ = Mock(return_value=None)
+    return uow
+
+
+def _query(rate_type="mep", user_id=None):
+    return GetLatestExchangeRateQuery(
+        from_currency="USD",
+        to_currency="ARS",
+        rate_type=rate_type,
+        user_id=user_id,
+        reference_date=date(2025, 1, 20),
+    )
+
+
+class TestGetLatestExchangeRateUseCase:
+
+    def test_should_reuse_cached_rate_for_same_query(self, mock_unit_of_work, rate_cache):
+        use_case = GetLatestExchangeRateUseCase(mock_unit_of_work, rate_cache)
+
+        first = use_case.execute(_query())
+        second = use_case.execute(_query())
+
+        assert first.exchange_rate.id == 1
+        assert second.exchange_rate == first.exchange_rate
+        mock_unit_of_work.exchange_rates.find_closest_by_date_and_type.assert_called_once()
+
+    def test_should_query_again_after_cache_is_cleared(self, mock_unit_of_work, rate_cache):
+        use_case = GetLatestExchangeRateUseCase(mock_unit_of_work, rate_cache)
+
+        use_case.execute(_query())
+        rate_cache.clear()
+        use_case.execute(_query())
+
+        assert mock_unit_of_work.exchange_rates.find_closest_by_date_and_type.call_count == 2
+
+    def test_should_key_custom_rates_by_user(self, mock_unit_of_work, rate_cache):
+        use_case = GetLatestExchangeRateUseCase(mock_unit_of_work, rate_cache)
+
+        use_case.execute(_query(rate_type="custom", user_id=1))
+        use_case.execute(_query(rate_type="custom", user_id=2))
+        use_case.execute(_query(rate_type="custom", user_id=1))
+
+        assert mock_unit_of_work.exchange_rates.find_closest_by_date_and_type.call_count == 2
+
+    def test_should_not_cache_missing_rates(self, mock_unit_of_work, rate_cache):
+        mock_unit_of_work.exchange_rates.find_closest_by_date_and_type.return_value = None
+        use_case = GetLatestExchangeRateUseCase(mock_unit_of_work, rate_cache)
+
+        assert use_case.execute(_query()).exchange_rate is None
+        use_case.execute(_query())
+
+        assert mock_unit_of_work.exchange_rates.find_closest_by_date_and_type.call_count == 2
@@ -47,7 +47,7 @@ class TestGetPurchaseByIdUseCase:
         THEN: Returns purchase
         """
         # Arrange
-        mock_unit_of_work.purchases.find_by_id.return_value = sample_purchase
+        mock_unit_of_work.purchases.find_by_id_and_user.return_value = sample_purchase
         query = GetPurchaseByIdQuery(purchase_id=1, user_id=10)
         use_case = GetPurchaseByIdUseCase(mock_unit_of_work)
 
@@ -58,7 +58,7 @@ class TestGetPurchaseByIdUseCase:
         assert result is not None
         assert result.id == 1
         assert result.user_id == 10
-        mock_unit_of_work.purchases.find_by_id.assert_called_once_with(1)
+        mock_unit_of_work.purchases.find_by_id_and_user.assert_called_once_with(1, 10)
 
     def test_should_return_none_when_purchase_not_found(self, mock_unit_of_work):
         """
@@ -67,7 +67,7 @@ class TestGetPurchaseByIdUseCase:
         THEN: Returns None
         """
         # Arrange
-        mock_unit_of_work.purchases.find_by_id.return_value = None
+        mock_unit_of_work.purchases.find_by_id_and_user.return_value = None
         query = GetPurchaseByIdQuery(purchase_id=999, user_id=10)
         use_case = GetPurchaseByIdUseCase(mock_unit_of_work)
 
@@ -85,8 +85,8 @@ class TestGetPurchaseByIdUseCase:
         WHEN: Execute query with different user_id
         THEN: Returns None (authorization check)
         """
-        # Arrange
-        mock_unit_of_work.purchases.find_by_id.return_value = sample_purchase
+        # Arrange: the repository filters out purchases of other users
+        mock_unit_of_work.purchases.find_by_id_and_user.return_value = None
         query = GetPurchaseByIdQuery(purchase_id=1, user_id=999)  # Different user
         use_case = GetPurchaseByIdUseCase(mock_unit_of_work)
 
@@ -3,7 +3,6 @@ from unittest.mock import Mock
 
 from app.application.use_cases.list_budgets_by_period_use_case import ListBudgetsUseCase
 from app.domain.entities.monthly_budget import MonthlyBudget
-from app.domain.entities.budget_participant import BudgetParticipant
 from app.domain.value_objects.budget_status import BudgetStatus
 
 
@@ -57,12 +56,10 @@ class TestListBudgetsUseCase:
         )
 
         # User 1 is participant in budget1 and budget2
-        mock_unit_of_work.monthly_budgets.find_by_user_participant.return_value = [budget1, budget2]
-
-        mock_unit_of_work.budget_participants.find_by_budget_id.side_effect = lambda budget_id: {
-            1: [BudgetParticipant(id=1, budget_id=1, user_id=1), BudgetParticipant(id=2, budget_id=1, user_id=2)],
-            2: [BudgetParticipant(id=3, budget_id=2, user_id=1)],
-        }.get(budget_id, [])
+        mock_unit_of_work.monthly_budgets.find_by_user_participant_with_counts.return_value = [
+            (budget1, 2),
+            (budget2, 1),
+        ]
 
         use_case = ListBudgetsUseCase(mock_unit_of_work)
 
@@ -75,6 +72,7 @@ class TestListBudgetsUseCase:
         assert result[0].participant_count == 2
         assert result[1].id == 2
         assert result[1].participant_count == 1
+        mock_unit_of_work.monthly_budgets.find_by_user_participant_with_counts.assert_called_once_with(1)
 
     def test_should_return_empty_list_when_no_budgets_for_user(self, mock_unit_of_work):
         """
@@ -83,7 +81,7 @@ class TestListBudgetsUseCase:
         THEN: Return empty list
         """
         # Arrange
-        mock_unit_of_work.monthly_budgets.find_by_user_participant.return_value = []
+        mock_unit_of_work.monthly_budgets.find_by_user_participant_with_counts.return_value = []
 
         use_case = ListBudgetsUseCase(mock_unit_of_work)
 
@@ -0,0 +1,58 @@
+import pytest
+from unittest.mock import Mock
+
+from app.application.use_cases.create_category_use_case import (
+    CreateCategoryUseCase,
+    CreateCategoryCommand,
+)
+from app.application.use_cases.list_categories_use_case import ListCategoriesUseCase
+from app.application.services.ttl_cache import TTLCache
+from app.domain.entities.category import Category
+
+
+@pytest.fixture
+def cache():
+    return TTLCache()
+
+
+@pytest.fixture
+def mock_unit_of_work():
+    uow = Mock()
+    uow.categories = Mock()
+    uow.categories.find_all.return_value = [Category(id=1, name="Groceries")]
+    uow.__enter__ = Mock(return_value=uow)
+    uow.readonly = Mock(return_value=uow)
+    uow.__exit__ = Mock(return_value=None)
+    return uow
+
+
+class TestListCategoriesUseCase:
+
+    def test_should_return_cached_categories_on_repeated_calls(self, mock_unit_of_work, cache):
+        """
+        GIVEN: Categories were already listed
+        WHEN: Execute use case again
+        THEN: Categories are returned without querying the repository
+        """
+        use_case = ListCategoriesUseCase(mock_unit_of_work, cache)
+
+        first = use_case.execute()
+        second = use_case.execute()
+
+        assert first == second == [Category(id=1, name="Groceries")]
+        mock_unit_of_work.categories.find_all.assert_called_once()
+
+    def test_should_reload_categories_after_category_is_created(self, mock_unit_of_work, cache):
+        """
+        GIVEN: Categories were already listed
+        WHEN: A new category is created
+        THEN: The next listing queries the repository again
+        """
+        use_case = ListCategoriesUseCase(mock_unit_of_work, cache)
+        use_case.execute()
+
+        mock_unit_of_work.categories.save.return_value = Category(id=2, name="Transport")
+        CreateCategoryUseCase(mock_unit_of_work, cache).execute(CreateCategoryCommand(name="Transport"))
+        use_case.execute()
+
+        assert mock_unit_of_work.categories.find_all.call_count == 2
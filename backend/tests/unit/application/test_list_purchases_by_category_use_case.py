@@ -29,24 +29,19 @@ class TestListPurchasesByCategoryUseCase:
         THEN: Returns only purchases for that category, sorted by date
         """
         # Arrange
-        all_purchases = [
-            Purchase(
-                id=1, user_id=10, payment_method_id=1, category_id=1,
-                purchase_date=date(2025, 1, 10), description="Old Electronics",
-                total_amount=Money(Decimal("1000.00"), Currency.ARS), installments_count=1
-            ),
-            Purchase(
-                id=2, user_id=10, payment_method_id=1, category_id=2,  # Different category
-                purchase_date=date(2025, 1, 15), description="Food",
-                total_amount=Money(Decimal("500.00"), Currency.ARS), installments_count=1
-            ),
+        category_purchases = [
             Purchase(
                 id=3, user_id=10, payment_method_id=1, category_id=1,
                 purchase_date=date(2025, 1, 20), description="Recent Electronics",
                 total_amount=Money(Decimal("2000.00"), Currency.ARS), installments_count=1
             ),
+            Purchase(
+                id=1, user_id=10, payment_method_id=1, category_id=1,
+                purchase_date=date(2025, 1, 10), description="Old Electronics",
+                total_amount=Money(Decimal("1000.00"), Currency.ARS), installments_count=1
+            ),
         ]
-        mock_unit_of_work.purchases.find_by_user_id.return_value = all_purchases
+        mock_unit_of_work.purchases.find_by_user_and_category.return_value = category_purchases
         
         query = ListPurchasesByCategoryQuery(category_id=1, user_id=10)
         use_case = ListPurchasesByCategoryUseCase(mock_unit_of_work)
@@ -59,6 +54,7 @@ class TestListPurchasesByCategoryUseCase:
         assert result[0].id == 3  # Most recent first
         assert result[1].id == 1
         assert all(p.category_id == 1 for p in result)
+        mock_unit_of_work.purchases.find_by_user_and_category.assert_called_once_with(10, 1)
     
     def test_should_return_empty_list_when_no_purchases_in_category(self, mock_unit_of_work):
         """
@@ -67,14 +63,7 @@ class TestListPurchasesByCategoryUseCase:
         THEN: Returns empty list
         """
         # Arrange
-        all_purchases = [
-            Purchase(
-                id=1, user_id=10, payment_method_id=1, category_id=2,
-                purchase_date=date(2025, 1, 10), description="Food",
-                total_amount=Money(Decimal("500.00"), Currency.ARS), installments_count=1
-            ),
-        ]
-        mock_unit_of_work.purchases.find_by_user_id.return_value = all_purchases
+        mock_unit_of_work.purchases.find_by_user_and_category.return_value = []
         
         query = ListPurchasesByCategoryQuery(category_id=1, user_id=10)
         use_case = ListPurchasesByCategoryUseCase(mock_unit_of_work)
@@ -17,6 +17,7 @@ def mock_unit_of_work():
     uow = Mock()
     uow.purchases = Mock()
     uow.__enter__ = Mock(return_value=uow)
+    uow.readonly = Mock(return_value=uow)
     uow.__exit__ = Mock(return_value=None)
     return uow
 
@@ -30,17 +31,8 @@ class TestListPurchasesByUserUseCase:
         THEN: Returns all purchases sorted by date descending
         """
         # Arrange
+        # Sorted by date descending in the repository
         purchases = [
-            Purchase(
-                id=1,
-                user_id=10,
-                payment_method_id=1,
-                category_id=1,
-                purchase_date=date(2025, 1, 10),
-                description="Old",
-                total_amount=Money(Decimal("1000.00"), Currency.ARS),
-                installments_count=1,
-            ),
             Purchase(
                 id=2,
                 user_id=10,
@@ -61,6 +53,16 @@ class TestListPurchasesByUserUseCase:
                 total_amount=Money(Decimal("1500.00"), Currency.ARS),
                 installments_count=1,
             ),
+            Purchase(
+                id=1,
+                user_id=10,
+                payment_method_id=1,
+                category_id=1,
+                purchase_date=date(2025, 1, 10),
+                description="Old",
+                total_amount=Money(Decimal("1000.00"), Currency.ARS),
+                installments_count=1,
+            ),
         ]
         mock_unit_of_work.purchases.find_by_user_id.return_value = purchases
         query = ListPurchasesByUserQuery(user_id=10)
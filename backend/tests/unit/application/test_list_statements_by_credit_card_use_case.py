@@ -66,7 +66,7 @@ class TestListStatementByCreditCardUseCase:
     def test_raises_credit_card_not_found_when_credit_card_does_not_exist(
         self, uow_mock, use_case
     ):
-        uow_mock.credit_cards.find_by_id.return_value = None
+        uow_mock.monthly_statements.find_by_credit_card_for_user.return_value = (None, [])
         query = ListStatementByCreditCardQuery(user_id=1, credit_card_id=1)
 
         with pytest.raises(
@@ -74,14 +74,15 @@ class TestListStatementByCreditCardUseCase:
         ):
             use_case.execute(query)
 
-        uow_mock.credit_cards.find_by_id.assert_called_once_with(1)
-        uow_mock.monthly_statements.find_by_credit_card_id.assert_not_called()
+        uow_mock.monthly_statements.find_by_credit_card_for_user.assert_called_once_with(
+            1, 1, include_future=True
+        )
 
     def test_raises_credit_card_owner_mismatch_when_user_does_not_own_credit_card(
         self, uow_mock, make_credit_card, use_case
     ):
         credit_card = make_credit_card(id=1, user_id=2)
-        uow_mock.credit_cards.find_by_id.return_value = credit_card
+        uow_mock.monthly_statements.find_by_credit_card_for_user.return_value = (credit_card, [])
         query = ListStatementByCreditCardQuery(user_id=1, credit_card_id=1)
 
         with pytest.raises(
@@ -90,14 +91,14 @@ class TestListStatementByCreditCardUseCase:
         ):
             use_case.execute(query)
 
-        uow_mock.credit_cards.find_by_id.assert_called_once_with(1)
-        uow_mock.monthly_statements.find_by_credit_card_id.assert_not_called()
+        uow_mock.monthly_statements.find_by_credit_card_for_user.assert_called_once_with(
+            1, 1, include_future=True
+        )
 
     def test_returns_sorted_statements_when_credit_card_exists_and_belongs_to_user(
         self, uow_mock, make_credit_card, make_statement, use_case
     ):
         credit_card = make_credit_card(id=1, user_id=1)
-        uow_mock.credit_cards.find_by_id.return_value = credit_card
 
         statement1 = make_statement(
             id=1,
@@ -120,17 +121,17 @@ class TestListStatementByCreditCardUseCase:
             closing_date=date(2025, 3, 31),
             due_date=date(2025, 4, 15),
         )
-        uow_mock.monthly_statements.find_by_credit_card_id.return_value = [
-            statement3,
-            statement1,
-            statement2,
-        ]  # Unsorted
+        uow_mock.monthly_statements.find_by_credit_card_for_user.return_value = (
+            credit_card,
+            [statement1, statement2, statement3],  # Sorted by due_date in the repository
+        )
 
         query = ListStatementByCreditCardQuery(user_id=1, credit_card_id=1)
         result = use_case.execute(query)
 
-        uow_mock.credit_cards.find_by_id.assert_called_once_with(1)
-        uow_mock.monthly_statements.find_by_credit_card_id.assert_called_once_with(1, include_future=True)
+        uow_mock.monthly_statements.find_by_credit_card_for_user.assert_called_once_with(
+            1, 1, include_future=True
+        )
         
         # Check that statements are sorted by due_date
         assert len(result) == 3
@@ -142,8 +143,7 @@ class TestListStatementByCreditCardUseCase:
         self, uow_mock, make_credit_card, use_case
     ):
         credit_card = make_credit_card(id=1, user_id=1)
-        uow_mock.credit_cards.find_by_id.return_value = credit_card
-        uow_mock.monthly_statements.find_by_credit_card_id.return_value = []
+        uow_mock.monthly_statements.find_by_credit_card_for_user.return_value = (credit_card, [])
 
         query = ListStatementByCreditCardQuery(user_id=1, credit_card_id=1)
         result = use_case.execute(query)
@@ -154,7 +154,7 @@ class TestListStatementByCreditCardUseCase:
         self, uow_mock, make_credit_card, make_statement, use_case
     ):
         credit_card = make_credit_card(id=1, user_id=1)
-        uow_mock.credit_cards.find_by_id.return_value = credit_card
+
         statement = make_statement(
             id=1,
             credit_card_id=1,
@@ -162,7 +162,7 @@ class TestListStatementByCreditCardUseCase:
             closing_date=date(2025, 1, 31),
             due_date=date(2025, 2, 15),
         )
-        uow_mock.monthly_statements.find_by_credit_card_id.return_value = [statement]
+        uow_mock.monthly_statements.find_by_credit_card_for_user.return_value = (credit_card, [statement])
 
         query = ListStatementByCreditCardQuery(user_id=1, credit_card_id=1)
         use_case.execute(query)
@@ -34,6 +34,7 @@ def mock_unit_of_work():
     uow.installments = Mock()
     uow.credit_cards = Mock()
     uow.__enter__ = Mock(return_value=uow)
+    uow.readonly = Mock(return_value=uow)
     uow.__exit__ = Mock(return_value=None)
     return uow
 
@@ -56,16 +57,8 @@ class TestListInstallmentsByPurchaseUseCase:
             total_amount=Money(Decimal("30000.00"), Currency.ARS),
             installments_count=3,
         )
+        # Sorted by installment number in the repository
         installments = [
-            Installment(
-                id=3,
-                purchase_id=1,
-                installment_number=3,
-                total_installments=3,
-                amount=Money(Decimal("10000.00"), Currency.ARS),
-                billing_period="202504",
-                manually_assigned_statement_id=None
-            ),
             Installment(
                 id=1,
                 purchase_id=1,
@@ -84,6 +77,15 @@ class TestListInstallmentsByPurchaseUseCase:
                 billing_period="202503",
                 manually_assigned_statement_id=None
             ),
+            Installment(
+                id=3,
+                purchase_id=1,
+                installment_number=3,
+                total_installments=3,
+                amount=Money(Decimal("10000.00"), Currency.ARS),
+                billing_period="202504",
+                manually_assigned_statement_id=None
+            ),
         ]
 
         mock_unit_of_work.purchases.find_by_id.return_value = purchase
@@ -131,25 +133,26 @@ class TestListPurchasesByPaymentMethodUseCase:
             created_at=None,
             updated_at=None,
         )
+        # Sorted by date descending in the repository
         purchases = [
             Purchase(
-                id=1,
+                id=2,
                 user_id=10,
                 payment_method_id=1,
                 category_id=1,
-                purchase_date=date(2025, 1, 10),
-                description="Old",
-                total_amount=Money(Decimal("1000.00"), Currency.ARS),
+                purchase_date=date(2025, 1, 20),
+                description="Recent",
+                total_amount=Money(Decimal("2000.00"), Currency.ARS),
                 installments_count=1,
             ),
             Purchase(
-                id=2,
+                id=1,
                 user_id=10,
                 payment_method_id=1,
                 category_id=1,
-                purchase_date=date(2025, 1, 20),
-                description="Recent",
-                total_amount=Money(Decimal("2000.00"), Currency.ARS),
+                purchase_date=date(2025, 1, 10),
+                description="Old",
+                total_amount=Money(Decimal("1000.00"), Currency.ARS),
                 installments_count=1,
             ),
         ]
@@ -175,17 +178,7 @@ class TestListPurchasesByDateRangeUseCase:
         WHEN: Execute query with date range
         THEN: Returns only purchases within range
         """
-        all_purchases = [
-            Purchase(
-                id=1,
-                user_id=10,
-                payment_method_id=1,
-                category_id=1,
-                purchase_date=date(2025, 1, 5),
-                description="Before",
-                total_amount=Money(Decimal("1000.00"), Currency.ARS),
-                installments_count=1,
-            ),
+        purchases_in_range = [
             Purchase(
                 id=2,
                 user_id=10,
@@ -196,19 +189,9 @@ class TestListPurchasesByDateRangeUseCase:
                 total_amount=Money(Decimal("2000.00"), Currency.ARS),
                 installments_count=1,
             ),
-            Purchase(
-                id=3,
-                user_id=10,
-                payment_method_id=1,
-                category_id=1,
-                purchase_date=date(2025, 1, 25),
-                description="After",
-                total_amount=Money(Decimal("3000.00"), Currency.ARS),
-                installments_count=1,
-            ),
         ]
 
-        mock_unit_of_work.purchases.find_by_user_id.return_value = all_purchases
+        mock_unit_of_work.purchases.find_by_user_and_date_range.return_value = purchases_in_range
 
         query = ListPurchasesByDateRangeQuery(
             user_id=10, start_date=date(2025, 1, 10), end_date=date(2025, 1, 20)
@@ -219,6 +202,9 @@ class TestListPurchasesByDateRangeUseCase:
 
         assert len(result) == 1
         assert result[0].id == 2
+        mock_unit_of_work.purchases.find_by_user_and_date_range.assert_called_once_with(
+            10, date(2025, 1, 10), date(2025, 1, 20)
+        )
 
     def test_should_raise_error_when_start_after_end(self, mock_unit_of_work):
         """
@@ -0,0 +1,33 @@
+from app.application.services.ttl_cache import TTLCache
+
+
+class TestTTLCache:
+
+    def test_should_return_stored_value_until_it_expires(self):
+        cache = TTLCache()
+
+        cache.set("fresh", 1, ttl_seconds=60)
+        cache.set("stale", 2, ttl_seconds=0)
+
+        assert cache.get("fresh") == 1
+        assert cache.get("stale") is None
+        assert cache.get("missing") is None
+
+    def test_should_evict_oldest_entry_when_full(self):
+        cache = TTLCache(max_entries=2)
+
+        cache.set("a", 1, ttl_seconds=60)
+        cache.set("b", 2, ttl_seconds=60)
+        cache.set("c", 3, ttl_seconds=60)
+
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+        assert cache.get("c") == 3
+
+    def test_should_drop_everything_on_clear(self):
+        cache = TTLCache()
+        cache.set("a", 1, ttl_seconds=60)
+
+        cache.clear()
+
+        assert cache.get("a") is None
@@ -0,0 +1,137 @@
+import pytest
+from datetime import date
+from decimal import Decimal
+from unittest.mock import Mock
+
+from app.application.use_cases.update_expense_responsibilities_use_case import (
+    UpdateExpenseResponsibilitiesCommand,
+    UpdateExpenseResponsibilitiesUseCase,
+)
+from app.application.exceptions.application_exceptions import BusinessRuleViolationError
+from app.domain.entities.budget_expense import BudgetExpense
+from app.domain.entities.budget_participant import BudgetParticipant
+from app.domain.entities.monthly_budget import MonthlyBudget
+from app.domain.entities.user import User
+from app.domain.value_objects.budget_status import BudgetStatus
+from app.domain.value_objects.money import Money, Currency
+from app.domain.value_objects.split_type import SplitType
+
+
+@pytest.fixture
+def mock_unit_of_work():
+    uow = Mock()
+    uow.__enter__ = Mock(return_value=uow)
+    uow.__exit__ = Mock(return_value=None)
+    return uow
+
+
+@pytest.fixture
+def budget_with_expense(mock_unit_of_work):
+    """An active budget with users 1, 2 and a deleted user 3 as participants"""
+    expense = BudgetExpense(
+        id=10,
+        budget_id=1,
+        purchase_id=5,
+        installment_id=None,
+        paid_by_user_id=1,
+        split_type=SplitType.EQUAL,
+        amount=Money(Decimal("300"), Currency.ARS),
+        currency="ARS",
+        description="Groceries",
+        date=date(2026, 1, 10),
+        payment_method_name=None,
+        created_at=date(2026, 1, 10),
+    )
+    budget = MonthlyBudget(
+        id=1,
+        name="Home",
+        description=None,
+        status=BudgetStatus.ACTIVE,
+        created_by_user_id=1,
+        created_at=None,
+        updated_at=None,
+    )
+    participants = [
+        BudgetParticipant(id=1, budget_id=1, user_id=1),
+        BudgetParticipant(id=2, budget_id=1, user_id=2),
+        BudgetParticipant(id=3, budget_id=1, user_id=3),
+    ]
+    mock_unit_of_work.budget_expenses.load_for_update.return_value = (expense, budget, participants)
+    mock_unit_of_work.users.find_by_ids.return_value = [
+        User(id=2, name="Bob", email="bob@example.com", wage=Money(100000, Currency.ARS)),
+        User(id=1, name="Ana", email="ana@example.com", wage=Money(200000, Currency.ARS)),
+    ]
+    return mock_unit_of_work
+
+
+class TestUpdateExpenseResponsibilitiesUseCase:
+
+    def test_should_split_equally_between_existing_participants(self, budget_with_expense):
+        """
+        GIVEN: A budget whose participants include a user that no longer exists
+        WHEN: The expense is switched to an equal split
+        THEN: Users are fetched in one batch and only existing users share the expense
+        """
+        use_case = UpdateExpenseResponsibilitiesUseCase(budget_with_expense)
+
+        result = use_case.execute(UpdateExpenseResponsibilitiesCommand(
+            budget_expense_id=10, split_type="equal", requesting_user_id=1
+        ))
+
+        assert result.success is True
+        budget_with_expense.users.find_by_ids.assert_called_once_with([1, 2, 3])
+        budget_with_expense.users.find_by_id.assert_not_called()
+        budget_with_expense.budget_expenses.update_split_type.assert_called_once_with(10, SplitType.EQUAL)
+        budget_with_expense.budget_expenses.save.assert_not_called()
+        expense_id, saved = budget_with_expense.budget_expense_responsibilities.replace_for_expense.call_args[0]
+        assert expense_id == 10
+        budget_with_expense.budget_expense_responsibilities.save_many.assert_not_called()
+        assert [r.user_id for r in saved] == [1, 2]
+        assert all(r.responsible_amount.amount == Decimal("150") for r in saved)
+        budget_with_expense.commit.assert_called_once()
+
+    def test_should_fail_when_responsible_user_is_not_participant(self, budget_with_expense):
+        """
+        GIVEN: An active budget with participants 1, 2 and 3
+        WHEN: A full_single split names user 4 as responsible
+        THEN: A BusinessRuleViolationError is raised and nothing is committed
+        """
+        use_case = UpdateExpenseResponsibilitiesUseCase(budget_with_expense)
+
+        with pytest.raises(BusinessRuleViolationError, match="not a participant"):
+            use_case.execute(UpdateExpenseResponsibilitiesCommand(
+                budget_expense_id=10,
+                split_type="full_single",
+                responsible_user_id=4,
+                requesting_user_id=1,
+            ))
+
+        budget_with_expense.commit.assert_not_called()
+
+    def test_should_fail_when_requesting_user_is_not_participant(self, budget_with_expense):
+        """
+        GIVEN: An active budget with participants 1, 2 and 3
+        WHEN: User 4 tries to change the split
+        THEN: A BusinessRuleViolationError is raised before any user is fetched
+        """
+        use_case = UpdateExpenseResponsibilitiesUseCase(budget_with_expense)
+
+        with pytest.raises(BusinessRuleViolationError, match="User 4 is not a participant"):
+            use_case.execute(UpdateExpenseResponsibilitiesCommand(
+                budget_expense_id=10, split_type="equal", requesting_user_id=4
+            ))
+
+        budget_with_expense.users.find_by_ids.assert_not_called()
+
+    def test_should_fail_when_split_type_is_invalid(self, budget_with_expense):
+        """
+        GIVEN: An active budget and a participant requesting the change
+        WHEN: The split type is not one of the known values
+        THEN: A BusinessRuleViolationError lists the valid split types
+        """
+        use_case = UpdateExpenseResponsibilitiesUseCase(budget_with_expense)
+
+        with pytest.raises(BusinessRuleViolationError, match="equal, proportional, custom, full_single"):
+            use_case.execute(UpdateExpenseResponsibilitiesCommand(
+                budget_expense_id=10, split_type="halves", requesting_user_id=1
+            ))
@@ -0,0 +1,138 @@
+from datetime import date, datetime
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+from app.application.use_cases.update_purchase_use_case import (
+    UpdatePurchaseCommand,
+    UpdatePurchaseUseCase,
+)
+from app.domain.entities.credit_card import CreditCard
+from app.domain.entities.exchange_rate import ExchangeRate
+from app.domain.entities.payment_method import PaymentMethod
+from app.domain.entities.purchase import Purchase
+from app.domain.value_objects.exchange_rate_type import ExchangeRateType
+from app.domain.value_objects.money import Money, Currency
+from app.domain.value_objects.payment_method_type import PaymentMethodType
+
+
+def _make_uow(installments_count=3):
+    uow = MagicMock()
+    purchase = Purchase(
+        id=1,
+        user_id=1,
+        payment_method_id=1,
+        category_id=1,
+        purchase_date=date(2025, 1, 15),
+        description="Test purchase",
+        total_amount=Money(Decimal("3000.00"), Currency.ARS),
+        installments_count=installments_count,
+    )
+    payment_method = PaymentMethod(
+        id=1, user_id=1, type=PaymentMethodType.CREDIT_CARD, name="Visa"
+    )
+    credit_card = CreditCard(
+        id=1,
+        payment_method_id=1,
+        user_id=1,
+        name="Visa",
+        bank="HSBC",
+        last_four_digits="1234",
+        billing_close_day=10,
+        payment_due_day=20,
+    )
+    uow.purchases.load_for_update.return_value = (purchase, payment_method, credit_card)
+    uow.purchases.save.side_effect = lambda p: p
+    return uow
+
+
+class TestUpdatePurchaseUseCase:
+    def test_should_not_regenerate_installments_when_total_is_unchanged(self):
+        # Arrange
+        uow = _make_uow()
+        use_case = UpdatePurchaseUseCase(uow)
+
+        # Act
+        use_case.execute(UpdatePurchaseCommand(
+            purchase_id=1,
+            user_id=1,
+            description="Renamed",
+            total_amount=Decimal("3000.00"),
+        ))
+
+        # Assert
+        uow.purchases.save.assert_called_once()
+        uow.installments.delete_by_purchase_id.assert_not_called()
+        uow.installments.save_all.assert_not_called()
+        uow.commit.assert_called_once()
+
+    def test_should_skip_the_write_when_only_the_stored_total_is_sent(self):
+        # Arrange
+        uow = _make_uow()
+        use_case = UpdatePurchaseUseCase(uow)
+
+        # Act
+        use_case.execute(UpdatePurchaseCommand(
+            purchase_id=1, user_id=1, total_amount=Decimal("3000.00")
+        ))
+
+        # Assert
+        uow.purchases.save.assert_not_called()
+        uow.installments.delete_by_purchase_id.assert_not_called()
+        uow.commit.assert_not_called()
+
+    def test_should_overwrite_the_single_installment_in_place(self):
+        # Arrange
+        uow = _make_uow(installments_count=1)
+        uow.installments.update_by_purchase_and_number.return_value = True
+        use_case = UpdatePurchaseUseCase(uow)
+
+        # Act
+        use_case.execute(UpdatePurchaseCommand(
+            purchase_id=1, user_id=1, total_amount=Decimal("3500.00")
+        ))
+
+        # Assert
+        [installment] = uow.installments.update_by_purchase_and_number.call_args[0]
+        assert installment.amount.amount == Decimal("3500.00")
+        uow.installments.delete_by_purchase_id.assert_not_called()
+        uow.installments.save_all.assert_not_called()
+        uow.commit.assert_called_once()
+
+    def test_should_replace_installments_when_there_are_several(self):
+        # Arrange
+        uow = _make_uow(installments_count=3)
+        use_case = UpdatePurchaseUseCase(uow)
+
+        # Act
+        use_case.execute(UpdatePurchaseCommand(
+            purchase_id=1, user_id=1, total_amount=Decimal("4500.00")
+        ))
+
+        # Assert
+        uow.installments.update_by_purchase_and_number.assert_not_called()
+        uow.installments.delete_by_purchase_id.assert_called_once_with(1)
+        assert len(uow.installments.save_all.call_args[0][0]) == 3
+
+    def test_should_round_the_converted_amount_to_cents(self):
+        # Arrange
+        uow = _make_uow()
+        uow.exchange_rates.find_by_id.return_value = ExchangeRate(
+            id=7,
+            date=date(2025, 1, 15),
+            from_currency=Currency.USD,
+            to_currency=Currency.ARS,
+            rate=Decimal("1234.5678"),
+            rate_type=ExchangeRateType.OFFICIAL,
+            created_at=datetime(2025, 1, 15),
+            created_by_user_id=1,
+        )
+        use_case = UpdatePurchaseUseCase(uow)
+
+        # Act
+        use_case.execute(UpdatePurchaseCommand(purchase_id=1, user_id=1, exchange_rate_id=7))
+
+        # Assert
+        [saved] = uow.purchases.save.call_args[0]
+        assert saved.total_amount.secondary_amount == Decimal("2.43")
+        assert saved.total_amount.secondary_amount.as_tuple().exponent == -2
+        assert saved.exchange_rate_id == 7
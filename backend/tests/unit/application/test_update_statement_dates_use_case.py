@@ -4,6 +4,7 @@ from unittest.mock import Mock
 
 import pytest
 
+from app.application.exceptions.application_exceptions import ConcurrentUpdateError
 from app.application.use_cases.update_statement_dates_use_case import (
     UpdateStatementDatesUseCase,
 )
@@ -82,7 +83,7 @@ def test_preserves_included_installments_on_date_change(uow_mock):
         closing_date=date(2025, 10, 2),
         due_date=date(2025, 11, 10),
     )
-    uow_mock.monthly_statements.save.return_value = saved_statement
+    uow_mock.monthly_statements.save_if_unchanged.return_value = saved_statement
 
     credit_card = make_credit_card()
     uow_mock.credit_cards.find_by_id.return_value = credit_card
@@ -92,10 +93,7 @@ def test_preserves_included_installments_on_date_change(uow_mock):
 
     # Installment that belonged to old period (202509)
     inst = make_installment(id=101, purchase_id=purchase.id, billing_period="202509")
-    uow_mock.installments.find_by_purchase_id.return_value = [inst]
-
-    # Make sure find_by_id returns the same installment when reassigned
-    uow_mock.installments.find_by_id.return_value = inst
+    uow_mock.installments.find_by_purchase_ids.return_value = [inst]
 
     use_case = UpdateStatementDatesUseCase(
         statement_repository=uow_mock.monthly_statements,
@@ -113,10 +111,50 @@ def test_preserves_included_installments_on_date_change(uow_mock):
     result = use_case.execute(statement_id=10, user_id=1, input_dto=input_dto)
 
     # Verify statement saved
-    uow_mock.monthly_statements.save.assert_called()
+    uow_mock.monthly_statements.save_if_unchanged.assert_called()
+
+    # Verify installments are moved to the new period in one bulk update
+    uow_mock.installments.bulk_update_billing_period.assert_called_once()
+    assert uow_mock.installments.bulk_update_billing_period.call_args.args[1:] == ("202509", "202510")
+
+    # Verify the included installment is re-assigned to the updated statement in one bulk update,
+    # guarded to those unassigned or already on this statement
+    uow_mock.installments.bulk_assign_statement.assert_called_once_with([101], saved_statement.id, 10)
+    uow_mock.installments.save.assert_not_called()
+
+
+def test_raises_concurrent_update_error_when_statement_changed_since_read(uow_mock):
+    # Setup
+    statement = MonthlyStatement(
+        id=10,
+        credit_card_id=2,
+        start_date=date(2025, 8, 31),
+        closing_date=date(2025, 9, 30),
+        due_date=date(2025, 10, 10),
+        row_version=3,
+    )
+    uow_mock.monthly_statements.find_by_id.return_value = statement
+    uow_mock.monthly_statements.save_if_unchanged.return_value = None
+    uow_mock.credit_cards.find_by_id.return_value = make_credit_card()
+    uow_mock.purchases.find_by_user_id.return_value = []
+    uow_mock.installments.find_by_purchase_ids.return_value = []
+
+    use_case = UpdateStatementDatesUseCase(
+        statement_repository=uow_mock.monthly_statements,
+        credit_card_repository=uow_mock.credit_cards,
+        purchase_repository=uow_mock.purchases,
+        installment_repository=uow_mock.installments,
+    )
+
+    input_dto = Mock()
+    input_dto.start_date = None
+    input_dto.closing_date = date(2025, 10, 2)
+    input_dto.due_date = date(2025, 10, 10)
+
+    # Execute / Verify: the write is conditioned on the version that was read
+    with pytest.raises(ConcurrentUpdateError):
+        use_case.execute(statement_id=10, user_id=1, input_dto=input_dto)
 
-    # Verify at least one save of installment happened with manually_assigned_statement_id equal to statement id
-    saves = [call.args[0] for call in uow_mock.installments.save.call_args_list]
-    assert any(s.manually_assigned_statement_id == saved_statement.id for s in saves), (
-        "Expected at least one installment to be saved with manually_assigned_statement_id set to the updated statement id"
-    )
\ No newline at end of file
+    [updated] = uow_mock.monthly_statements.save_if_unchanged.call_args.args
+    assert updated.row_version == 3
+    uow_mock.installments.bulk_update_billing_period.assert_not_called()
@@ -70,7 +70,7 @@ def test_does_not_steal_installments_from_next_statement():
 
     uow_mock = Mock()
     uow_mock.monthly_statements.find_by_id.return_value = old_statement
-    uow_mock.monthly_statements.save.return_value = MonthlyStatement(
+    uow_mock.monthly_statements.save_if_unchanged.return_value = MonthlyStatement(
         id=10,
         credit_card_id=2,
         start_date=date(2025, 11, 1),
@@ -92,11 +92,10 @@ def test_does_not_steal_installments_from_next_statement():
     inst_old = make_installment(id=101, purchase_id=1, billing_period="202511")
     inst_next = make_installment(id=102, purchase_id=2, billing_period="202512", manual_id=11)
 
-    def find_by_purchase_id(pid):
-        return [inst_old] if pid == 1 else [inst_next]
+    def find_by_purchase_ids(pids):
+        return [i for i in (inst_old, inst_next) if i.purchase_id in pids]
 
-    uow_mock.installments.find_by_purchase_id.side_effect = find_by_purchase_id
-    uow_mock.installments.find_by_id.side_effect = lambda i: inst_old if i == 101 else inst_next
+    uow_mock.installments.find_by_purchase_ids.side_effect = find_by_purchase_ids
 
     use_case = UpdateStatementDatesUseCase(
         statement_repository=uow_mock.monthly_statements,
@@ -113,9 +112,9 @@ def test_does_not_steal_installments_from_next_statement():
 
     result = use_case.execute(statement_id=10, user_id=1, input_dto=input_dto)
 
-    # Verify that the installment that originally belonged to next statement keeps its manual assignment
-    assert inst_next.manually_assigned_statement_id == 11
+    # Only unassigned installments go to the next statement, so the manual assignment to it is kept
+    assigns = [call.args for call in uow_mock.installments.bulk_assign_statement.call_args_list]
+    assert ([102], 11) in assigns
 
     # Also make sure that the old installment was preserved and assigned to the updated statement
-    saves = [call.args[0] for call in uow_mock.installments.save.call_args_list]
-    assert any(s.manually_assigned_statement_id == 10 for s in saves)
+    assert ([101], 10, 10) in assigns
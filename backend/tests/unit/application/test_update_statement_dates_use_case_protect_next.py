@@ -70,7 +70,7 @@ def test_protects_next_statement_unassigned_installments_before_change():
     uow_mock = Mock()
     uow_mock.monthly_statements.find_by_id.return_value = current
     uow_mock.monthly_statements.find_by_credit_card_id.return_value = [current, nxt]
-    uow_mock.monthly_statements.save.return_value = MonthlyStatement(
+    uow_mock.monthly_statements.save_if_unchanged.return_value = MonthlyStatement(
         id=20,
         credit_card_id=2,
         start_date=date(2025, 11, 1),
@@ -84,8 +84,7 @@ def test_protects_next_statement_unassigned_installments_before_change():
     uow_mock.purchases.find_by_user_id.return_value = [purchase_next]
 
     inst_next = make_installment(id=302, purchase_id=2, billing_period="202512", manual_id=None)
-    uow_mock.installments.find_by_purchase_id.return_value = [inst_next]
-    uow_mock.installments.find_by_id.return_value = inst_next
+    uow_mock.installments.find_by_purchase_ids.return_value = [inst_next]
 
     use_case = UpdateStatementDatesUseCase(
         statement_repository=uow_mock.monthly_statements,
@@ -101,6 +100,5 @@ def test_protects_next_statement_unassigned_installments_before_change():
 
     result = use_case.execute(statement_id=20, user_id=1, input_dto=input_dto)
 
-    # The installer in next statement should be protected (assigned to next statement id)
-    saves = [call.args[0] for call in uow_mock.installments.save.call_args_list]
-    assert any(s.manually_assigned_statement_id == 21 for s in saves)
+    # The installment in next statement should be protected (assigned to next statement id)
+    uow_mock.installments.bulk_assign_statement.assert_any_call([302], 21)
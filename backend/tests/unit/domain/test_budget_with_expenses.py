@@ -141,6 +141,82 @@ class TestBudgetWithExpensesCalculations:
         assert balance_1 == Money(5000, "ARS")
         assert balance_2 == Money(-5000, "ARS")
 
+    def test_paid_by_user_totals_should_group_expenses_by_payer(self):
+        budget = self._create_test_budget()
+        expenses = [
+            self._create_test_expense(1, 12500, "ARS", paid_by_user_id=1),
+            self._create_test_expense(2, 8000, "ARS", paid_by_user_id=1),
+            self._create_test_expense(3, 3800, "ARS", paid_by_user_id=2),
+        ]
+        aggregate = BudgetWithExpenses(
+            budget=budget,
+            expenses=expenses,
+            responsibilities={}
+        )
+
+        totals = aggregate.paid_by_user_totals()
+
+        assert totals == {1: Money(20500, "ARS"), 2: Money(3800, "ARS")}
+        assert totals[1] == aggregate.amount_paid_by(1)
+
+    def test_responsibility_totals_should_group_responsibilities_by_user(self):
+        budget = self._create_test_budget()
+        expenses = [
+            self._create_test_expense(1, 12500, "ARS"),
+            self._create_test_expense(2, 1000, "ARS"),
+        ]
+        responsibilities = {
+            1: [
+                BudgetExpenseResponsibility(
+                    id=1, budget_expense_id=1, user_id=1,
+                    percentage=Decimal("60"), responsible_amount=Money(7500, "ARS")
+                ),
+                BudgetExpenseResponsibility(
+                    id=2, budget_expense_id=1, user_id=2,
+                    percentage=Decimal("40"), responsible_amount=Money(5000, "ARS")
+                ),
+            ],
+            2: [
+                BudgetExpenseResponsibility(
+                    id=3, budget_expense_id=2, user_id=2,
+                    percentage=Decimal("100"), responsible_amount=Money(1000, "ARS")
+                ),
+            ],
+        }
+        aggregate = BudgetWithExpenses(
+            budget=budget,
+            expenses=expenses,
+            responsibilities=responsibilities
+        )
+
+        totals = aggregate.responsibility_totals()
+
+        assert totals == {1: Money(7500, "ARS"), 2: Money(6000, "ARS")}
+        assert totals[2] == aggregate.amount_responsible_for(2)
+
+    def test_balances_should_return_paid_responsible_and_balance_per_user(self):
+        budget = self._create_test_budget()
+        expenses = [self._create_test_expense(1, 12500, "ARS", paid_by_user_id=1)]
+        responsibilities = {
+            1: [
+                BudgetExpenseResponsibility(
+                    id=1, budget_expense_id=1, user_id=2,
+                    percentage=Decimal("100"), responsible_amount=Money(12500, "ARS")
+                ),
+            ]
+        }
+        aggregate = BudgetWithExpenses(
+            budget=budget,
+            expenses=expenses,
+            responsibilities=responsibilities
+        )
+
+        balances = aggregate.balances([1, 2, 3])
+
+        assert balances[1] == (Money(12500, "ARS"), Money(0, "ARS"), Money(12500, "ARS"))
+        assert balances[2] == (Money(0, "ARS"), Money(12500, "ARS"), Money(-12500, "ARS"))
+        assert balances[3] == (Money(0, "ARS"), Money(0, "ARS"), Money(0, "ARS"))
+
     def test_get_participants_should_include_creator_and_responsibility_users(self):
         budget = self._create_test_budget(created_by_user_id=1)
         expenses = [self._create_test_expense(1, 12500, "ARS")]
@@ -224,6 +300,39 @@ class TestBudgetWithExpensesCalculations:
         assert debts[0]["to_user_id"] == 1
         assert debts[0]["amount"] == Money(10000, "ARS")
 
+    def test_calculate_debt_summary_should_not_overpay_creditors(self):
+        budget = self._create_test_budget()
+        expenses = [
+            self._create_test_expense(1, 5000, "ARS", paid_by_user_id=1),
+            self._create_test_expense(2, 5000, "ARS", paid_by_user_id=2),
+        ]
+
+        def resp(resp_id, expense_id, user_id, amount):
+            return BudgetExpenseResponsibility(
+                id=resp_id, budget_expense_id=expense_id, user_id=user_id,
+                percentage=Decimal(amount) / Decimal("50"), responsible_amount=Money(amount, "ARS")
+            )
+
+        responsibilities = {
+            1: [resp(1, 1, 3, 3000), resp(2, 1, 4, 2000)],
+            2: [resp(3, 2, 2, 0), resp(4, 2, 3, 3000), resp(5, 2, 4, 2000)],
+        }
+        aggregate = BudgetWithExpenses(
+            budget=budget,
+            expenses=expenses,
+            responsibilities=responsibilities
+        )
+
+        debts = aggregate.calculate_debt_summary()
+
+        # Users 1 and 2 are owed 5000 each; user 3 owes 6000 and user 4 owes 4000
+        pairs = [(d["from_user_id"], d["to_user_id"], d["amount"]) for d in debts]
+        assert pairs == [
+            (3, 1, Money(5000, "ARS")),
+            (3, 2, Money(1000, "ARS")),
+            (4, 2, Money(4000, "ARS")),
+        ]
+
     def _create_test_budget(self, created_by_user_id: int = 1) -> MonthlyBudget:
         """Helper to create a test budget"""
         return MonthlyBudget(
@@ -0,0 +1,74 @@
+import pytest
+from decimal import Decimal
+from datetime import date, datetime
+from unittest.mock import Mock
+
+from app.domain.entities.exchange_rate import ExchangeRate
+from app.domain.exceptions.domain_exceptions import ExchangeRateNotFound
+from app.domain.services.currency_converter import CurrencyConverter
+from app.domain.value_objects.exchange_rate_type import ExchangeRateType
+from app.domain.value_objects.money import Currency
+
+
+@pytest.fixture
+def usd_ars_rate():
+    return ExchangeRate(
+        id=1,
+        date=date(2025, 1, 15),
+        from_currency=Currency.USD,
+        to_currency=Currency.ARS,
+        rate=Decimal("1000"),
+        rate_type=ExchangeRateType.OFFICIAL,
+        created_at=datetime(2025, 1, 15, 12, 0, 0),
+        created_by_user_id=1,
+    )
+
+
+class TestCurrencyConverter:
+    def test_same_currency_returns_amount_without_rate(self):
+        """Test that no rate lookup happens when currencies match."""
+        finder = Mock()
+        converter = CurrencyConverter(finder)
+
+        result = converter.convert(
+            Decimal("100"), Currency.ARS, Currency.ARS, date(2025, 1, 15)
+        )
+
+        assert result == (Decimal("100"), None)
+        finder.find_exchange_rate.assert_not_called()
+
+    def test_converts_usd_to_ars(self, usd_ars_rate):
+        """Test conversion using the rate found by the finder."""
+        finder = Mock()
+        finder.find_exchange_rate.return_value = usd_ars_rate
+        converter = CurrencyConverter(finder)
+
+        amount, rate = converter.convert(
+            Decimal("10"), Currency.USD, Currency.ARS, date(2025, 1, 15)
+        )
+
+        assert amount == Decimal("10000")
+        assert rate is usd_ars_rate
+
+    def test_reuses_rate_for_same_date_and_currencies(self, usd_ars_rate):
+        """Test that repeated conversions on the same date hit the finder once."""
+        finder = Mock()
+        finder.find_exchange_rate.return_value = usd_ars_rate
+        converter = CurrencyConverter(finder)
+
+        for amount in (Decimal("10"), Decimal("20"), Decimal("30")):
+            converter.convert(amount, Currency.USD, Currency.ARS, date(2025, 1, 15))
+        converter.convert(Decimal("10"), Currency.USD, Currency.ARS, date(2025, 1, 16))
+
+        assert finder.find_exchange_rate.call_count == 2
+
+    def test_raises_when_no_rate_found(self):
+        """Test that a missing rate raises ExchangeRateNotFound."""
+        finder = Mock()
+        finder.find_exchange_rate.return_value = None
+        converter = CurrencyConverter(finder)
+
+        with pytest.raises(ExchangeRateNotFound):
+            converter.convert(
+                Decimal("10"), Currency.USD, Currency.ARS, date(2025, 1, 15)
+            )
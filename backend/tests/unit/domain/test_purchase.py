@@ -604,3 +604,47 @@ class TestPurchaseEntity:
         )
         with pytest.raises(InvalidMoneyOperation):
             purchase.get_amount_in_currency(Currency.USD)
+
+    def test_has_currency_for_primary_and_secondary(self):
+        """
+        GIVEN: Purchase with dual currency
+        WHEN: Checking available currencies
+        THEN: Should return True for both primary and secondary currencies
+        """
+        purchase = Purchase(
+            id=1,
+            user_id=10,
+            payment_method_id=5,
+            category_id=3,
+            purchase_date=date(2025, 1, 15),
+            description="Dual currency purchase",
+            total_amount=DualMoney(
+                primary_amount=Decimal("1000.00"),
+                primary_currency=Currency.ARS,
+                secondary_amount=Decimal("50.00"),
+                secondary_currency=Currency.USD,
+                exchange_rate=Decimal("20.00")
+            ),
+            installments_count=1,
+        )
+        assert purchase.has_currency(Currency.ARS)
+        assert purchase.has_currency(Currency.USD)
+
+    def test_has_currency_false_when_unavailable(self):
+        """
+        GIVEN: Purchase with single currency
+        WHEN: Checking a different currency
+        THEN: Should return False
+        """
+        purchase = Purchase(
+            id=1,
+            user_id=10,
+            payment_method_id=5,
+            category_id=3,
+            purchase_date=date(2025, 1, 15),
+            description="Single currency purchase",
+            total_amount=DualMoney(primary_amount=Decimal("1000.00"), primary_currency=Currency.ARS),
+            installments_count=1,
+        )
+        assert purchase.has_currency(Currency.ARS)
+        assert not purchase.has_currency(Currency.USD)
@@ -88,6 +88,24 @@ class TestResponsibilityCalculatorEqualSplit:
         total_amount = sum(r.responsible_amount.amount for r in responsibilities)
         assert total_amount == Decimal("100")
 
+    def test_calculate_proportional_split_reports_single_user_without_income_or_wage(self):
+        calculator = ResponsibilityCalculator()
+        users = [
+            self._create_user(1),
+            User(id=2, name="User 2", email="user2@example.com", wage=Money(0, "ARS")),
+        ]
+
+        with pytest.raises(InvalidCalculation, match="User 2 has no monthly income and no wage defined"):
+            calculator.calculate_responsibilities(
+                expense_id=1,
+                budget_id=1,
+                amount=Money(10000, "ARS"),
+                split_type=SplitType.PROPORTIONAL,
+                participants=users,
+                period=Period(2026, 1),
+                incomes=[]
+            )
+
     def _create_user(self, user_id: int) -> User:
         """Helper to create test user"""
         return User(
@@ -192,6 +210,25 @@ class TestResponsibilityCalculatorProportionalSplit:
         assert resp1.percentage == Decimal("50")
         assert resp2.percentage == Decimal("50")
 
+    def test_calculate_proportional_split_reports_all_users_without_income_or_wage(self):
+        calculator = ResponsibilityCalculator()
+        users = [
+            self._create_user(1),
+            User(id=2, name="User 2", email="user2@example.com", wage=Money(0, "ARS")),
+            User(id=3, name="User 3", email="user3@example.com", wage=Money(0, "ARS")),
+        ]
+
+        with pytest.raises(InvalidCalculation, match="Users 2, 3 have no monthly income and no wage defined"):
+            calculator.calculate_responsibilities(
+                expense_id=1,
+                budget_id=1,
+                amount=Money(10000, "ARS"),
+                split_type=SplitType.PROPORTIONAL,
+                participants=users,
+                period=Period(2026, 1),
+                incomes=[]
+            )
+
     def _create_user(self, user_id: int) -> User:
         """Helper to create test user"""
         return User(
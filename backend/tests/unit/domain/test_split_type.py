@@ -16,4 +16,11 @@ class TestSplitType:
         assert SplitType.EQUAL == "equal"
         assert SplitType.PROPORTIONAL == "proportional"
         assert SplitType.CUSTOM == "custom"
-        assert SplitType.FULL_SINGLE == "full_single"
\ No newline at end of file
+        assert SplitType.FULL_SINGLE == "full_single"
+
+    def test_should_look_up_split_type_by_value(self):
+        assert SplitType.from_value("full_single") is SplitType.FULL_SINGLE
+        assert SplitType.from_value("half") is None
+
+    def test_should_list_values_for_error_messages(self):
+        assert SplitType.values_display() == "equal, proportional, custom, full_single"